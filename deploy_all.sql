@@ -22,6 +22,7 @@
  *   - Creates dedicated XSMALL warehouse for AI processing
  *   - Creates internal stage for document files (PDF, DOCX, etc.)
  *   - Copies sample PDFs into the internal stage
+ *   - Creates bundle stage and procedure for bulk (zipped) document uploads
  *   - Creates Dynamic Table pipeline (catalog, parse, translate, enrich, insights)
  *   - Deploys Streamlit dashboard for document processing UI
  *
@@ -187,8 +188,20 @@ CREATE STAGE IF NOT EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE
     DIRECTORY = (ENABLE = TRUE)
     COMMENT = 'DEMO: swiftclaw - Internal stage for document files | Expires: 2026-02-20 | Author: SE Community';
 
+CREATE STAGE IF NOT EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.EXPORT_STAGE
+    ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
+    DIRECTORY = (ENABLE = TRUE)
+    COMMENT = 'DEMO: swiftclaw - Unload target for dashboard exports (CSV/Parquet) | Expires: 2026-02-20 | Author: SE Community';
+
+CREATE STAGE IF NOT EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.BUNDLE_STAGE
+    ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
+    DIRECTORY = (ENABLE = TRUE)
+    COMMENT = 'DEMO: swiftclaw - Zipped document upload bundles | Expires: 2026-02-20 | Author: SE Community';
+
 -- Grant stage read/write (now guaranteed to exist)
 GRANT READ, WRITE ON STAGE SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE TO ROLE SFE_DEMO_ROLE;
+GRANT READ, WRITE ON STAGE SNOWFLAKE_EXAMPLE.SWIFTCLAW.EXPORT_STAGE TO ROLE SFE_DEMO_ROLE;
+GRANT READ, WRITE ON STAGE SNOWFLAKE_EXAMPLE.SWIFTCLAW.BUNDLE_STAGE TO ROLE SFE_DEMO_ROLE;
 
 -- ============================================================================
 -- SECTION 6b: COPY SAMPLE PDFs FROM GIT REPO TO INTERNAL STAGE
@@ -218,12 +231,22 @@ LS @SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE/ PATTERN = '.*\.pdf';
 -- Refresh stage directory table for catalog ingestion
 ALTER STAGE SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE REFRESH;
 
+-- ============================================================================
+-- SECTION 6c: BULK INGESTION (from Git Repository)
+-- ============================================================================
+-- Creates UNPACK_DOCUMENT_BUNDLES, which expands zipped upload bundles from
+-- BUNDLE_STAGE onto DOCUMENT_STAGE (for large generated corpora)
+
+EXECUTE IMMEDIATE FROM @SNOWFLAKE_EXAMPLE.GIT_REPOS.sfe_swiftclaw_repo/branches/main/sql/02_ingestion/01_create_bundle_ingestion.sql;
+
 -- ============================================================================
 -- SECTION 7: DYNAMIC TABLE PIPELINE (from Git Repository)
 -- ============================================================================
 -- This script creates the catalog table, Dynamic Tables (all INCREMENTAL),
 -- and monitoring view. All AI processing uses Dynamic Tables for automated
--- orchestration. New documents appear automatically once uploaded to the stage.
+-- orchestration. The catalog follows a stream on the stage's directory table:
+-- a triggered task applies new, changed and removed files once the directory
+-- is refreshed (ALTER STAGE ... REFRESH), and does nothing while it is idle.
 
 EXECUTE IMMEDIATE FROM @SNOWFLAKE_EXAMPLE.GIT_REPOS.sfe_swiftclaw_repo/branches/main/sql/03_ai_processing/01_create_dynamic_tables.sql;
 
@@ -257,6 +280,9 @@ GRANT SELECT ON ALL TABLES IN SCHEMA SNOWFLAKE_EXAMPLE.SWIFTCLAW TO ROLE SFE_DEM
 -- Grant view access
 GRANT SELECT ON ALL VIEWS IN SCHEMA SNOWFLAKE_EXAMPLE.SWIFTCLAW TO ROLE SFE_DEMO_ROLE;
 
+-- Grant bulk ingestion procedure usage
+GRANT USAGE ON PROCEDURE SNOWFLAKE_EXAMPLE.SWIFTCLAW.UNPACK_DOCUMENT_BUNDLES() TO ROLE SFE_DEMO_ROLE;
+
 -- Grant Streamlit usage
 GRANT USAGE ON STREAMLIT SNOWFLAKE_EXAMPLE.SWIFTCLAW.SFE_DOCUMENT_DASHBOARD TO ROLE SFE_DEMO_ROLE;
 
@@ -274,9 +300,28 @@ GRANT ROLE SFE_DEMO_ROLE TO ROLE SYSADMIN;
  *   - Git Repository: sfe_swiftclaw_repo
  *   - Schema: SWIFTCLAW
  *   - Stage: DOCUMENT_STAGE (for file uploads)
+ *   - Stage: EXPORT_STAGE (for large dashboard exports)
+ *   - Stage: BUNDLE_STAGE (for zipped bulk uploads)
+ *   - Procedure: UNPACK_DOCUMENT_BUNDLES (expands bundles onto DOCUMENT_STAGE)
+ *   - Stream: DOCUMENT_STAGE_STREAM (stage directory changes)
+ *   - Task: REFRESH_DOCUMENT_CATALOG_TASK (triggered by the stream)
+ *   - Table: DOCUMENT_CONTENT_REGISTRY (distinct file contents by MD5)
+ *   - Dynamic Tables: AI_PARSE_CACHE, AI_TRANSLATE_CACHE, AI_ENRICH_CACHE
+ *     (AI results computed once per content hash), AI_FILE_EXTRACT_CACHE
+ *     (file-based extraction where text extraction failed)
+ *   - Parsing: PARSE_REGISTERED_CONTENT_TASK (task triggered by registry
+ *     and IMAGE_EXTRACTION_POLICY streams) writes AI_PARSE_RESULTS (page
+ *     text and image ids) and STG_DOCUMENT_IMAGES (extracted images) (tables);
+ *     STG_PARSED_PAGES (per-page cost breakdown, dynamic table)
+ *   - Translation memory: STG_DOCUMENT_SEGMENTS (dynamic table),
+ *     TRANSLATION_MEMORY (table), REFRESH_TRANSLATION_MEMORY_TASK (task)
  *   - Dynamic Tables: STG_PARSED_DOCUMENTS, STG_TRANSLATED_CONTENT,
  *     STG_ENRICHED_DOCUMENTS (AI_EXTRACT + AI_CLASSIFY), FCT_DOCUMENT_INSIGHTS
- *   - Views: RAW_DOCUMENT_CATALOG, V_PROCESSING_METRICS
+ *   - Dynamic Table: FCT_PIPELINE_METRICS (metrics per stage and document type)
+ *   - Stage timestamps: DOCUMENT_STAGE_EVENTS (table), RECORD_STAGE_TIMESTAMPS_TASK
+ *     (task triggered by streams on the stage tables)
+ *   - Views: RAW_DOCUMENT_CATALOG, V_PROCESSING_METRICS,
+ *     V_DOCUMENT_STAGE_TIMESTAMPS, V_PIPELINE_LATENCY (p50/p95/p99)
  *   - All Dynamic Tables use REFRESH_MODE = INCREMENTAL for cost optimization
  *   - Streamlit: SFE_DOCUMENT_DASHBOARD
  *   - Role: SFE_DEMO_ROLE
@@ -284,6 +329,9 @@ GRANT ROLE SFE_DEMO_ROLE TO ROLE SYSADMIN;
  * Next Steps:
  *   1. Upload documents to the stage (optional):
  *      PUT file:///*.pdf @SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE AUTO_COMPRESS=FALSE;
+ *      ALTER STAGE SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE REFRESH;
+ *      Large corpora: PUT zip bundles to BUNDLE_STAGE, then
+ *      CALL SWIFTCLAW.UNPACK_DOCUMENT_BUNDLES();
  *   2. Switch role: USE ROLE SFE_DEMO_ROLE;
  *   3. Open Streamlit: Home -> Streamlit -> SFE_DOCUMENT_DASHBOARD
  *   4. View insights: SELECT * FROM SWIFTCLAW.FCT_DOCUMENT_INSIGHTS LIMIT 10;
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Streamlit Dashboard Offline
+
+Renders streamlit/streamlit_app.py headlessly (Streamlit AppTest) against the
+local SQLite stand-in filled with a synthetic insights corpus, and reports
+for each filter combination:
+
+- Cold render time (shared query cache cleared)
+- Warm render time (median of repeated reruns)
+- Per-section query time and query count on the cold render
+- Peak Python memory during a cold render (tracemalloc)
+
+Run it before deploying dashboard changes and compare against the previous
+results file to catch regressions. Absolute numbers reflect this machine and
+SQLite, not warehouse latency; compare runs made on the same machine.
+
+Usage:
+    python scripts/benchmark_dashboard.py --rows 1000000
+    python scripts/benchmark_dashboard.py --rows 10000 --warm-runs 5 --output results.json
+
+Author: SE Community
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit")
+APP_FILE = os.path.join(APP_DIR, "streamlit_app.py")
+sys.path.insert(0, APP_DIR)
+
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from local_session import build_store  # noqa: E402
+from query_metrics import logger as query_logger  # noqa: E402
+from session_provider import LOCAL_DB_ENV  # noqa: E402
+
+MIN_ROWS = 10_000
+MAX_ROWS = 10_000_000
+
+# Sidebar widget values per scenario; omitted widgets keep their defaults
+FILTER_COMBINATIONS = {
+    "default": {},
+    "invoices_only": {"Document Type": ["INVOICE"]},
+    "high_priority": {"Priority Level": ["HIGH"]},
+    "review_only": {"Show Manual Review Queue Only": True},
+    "last_30_days": {"Document Date": "Last 30 days"},
+    "last_365_days_contracts": {"Document Date": "Last 365 days", "Document Type": ["CONTRACT"]},
+}
+
+
+class QueryRecordCollector(logging.Handler):
+    """Collects the dashboard's structured per-query log lines."""
+
+    def __init__(self):
+        super().__init__(level=logging.INFO)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(json.loads(record.getMessage()))
+
+
+def apply_filters(app: AppTest, widget_values: dict) -> None:
+    widgets = list(app.multiselect) + list(app.checkbox) + list(app.selectbox)
+    for label, value in widget_values.items():
+        matches = [widget for widget in widgets if widget.label == label]
+        if not matches:
+            raise ValueError(f"No sidebar widget labelled {label!r}")
+        matches[0].set_value(value)
+
+
+def timed_run(app: AppTest) -> float:
+    started = time.perf_counter()
+    app.run()
+    elapsed = time.perf_counter() - started
+    if app.exception:
+        raise RuntimeError(f"Dashboard raised: {app.exception[0].value}")
+    return elapsed
+
+
+def cold_app(widget_values: dict, timeout: float) -> AppTest:
+    """App with the scenario's filters applied and an empty shared query cache."""
+    app = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    app.run()
+    apply_filters(app, widget_values)
+    # Also releases the app's query executor, which shuts its worker threads down
+    st.cache_resource.clear()
+    # The insights snapshot would otherwise survive into the "cold" render
+    if "insights_snapshot" in app.session_state:
+        del app.session_state["insights_snapshot"]
+    return app
+
+
+def benchmark_scenario(widget_values: dict, warm_runs: int, timeout: float,
+                       collector: QueryRecordCollector) -> dict:
+    app = cold_app(widget_values, timeout)
+    collector.records.clear()
+    cold_seconds = timed_run(app)
+
+    section_ms = defaultdict(float)
+    section_queries = defaultdict(int)
+    for record in collector.records:
+        if record["cache"] == "miss":
+            section_ms[record["section"]] += record["wall_ms"]
+            section_queries[record["section"]] += 1
+
+    warm_seconds = [timed_run(app) for _ in range(warm_runs)]
+
+    # Separate cold render for memory: tracemalloc slows execution
+    app = cold_app(widget_values, timeout)
+    tracemalloc.start()
+    try:
+        timed_run(app)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "cold_ms": round(cold_seconds * 1000, 1),
+        "warm_ms": round(statistics.median(warm_seconds) * 1000, 1) if warm_seconds else None,
+        "section_query_ms": {name: round(ms, 1) for name, ms in sorted(section_ms.items())},
+        "section_queries": dict(sorted(section_queries.items())),
+        "peak_memory_mb": round(peak_bytes / 1024 / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard against a synthetic local store")
+    parser.add_argument("--rows", type=int, default=1_000_000,
+                        help=f"Synthetic insight rows ({MIN_ROWS:,}-{MAX_ROWS:,})")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic corpus")
+    parser.add_argument("--db", help="Store path; reused if it exists (default: temporary file)")
+    parser.add_argument("--warm-runs", type=int, default=3, help="Warm reruns per scenario")
+    parser.add_argument("--scenario", action="append", choices=sorted(FILTER_COMBINATIONS),
+                        help="Run only these filter combinations (repeatable)")
+    parser.add_argument("--timeout", type=float, default=600, help="Per-render timeout in seconds")
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    args = parser.parse_args()
+
+    if not MIN_ROWS <= args.rows <= MAX_ROWS:
+        parser.error(f"--rows must be between {MIN_ROWS:,} and {MAX_ROWS:,}")
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix="swiftclaw_bench_"), "insights.db")
+    if not os.path.exists(db_path):
+        print(f"🏗️  Building synthetic store: {args.rows:,} rows -> {db_path}")
+        started = time.perf_counter()
+        build_store(db_path, args.rows, seed=args.seed)
+        print(f"   ✓ Built in {time.perf_counter() - started:.1f}s")
+    else:
+        print(f"♻️  Reusing store: {db_path}")
+
+    os.environ[LOCAL_DB_ENV] = db_path
+    collector = QueryRecordCollector()
+    query_logger.addHandler(collector)
+    query_logger.setLevel(logging.INFO)
+    query_logger.propagate = False
+
+    results = {}
+    for name in args.scenario or FILTER_COMBINATIONS:
+        print(f"\n⏱️  {name}")
+        result = benchmark_scenario(FILTER_COMBINATIONS[name], args.warm_runs, args.timeout, collector)
+        results[name] = result
+        print(f"   cold {result['cold_ms']:>9,.1f} ms | warm {result['warm_ms'] or 0:>7,.1f} ms"
+              f" | peak {result['peak_memory_mb']:,.1f} MB")
+        for section, ms in result["section_query_ms"].items():
+            print(f"     {section:<20} {ms:>9,.1f} ms  ({result['section_queries'][section]} queries)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"rows": args.rows, "seed": args.seed, "scenarios": results}, handle, indent=2)
+        print(f"\n📄 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark Sample PDF Rendering
+
+Compares the two rendering paths of scripts/generate_sample_pdfs.py for each
+document type and language:
+
+- fpdf2: full layout and render per document (render_direct)
+- template: stamp fields into the compiled (type, language) template
+
+Both paths render the same field values in memory; nothing is written to
+disk, so the numbers isolate rendering cost from storage. Before timing, the
+output of both paths is compared to confirm the template matches fpdf2:
+content streams must be identical for built-in fonts, and text positions
+for embedded fonts (whose subset glyph codes differ between the paths).
+Average file size per path is reported alongside throughput.
+
+Usage:
+    python scripts/benchmark_pdf_generation.py
+    python scripts/benchmark_pdf_generation.py --docs 2000 --languages en,de
+    python scripts/benchmark_pdf_generation.py --languages en,ru,zh --font-dir ~/fonts
+
+Author: SE Community
+"""
+
+import argparse
+import random
+import re
+import time
+import zlib
+
+from generate_sample_pdfs import (
+    DOCUMENT_KINDS, FONT_DIR, SUPPORTED_LANGUAGES, UNICODE_FONTS,
+    compiled_template, render_direct, set_font_dir, unicode_font_files,
+)
+
+_STREAM = re.compile(rb"stream\n(.*?)\nendstream", re.DOTALL)
+_TEXT_POSITION = re.compile(rb"BT ([-\d.]+ [-\d.]+) Td")
+
+
+def content_streams(pdf_bytes: bytes) -> list:
+    """Decompressed content streams, for comparing output across render paths."""
+    streams = []
+    for stream in _STREAM.findall(pdf_bytes):
+        try:
+            stream = zlib.decompress(stream)
+        except zlib.error:
+            pass
+        streams.append(stream)
+    return streams
+
+
+def text_positions(pdf_bytes: bytes) -> list:
+    """Where each text-show op starts, for outputs whose glyph encoding differs."""
+    return [position for stream in content_streams(pdf_bytes) for position in _TEXT_POSITION.findall(stream)]
+
+
+def same_output(lang: str, stamped: bytes, direct: bytes) -> bool:
+    if lang in UNICODE_FONTS:
+        return text_positions(stamped) == text_positions(direct)
+    return content_streams(stamped) == content_streams(direct)
+
+
+def docs_per_second(render, fields: list) -> tuple:
+    """(docs/sec, average KB) for rendering every field set."""
+    size = 0
+    started = time.perf_counter()
+    for values in fields:
+        size += len(render(values))
+    return len(fields) / (time.perf_counter() - started), size / len(fields) / 1024
+
+
+def available_languages() -> list:
+    """Languages that can render here: built-in fonts, or an embedded font found in the font directory."""
+    languages = []
+    for lang in SUPPORTED_LANGUAGES:
+        try:
+            if lang in UNICODE_FONTS:
+                unicode_font_files(lang)
+            languages.append(lang)
+        except FileNotFoundError:
+            pass
+    return languages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fpdf2 and template rendering throughput")
+    parser.add_argument("--docs", type=int, default=500, help="Documents rendered per path and (type, language)")
+    parser.add_argument("--languages",
+                        help="Comma-separated language codes (default: every language with a font available)")
+    parser.add_argument("--font-dir", default=FONT_DIR, help="Fonts for embedded-font languages")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for field values")
+    args = parser.parse_args()
+
+    set_font_dir(args.font_dir)
+    if args.languages:
+        languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+    else:
+        languages = available_languages()
+    rng = random.Random(args.seed)
+
+    print(f"{'type':<10}{'lang':<6}{'fpdf2 docs/s':>14}{'template docs/s':>17}{'speedup':>10}"
+          f"{'fpdf2 KB':>10}{'template KB':>13}")
+    for kind, (_, build_fields, _) in DOCUMENT_KINDS.items():
+        for lang in languages:
+            fields = [build_fields(lang, number, rng)[0] for number in range(1, args.docs + 1)]
+            template = compiled_template(kind, lang)
+
+            if not same_output(lang, template.stamp(fields[0]), render_direct(kind, lang, fields[0])):
+                raise SystemExit(f"❌ Template output differs from fpdf2 for {kind}/{lang}")
+
+            direct_rate, direct_kb = docs_per_second(lambda values: render_direct(kind, lang, values), fields)
+            template_rate, template_kb = docs_per_second(template.stamp, fields)
+            print(f"{kind:<10}{lang:<6}{direct_rate:>14,.0f}{template_rate:>17,.0f}"
+                  f"{template_rate / direct_rate:>9.1f}x{direct_kb:>10.1f}{template_kb:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
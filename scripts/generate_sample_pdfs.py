@@ -15,520 +15,1714 @@ Languages:
 - Spanish (es)
 - German (de)
 - Portuguese (pt)
-- Russian (ru)
-- Chinese (zh)
+- Russian (ru), Chinese (zh), Japanese (ja), Korean (ko): need a font file
+  in the font directory (--font-dir or $SWIFTCLAW_FONT_DIR, default ./fonts)
+
+Usage:
+    python scripts/generate_sample_pdfs.py
+        Generate the 18-document demo sample set into pdfs/generated
+
+    python scripts/generate_sample_pdfs.py --invoices 40000 --royalties 30000 \
+        --contracts 30000 --languages en=4,es=3,de=2,pt=1 --workers 8 \
+        --output-dir /tmp/swiftclaw_corpus
+        Large-corpus mode for pipeline load tests: renders across a process
+        pool into shard subdirectories, reports docs/sec, and on re-run skips
+        every file already written (resume after interruption)
+
+    python scripts/generate_sample_pdfs.py --invoices 1000 --seed 42 \
+        --manifest /tmp/swiftclaw_corpus/manifest.parquet
+        --seed makes the output byte-reproducible; --manifest records the
+        ground-truth fields of every file (.jsonl or .parquet) for scoring
+        AI_EXTRACT results against (works in either mode)
+
+    python scripts/generate_sample_pdfs.py --invoices 40000 --royalties 30000 \
+        --contracts 30000 --bundle-mb 256 --output-dir /tmp/swiftclaw_bundles
+        Render in memory into size-bounded zip bundles (each with its own
+        manifest) for bulk upload instead of one file per document
+
+    python scripts/generate_sample_pdfs.py --invoices 1000 \
+        --languages en=2,ru=1,zh=1 --font-dir ~/fonts
+        Embed the glyphs each document uses from its language's font; the
+        summary reports average file size (also relative to the Latin-script
+        documents) and render rate per language
+
+    python scripts/generate_sample_pdfs.py --invoices 3000 --contracts 1000 \
+        --pages 1=6,2=3,5=1 --images 2 --scanned 0.2 --seed 42 \
+        --manifest /tmp/swiftclaw_corpus/manifest.jsonl
+        Vary document size for parse-cost profiling: page-count weights (line
+        item tables and contract schedules run over several pages), raster
+        images per page, and a share of scanned-style documents; the manifest
+        records each file's actual page count, image count and size
 
 Author: SE Community
 """
 
 from fpdf import FPDF
-from datetime import datetime, timedelta
+from PIL import Image, ImageDraw
+from pdf_templates import CompiledTemplate, TemplateCache
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import NamedTuple
+import argparse
+import io
+import json
+import math
 import random
 import os
+import re
+import time
+import warnings
+import zipfile
 
 # Output directory
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "pdfs", "generated")
+PARTIAL_SUFFIX = ".part"
+
+# Fonts for scripts built-in Helvetica cannot render. They are not shipped
+# with the repo: put one family per language (e.g. Noto Sans, Noto Sans SC,
+# JP, KR) as .ttf or .otf files in the font directory. Families are tried
+# in order; "<Family>-Bold" and "<Family>-Italic" are used when present.
+FONT_DIR_ENV = "SWIFTCLAW_FONT_DIR"
+FONT_DIR = os.environ.get(FONT_DIR_ENV, os.path.join(os.path.dirname(os.path.dirname(__file__)), "fonts"))
+UNICODE_FONTS = {
+    "ru": ["NotoSans", "DejaVuSans"],
+    "zh": ["NotoSansSC", "NotoSansCJKsc"],
+    "ja": ["NotoSansJP", "NotoSansCJKjp"],
+    "ko": ["NotoSansKR", "NotoSansCJKkr"],
+}
+EMBEDDED_FAMILY = "DocumentFont"
+
+
+def set_font_dir(font_dir: str) -> None:
+    global FONT_DIR
+    FONT_DIR = font_dir
+
+
+def _font_file(family: str, suffixes: list) -> str:
+    for suffix in suffixes:
+        for extension in (".ttf", ".otf"):
+            path = os.path.join(FONT_DIR, family + suffix + extension)
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def unicode_font_files(lang: str) -> dict:
+    """Font files by style ("", "B", "I") for a language that needs an embedded font."""
+    for family in UNICODE_FONTS[lang]:
+        regular = _font_file(family, ["-Regular", ""])
+        if regular:
+            files = {"": regular}
+            for style, suffix in (("B", "-Bold"), ("I", "-Italic")):
+                path = _font_file(family, [suffix])
+                if path:
+                    files[style] = path
+            return files
+    raise FileNotFoundError(
+        f"No font for language '{lang}' in {FONT_DIR}: add one of "
+        f"{', '.join(family + '-Regular.ttf' for family in UNICODE_FONTS[lang])} "
+        f"or pass --font-dir"
+    )
+
+
+# Raster images for profiling parse cost: a strip of photos in the bottom
+# margin of each page, and for scanned-style pages a paper-grain background
+# with dust specks under slightly skewed content
+PAGE_IMAGE_SIZE = (20, 12)  # mm
+MAX_IMAGES_PER_PAGE = 8
+SCAN_SKEW_DEGREES = 0.8
+
+
+def _jpeg(image: Image.Image, quality: int) -> io.BytesIO:
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=quality)
+    return buffer
+
+
+def photo_image(rng=random) -> io.BytesIO:
+    """A small photo-like JPEG: colour gradient with random shapes."""
+    width, height = 200, 120
+    image = Image.composite(
+        Image.new("RGB", (width, height), tuple(rng.randrange(256) for _ in range(3))),
+        Image.new("RGB", (width, height), tuple(rng.randrange(256) for _ in range(3))),
+        Image.linear_gradient("L").resize((width, height)),
+    )
+    draw = ImageDraw.Draw(image)
+    for _ in range(rng.randint(3, 8)):
+        x, y = rng.randrange(width), rng.randrange(height)
+        box = (x, y, x + rng.randint(10, 80), y + rng.randint(10, 60))
+        shape = draw.ellipse if rng.random() < 0.5 else draw.rectangle
+        shape(box, fill=tuple(rng.randrange(256) for _ in range(3)))
+    return _jpeg(image, 75)
+
+
+def scan_background(rng=random) -> io.BytesIO:
+    """A full-page paper-grain JPEG with dust and toner specks (about 100 dpi)."""
+    width, height = 210, 297
+    grain = Image.frombytes("L", (width, height), rng.randbytes(width * height))
+    paper = grain.point(lambda value: 232 + value * 23 // 255).resize((width * 4, height * 4), Image.BILINEAR)
+    draw = ImageDraw.Draw(paper)
+    for _ in range(rng.randint(50, 200)):
+        x, y, radius = rng.randrange(paper.width), rng.randrange(paper.height), rng.choice([1, 1, 2, 3])
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=rng.randint(40, 160))
+    return _jpeg(paper, 60)
 
 
 class MultilingualPDF(FPDF):
-    """PDF class with Unicode support for multiple languages."""
+    """PDF class with Unicode support for multiple languages.
+
+    Latin-script languages use built-in Helvetica. Other scripts embed a
+    font from FONT_DIR, subset to the glyphs the document uses; compiled
+    templates subset the font once per layout and only trim that subset
+    per document.
+
+    ``images_per_page`` and ``scanned`` add raster images to every page,
+    drawn from ``rng``.
+    """
     
-    def __init__(self):
+    def __init__(self, lang: str = "en", images_per_page: int = 0, scanned: bool = False, rng=random):
         super().__init__()
-        # Use built-in fonts that support basic Latin characters
-        # For full Unicode (Russian, Chinese), we'd need to add custom fonts
         self.set_auto_page_break(auto=True, margin=15)
+        self.images_per_page = images_per_page
+        self.scanned = scanned
+        self._rng = rng
+        self.body_font = "Helvetica"
+        self._embedded_styles = set()
+        if lang in UNICODE_FONTS:
+            self.body_font = EMBEDDED_FAMILY
+            for style, path in unicode_font_files(lang).items():
+                self.add_font(EMBEDDED_FAMILY, style, path)
+                self._embedded_styles.add(style)
 
+    def set_font(self, family=None, style="", size=0):
+        # Embedded families often lack bold/italic files; fall back to regular
+        if family == EMBEDDED_FAMILY:
+            style = "".join(char for char in style.upper() if char not in "BI" or char in self._embedded_styles)
+        super().set_font(family, style, size)
 
-def generate_invoice(lang: str, invoice_num: int) -> str:
-    """Generate an invoice PDF in the specified language."""
-    
-    # Content templates by language
-    content = {
-        "en": {
-            "title": "INVOICE",
-            "invoice_number": "Invoice Number",
-            "date": "Date",
-            "due_date": "Due Date",
-            "bill_to": "Bill To",
-            "description": "Description",
-            "quantity": "Qty",
-            "unit_price": "Unit Price",
-            "total": "Total",
-            "subtotal": "Subtotal",
-            "tax": "Tax (8%)",
-            "grand_total": "Grand Total",
-            "payment_terms": "Payment Terms: Net 30",
-            "thank_you": "Thank you for your business!",
-            "company": "Acme Production Services",
-            "items": [
-                ("Video Production Services", 40, 150.00),
-                ("Post-Production Editing", 24, 125.00),
-                ("Sound Design & Mixing", 16, 175.00),
-                ("Color Grading", 8, 200.00),
-            ]
-        },
-        "es": {
-            "title": "FACTURA",
-            "invoice_number": "Numero de Factura",
-            "date": "Fecha",
-            "due_date": "Fecha de Vencimiento",
-            "bill_to": "Facturar A",
-            "description": "Descripcion",
-            "quantity": "Cant",
-            "unit_price": "Precio Unitario",
-            "total": "Total",
-            "subtotal": "Subtotal",
-            "tax": "Impuesto (8%)",
-            "grand_total": "Total General",
-            "payment_terms": "Terminos de Pago: 30 dias netos",
-            "thank_you": "Gracias por su negocio!",
-            "company": "Servicios de Produccion Acme",
-            "items": [
-                ("Servicios de Produccion de Video", 40, 150.00),
-                ("Edicion de Post-Produccion", 24, 125.00),
-                ("Diseno de Sonido y Mezcla", 16, 175.00),
-                ("Correccion de Color", 8, 200.00),
-            ]
-        },
-        "de": {
-            "title": "RECHNUNG",
-            "invoice_number": "Rechnungsnummer",
-            "date": "Datum",
-            "due_date": "Faelligkeitsdatum",
-            "bill_to": "Rechnung An",
-            "description": "Beschreibung",
-            "quantity": "Menge",
-            "unit_price": "Einzelpreis",
-            "total": "Gesamt",
-            "subtotal": "Zwischensumme",
-            "tax": "Steuer (8%)",
-            "grand_total": "Gesamtbetrag",
-            "payment_terms": "Zahlungsbedingungen: 30 Tage netto",
-            "thank_you": "Vielen Dank fuer Ihren Auftrag!",
-            "company": "Acme Produktionsdienstleistungen",
-            "items": [
-                ("Videoproduktionsdienste", 40, 150.00),
-                ("Postproduktionsbearbeitung", 24, 125.00),
-                ("Sounddesign und Mischung", 16, 175.00),
-                ("Farbkorrektur", 8, 200.00),
-            ]
-        },
-        "pt": {
-            "title": "FATURA",
-            "invoice_number": "Numero da Fatura",
-            "date": "Data",
-            "due_date": "Data de Vencimento",
-            "bill_to": "Cobrar De",
-            "description": "Descricao",
-            "quantity": "Qtd",
-            "unit_price": "Preco Unitario",
-            "total": "Total",
-            "subtotal": "Subtotal",
-            "tax": "Imposto (8%)",
-            "grand_total": "Total Geral",
-            "payment_terms": "Condicoes de Pagamento: 30 dias liquidos",
-            "thank_you": "Obrigado pelo seu negocio!",
-            "company": "Servicos de Producao Acme",
-            "items": [
-                ("Servicos de Producao de Video", 40, 150.00),
-                ("Edicao de Pos-Producao", 24, 125.00),
-                ("Design de Som e Mixagem", 16, 175.00),
-                ("Correcao de Cores", 8, 200.00),
-            ]
-        },
+    def header(self):
+        if not self.scanned:
+            return
+        self.image(scan_background(self._rng), x=0, y=0, w=self.w, h=self.h)
+        # Rotate the page content about the page centre, as a hand-fed scan would be
+        angle = math.radians(self._rng.uniform(-SCAN_SKEW_DEGREES, SCAN_SKEW_DEGREES))
+        cos, sin = math.cos(angle), math.sin(angle)
+        cx, cy = self.w_pt / 2, self.h_pt / 2
+        self._out(f"q {cos:.5f} {sin:.5f} {-sin:.5f} {cos:.5f} {cx - cos * cx + sin * cy:.2f} "
+                  f"{cy - sin * cx - cos * cy:.2f} cm")
+
+    def footer(self):
+        width, height = PAGE_IMAGE_SIZE
+        for i in range(self.images_per_page):
+            self.image(photo_image(self._rng), x=self.l_margin + i * (width + 3),
+                       y=self.h - height - 2, w=width, h=height)
+        if self.scanned:
+            self._out("Q")
+
+
+def save_pdf(data: bytes, output_dir: str, filename: str) -> str:
+    """Write the PDF under a temporary name, then rename it into place.
+
+    An interrupted run never leaves a truncated file under a final name, so
+    resuming can treat every existing PDF as complete.
+    """
+    filepath = os.path.join(output_dir, filename)
+    temp_path = filepath + PARTIAL_SUFFIX
+    with open(temp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(temp_path, filepath)
+    return filename
+
+
+# ============================================================================
+# DOCUMENT CONTENT
+# ============================================================================
+# Static text per language, built once at import. Only the fields returned by
+# the *_fields() builders change from one document to the next.
+
+INVOICE_CONTENT = {
+    "en": {
+        "title": "INVOICE",
+        "invoice_number": "Invoice Number",
+        "date": "Date",
+        "due_date": "Due Date",
+        "bill_to": "Bill To",
+        "description": "Description",
+        "quantity": "Qty",
+        "unit_price": "Unit Price",
+        "total": "Total",
+        "subtotal": "Subtotal",
+        "tax": "Tax (8%)",
+        "grand_total": "Grand Total",
+        "payment_terms": "Payment Terms: Net 30",
+        "thank_you": "Thank you for your business!",
+        "company": "Acme Production Services",
+        "items": [
+            ("Video Production Services", 40, 150.00),
+            ("Post-Production Editing", 24, 125.00),
+            ("Sound Design & Mixing", 16, 175.00),
+            ("Color Grading", 8, 200.00),
+        ]
+    },
+    "es": {
+        "title": "FACTURA",
+        "invoice_number": "Numero de Factura",
+        "date": "Fecha",
+        "due_date": "Fecha de Vencimiento",
+        "bill_to": "Facturar A",
+        "description": "Descripcion",
+        "quantity": "Cant",
+        "unit_price": "Precio Unitario",
+        "total": "Total",
+        "subtotal": "Subtotal",
+        "tax": "Impuesto (8%)",
+        "grand_total": "Total General",
+        "payment_terms": "Terminos de Pago: 30 dias netos",
+        "thank_you": "Gracias por su negocio!",
+        "company": "Servicios de Produccion Acme",
+        "items": [
+            ("Servicios de Produccion de Video", 40, 150.00),
+            ("Edicion de Post-Produccion", 24, 125.00),
+            ("Diseno de Sonido y Mezcla", 16, 175.00),
+            ("Correccion de Color", 8, 200.00),
+        ]
+    },
+    "de": {
+        "title": "RECHNUNG",
+        "invoice_number": "Rechnungsnummer",
+        "date": "Datum",
+        "due_date": "Faelligkeitsdatum",
+        "bill_to": "Rechnung An",
+        "description": "Beschreibung",
+        "quantity": "Menge",
+        "unit_price": "Einzelpreis",
+        "total": "Gesamt",
+        "subtotal": "Zwischensumme",
+        "tax": "Steuer (8%)",
+        "grand_total": "Gesamtbetrag",
+        "payment_terms": "Zahlungsbedingungen: 30 Tage netto",
+        "thank_you": "Vielen Dank fuer Ihren Auftrag!",
+        "company": "Acme Produktionsdienstleistungen",
+        "items": [
+            ("Videoproduktionsdienste", 40, 150.00),
+            ("Postproduktionsbearbeitung", 24, 125.00),
+            ("Sounddesign und Mischung", 16, 175.00),
+            ("Farbkorrektur", 8, 200.00),
+        ]
+    },
+    "pt": {
+        "title": "FATURA",
+        "invoice_number": "Numero da Fatura",
+        "date": "Data",
+        "due_date": "Data de Vencimento",
+        "bill_to": "Cobrar De",
+        "description": "Descricao",
+        "quantity": "Qtd",
+        "unit_price": "Preco Unitario",
+        "total": "Total",
+        "subtotal": "Subtotal",
+        "tax": "Imposto (8%)",
+        "grand_total": "Total Geral",
+        "payment_terms": "Condicoes de Pagamento: 30 dias liquidos",
+        "thank_you": "Obrigado pelo seu negocio!",
+        "company": "Servicos de Producao Acme",
+        "items": [
+            ("Servicos de Producao de Video", 40, 150.00),
+            ("Edicao de Pos-Producao", 24, 125.00),
+            ("Design de Som e Mixagem", 16, 175.00),
+            ("Correcao de Cores", 8, 200.00),
+        ]
+    },
+    "ru": {
+        "title": "СЧЕТ",
+        "invoice_number": "Номер счета",
+        "date": "Дата",
+        "due_date": "Срок оплаты",
+        "bill_to": "Плательщик",
+        "description": "Описание",
+        "quantity": "Кол-во",
+        "unit_price": "Цена за ед.",
+        "total": "Итого",
+        "subtotal": "Промежуточный итог",
+        "tax": "Налог (8%)",
+        "grand_total": "Всего к оплате",
+        "payment_terms": "Условия оплаты: 30 дней",
+        "thank_you": "Благодарим за сотрудничество!",
+        "company": "Акме Продакшн Сервисез",
+        "items": [
+            ("Услуги видеопроизводства", 40, 150.00),
+            ("Монтаж и постпродакшн", 24, 125.00),
+            ("Звуковой дизайн и сведение", 16, 175.00),
+            ("Цветокоррекция", 8, 200.00),
+        ]
+    },
+    "zh": {
+        "title": "发票",
+        "invoice_number": "发票编号",
+        "date": "日期",
+        "due_date": "到期日",
+        "bill_to": "付款方",
+        "description": "描述",
+        "quantity": "数量",
+        "unit_price": "单价",
+        "total": "合计",
+        "subtotal": "小计",
+        "tax": "税 (8%)",
+        "grand_total": "总计",
+        "payment_terms": "付款条件：30天内付清",
+        "thank_you": "感谢您的惠顾！",
+        "company": "Acme 影视制作服务公司",
+        "items": [
+            ("视频制作服务", 40, 150.00),
+            ("后期剪辑", 24, 125.00),
+            ("声音设计与混音", 16, 175.00),
+            ("调色", 8, 200.00),
+        ]
+    },
+    "ja": {
+        "title": "請求書",
+        "invoice_number": "請求書番号",
+        "date": "日付",
+        "due_date": "支払期日",
+        "bill_to": "請求先",
+        "description": "品目",
+        "quantity": "数量",
+        "unit_price": "単価",
+        "total": "金額",
+        "subtotal": "小計",
+        "tax": "税 (8%)",
+        "grand_total": "合計金額",
+        "payment_terms": "支払条件：30日以内",
+        "thank_you": "お取引いただきありがとうございます。",
+        "company": "Acme プロダクションサービス株式会社",
+        "items": [
+            ("映像制作サービス", 40, 150.00),
+            ("ポストプロダクション編集", 24, 125.00),
+            ("サウンドデザイン・ミキシング", 16, 175.00),
+            ("カラーグレーディング", 8, 200.00),
+        ]
+    },
+    "ko": {
+        "title": "청구서",
+        "invoice_number": "청구서 번호",
+        "date": "날짜",
+        "due_date": "지불 기한",
+        "bill_to": "청구 대상",
+        "description": "설명",
+        "quantity": "수량",
+        "unit_price": "단가",
+        "total": "금액",
+        "subtotal": "소계",
+        "tax": "세금 (8%)",
+        "grand_total": "총액",
+        "payment_terms": "지불 조건: 30일 이내",
+        "thank_you": "거래해 주셔서 감사합니다!",
+        "company": "Acme 프로덕션 서비스",
+        "items": [
+            ("영상 제작 서비스", 40, 150.00),
+            ("후반 작업 편집", 24, 125.00),
+            ("사운드 디자인 및 믹싱", 16, 175.00),
+            ("색 보정", 8, 200.00),
+        ]
+    },
+}
+
+
+ROYALTY_CONTENT = {
+    "en": {
+        "title": "ROYALTY STATEMENT",
+        "period": "Reporting Period",
+        "territory": "Territory",
+        "recipient": "Payee",
+        "title_col": "Title",
+        "units": "Units",
+        "rate": "Rate",
+        "amount": "Amount",
+        "total_royalties": "Total Royalties Due",
+        "payment_date": "Payment Date",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["North America", "Europe", "Asia Pacific", "Latin America"],
+    },
+    "es": {
+        "title": "DECLARACION DE REGALIAS",
+        "period": "Periodo de Informe",
+        "territory": "Territorio",
+        "recipient": "Beneficiario",
+        "title_col": "Titulo",
+        "units": "Unidades",
+        "rate": "Tasa",
+        "amount": "Monto",
+        "total_royalties": "Total de Regalias Adeudadas",
+        "payment_date": "Fecha de Pago",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["America del Norte", "Europa", "Asia Pacifico", "America Latina"],
+    },
+    "de": {
+        "title": "LIZENZGEBUEHRENABRECHNUNG",
+        "period": "Berichtszeitraum",
+        "territory": "Territorium",
+        "recipient": "Zahlungsempfaenger",
+        "title_col": "Titel",
+        "units": "Einheiten",
+        "rate": "Satz",
+        "amount": "Betrag",
+        "total_royalties": "Gesamte faellige Lizenzgebuehren",
+        "payment_date": "Zahlungsdatum",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["Nordamerika", "Europa", "Asien-Pazifik", "Lateinamerika"],
+    },
+    "pt": {
+        "title": "DEMONSTRATIVO DE ROYALTIES",
+        "period": "Periodo do Relatorio",
+        "territory": "Territorio",
+        "recipient": "Beneficiario",
+        "title_col": "Titulo",
+        "units": "Unidades",
+        "rate": "Taxa",
+        "amount": "Valor",
+        "total_royalties": "Total de Royalties Devidos",
+        "payment_date": "Data de Pagamento",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["America do Norte", "Europa", "Asia-Pacifico", "America Latina"],
+    },
+    "ru": {
+        "title": "ОТЧЕТ О РОЯЛТИ",
+        "period": "Отчетный период",
+        "territory": "Территория",
+        "recipient": "Получатель",
+        "title_col": "Название",
+        "units": "Единицы",
+        "rate": "Ставка",
+        "amount": "Сумма",
+        "total_royalties": "Итого роялти к выплате",
+        "payment_date": "Дата выплаты",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["Северная Америка", "Европа", "Азиатско-Тихоокеанский регион", "Латинская Америка"],
+    },
+    "zh": {
+        "title": "版税结算单",
+        "period": "报告期间",
+        "territory": "地区",
+        "recipient": "收款方",
+        "title_col": "作品名称",
+        "units": "数量",
+        "rate": "费率",
+        "amount": "金额",
+        "total_royalties": "应付版税总额",
+        "payment_date": "付款日期",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["北美", "欧洲", "亚太地区", "拉丁美洲"],
+    },
+    "ja": {
+        "title": "ロイヤリティ明細書",
+        "period": "対象期間",
+        "territory": "地域",
+        "recipient": "受取人",
+        "title_col": "作品名",
+        "units": "数量",
+        "rate": "料率",
+        "amount": "金額",
+        "total_royalties": "ロイヤリティ支払総額",
+        "payment_date": "支払日",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["北米", "ヨーロッパ", "アジア太平洋", "ラテンアメリカ"],
+    },
+    "ko": {
+        "title": "로열티 명세서",
+        "period": "보고 기간",
+        "territory": "지역",
+        "recipient": "수취인",
+        "title_col": "작품명",
+        "units": "수량",
+        "rate": "요율",
+        "amount": "금액",
+        "total_royalties": "지급할 로열티 총액",
+        "payment_date": "지급일",
+        "company": "Global Entertainment Royalties Inc.",
+        "territories": ["북미", "유럽", "아시아 태평양", "라틴 아메리카"],
+    },
+}
+
+
+CONTRACT_CONTENT = {
+    "en": {
+        "title": "LICENSING AGREEMENT",
+        "parties": "PARTIES",
+        "party_a": "Party A (Licensor)",
+        "party_b": "Party B (Licensee)",
+        "effective_date": "Effective Date",
+        "term": "Term",
+        "territory": "Licensed Territory",
+        "consideration": "Consideration",
+        "terms_title": "TERMS AND CONDITIONS",
+        "signature": "SIGNATURES",
+        "schedule": "SCHEDULE A - LICENSED TITLES",
+        "title_col": "Title",
+        "media": "Media",
+        "terms": [
+            "1. GRANT OF LICENSE: Licensor hereby grants to Licensee a non-exclusive license to distribute the Licensed Content in the Territory.",
+            "2. TERM: This Agreement shall commence on the Effective Date and continue for the period specified above.",
+            "3. PAYMENT: Licensee shall pay Licensor the Consideration amount within 30 days of execution.",
+            "4. INTELLECTUAL PROPERTY: All intellectual property rights remain with the Licensor.",
+            "5. CONFIDENTIALITY: Both parties agree to maintain confidentiality of all proprietary information.",
+            "6. TERMINATION: Either party may terminate with 90 days written notice.",
+        ],
+    },
+    "es": {
+        "title": "ACUERDO DE LICENCIA",
+        "parties": "PARTES",
+        "party_a": "Parte A (Licenciante)",
+        "party_b": "Parte B (Licenciatario)",
+        "effective_date": "Fecha de Vigencia",
+        "term": "Plazo",
+        "territory": "Territorio Licenciado",
+        "consideration": "Contraprestacion",
+        "terms_title": "TERMINOS Y CONDICIONES",
+        "signature": "FIRMAS",
+        "schedule": "ANEXO A - TITULOS LICENCIADOS",
+        "title_col": "Titulo",
+        "media": "Medios",
+        "terms": [
+            "1. OTORGAMIENTO DE LICENCIA: El Licenciante otorga al Licenciatario una licencia no exclusiva para distribuir el Contenido en el Territorio.",
+            "2. PLAZO: Este Acuerdo comenzara en la Fecha de Vigencia y continuara por el periodo especificado.",
+            "3. PAGO: El Licenciatario pagara al Licenciante el monto de Contraprestacion dentro de 30 dias.",
+            "4. PROPIEDAD INTELECTUAL: Todos los derechos de propiedad intelectual permanecen con el Licenciante.",
+            "5. CONFIDENCIALIDAD: Ambas partes acuerdan mantener la confidencialidad de toda informacion.",
+            "6. TERMINACION: Cualquier parte puede terminar con 90 dias de aviso por escrito.",
+        ],
+    },
+    "de": {
+        "title": "LIZENZVEREINBARUNG",
+        "parties": "PARTEIEN",
+        "party_a": "Partei A (Lizenzgeber)",
+        "party_b": "Partei B (Lizenznehmer)",
+        "effective_date": "Wirksamkeitsdatum",
+        "term": "Laufzeit",
+        "territory": "Lizenziertes Gebiet",
+        "consideration": "Gegenleistung",
+        "terms_title": "GESCHAEFTSBEDINGUNGEN",
+        "signature": "UNTERSCHRIFTEN",
+        "schedule": "ANLAGE A - LIZENZIERTE TITEL",
+        "title_col": "Titel",
+        "media": "Medien",
+        "terms": [
+            "1. LIZENZGEWAEHRUNG: Der Lizenzgeber gewaehrt dem Lizenznehmer eine nicht-exklusive Lizenz zur Verbreitung.",
+            "2. LAUFZEIT: Diese Vereinbarung beginnt am Wirksamkeitsdatum und laeuft fuer den angegebenen Zeitraum.",
+            "3. ZAHLUNG: Der Lizenznehmer zahlt dem Lizenzgeber den Gegenleistungsbetrag innerhalb von 30 Tagen.",
+            "4. GEISTIGES EIGENTUM: Alle geistigen Eigentumsrechte verbleiben beim Lizenzgeber.",
+            "5. VERTRAULICHKEIT: Beide Parteien vereinbaren die Vertraulichkeit aller Informationen.",
+            "6. KUENDIGUNG: Jede Partei kann mit 90 Tagen schriftlicher Kuendigung beenden.",
+        ],
+    },
+    "pt": {
+        "title": "CONTRATO DE LICENCIAMENTO",
+        "parties": "PARTES",
+        "party_a": "Parte A (Licenciador)",
+        "party_b": "Parte B (Licenciado)",
+        "effective_date": "Data de Vigencia",
+        "term": "Prazo",
+        "territory": "Territorio Licenciado",
+        "consideration": "Contraprestacao",
+        "terms_title": "TERMOS E CONDICOES",
+        "signature": "ASSINATURAS",
+        "schedule": "ANEXO A - TITULOS LICENCIADOS",
+        "title_col": "Titulo",
+        "media": "Midia",
+        "terms": [
+            "1. CONCESSAO DE LICENCA: O Licenciador concede ao Licenciado uma licenca nao exclusiva para distribuir o Conteudo.",
+            "2. PRAZO: Este Contrato comecara na Data de Vigencia e continuara pelo periodo especificado.",
+            "3. PAGAMENTO: O Licenciado pagara ao Licenciador o valor da Contraprestacao em 30 dias.",
+            "4. PROPRIEDADE INTELECTUAL: Todos os direitos de propriedade intelectual permanecem com o Licenciador.",
+            "5. CONFIDENCIALIDADE: Ambas as partes concordam em manter a confidencialidade de todas as informacoes.",
+            "6. RESCISAO: Qualquer parte pode rescindir com 90 dias de aviso previo por escrito.",
+        ],
+    },
+    "ru": {
+        "title": "ЛИЦЕНЗИОННОЕ СОГЛАШЕНИЕ",
+        "parties": "СТОРОНЫ",
+        "party_a": "Сторона А (Лицензиар)",
+        "party_b": "Сторона Б (Лицензиат)",
+        "effective_date": "Дата вступления в силу",
+        "term": "Срок",
+        "territory": "Лицензионная территория",
+        "consideration": "Вознаграждение",
+        "terms_title": "УСЛОВИЯ СОГЛАШЕНИЯ",
+        "signature": "ПОДПИСИ",
+        "schedule": "ПРИЛОЖЕНИЕ А - ЛИЦЕНЗИРУЕМЫЕ ПРОИЗВЕДЕНИЯ",
+        "title_col": "Название",
+        "media": "Носитель",
+        "terms": [
+            "1. ПРЕДОСТАВЛЕНИЕ ЛИЦЕНЗИИ: Лицензиар предоставляет Лицензиату неисключительную лицензию на распространение Контента на Территории.",
+            "2. СРОК: Настоящее Соглашение вступает в силу с Даты вступления в силу и действует в течение указанного срока.",
+            "3. ОПЛАТА: Лицензиат выплачивает Лицензиару сумму Вознаграждения в течение 30 дней.",
+            "4. ИНТЕЛЛЕКТУАЛЬНАЯ СОБСТВЕННОСТЬ: Все права интеллектуальной собственности остаются за Лицензиаром.",
+            "5. КОНФИДЕНЦИАЛЬНОСТЬ: Стороны обязуются сохранять конфиденциальность всей информации.",
+            "6. РАСТОРЖЕНИЕ: Любая из сторон может расторгнуть Соглашение с письменным уведомлением за 90 дней.",
+        ],
+    },
+    "zh": {
+        "title": "许可协议",
+        "parties": "协议双方",
+        "party_a": "甲方（许可方）",
+        "party_b": "乙方（被许可方）",
+        "effective_date": "生效日期",
+        "term": "期限",
+        "territory": "许可地区",
+        "consideration": "对价",
+        "terms_title": "条款与条件",
+        "signature": "签字",
+        "schedule": "附件A - 许可作品清单",
+        "title_col": "作品名称",
+        "media": "媒介",
+        "terms": [
+            "1. 许可授予：许可方特此授予被许可方在许可地区内发行许可内容的非独占许可。",
+            "2. 期限：本协议自生效日期起生效，并在上述期限内持续有效。",
+            "3. 付款：被许可方应在签署后30天内向许可方支付对价金额。",
+            "4. 知识产权：所有知识产权归许可方所有。",
+            "5. 保密：双方同意对所有专有信息予以保密。",
+            "6. 终止：任何一方可提前90天书面通知终止本协议。",
+        ],
+    },
+    "ja": {
+        "title": "ライセンス契約書",
+        "parties": "当事者",
+        "party_a": "甲（ライセンサー）",
+        "party_b": "乙（ライセンシー）",
+        "effective_date": "発効日",
+        "term": "契約期間",
+        "territory": "許諾地域",
+        "consideration": "対価",
+        "terms_title": "契約条件",
+        "signature": "署名",
+        "schedule": "別紙A - 許諾作品一覧",
+        "title_col": "作品名",
+        "media": "メディア",
+        "terms": [
+            "1. ライセンスの許諾：ライセンサーはライセンシーに対し、許諾地域において許諾コンテンツを配信する非独占的ライセンスを許諾する。",
+            "2. 契約期間：本契約は発効日に開始し、上記の期間継続する。",
+            "3. 支払：ライセンシーは契約締結後30日以内に対価をライセンサーに支払う。",
+            "4. 知的財産権：すべての知的財産権はライセンサーに帰属する。",
+            "5. 秘密保持：両当事者はすべての機密情報の秘密を保持することに同意する。",
+            "6. 解除：いずれの当事者も90日前の書面通知により本契約を解除できる。",
+        ],
+    },
+    "ko": {
+        "title": "라이선스 계약서",
+        "parties": "계약 당사자",
+        "party_a": "갑 (라이선서)",
+        "party_b": "을 (라이선시)",
+        "effective_date": "발효일",
+        "term": "계약 기간",
+        "territory": "허가 지역",
+        "consideration": "대가",
+        "terms_title": "계약 조건",
+        "signature": "서명",
+        "schedule": "부속서 A - 허가 작품 목록",
+        "title_col": "작품명",
+        "media": "매체",
+        "terms": [
+            "1. 라이선스 부여: 라이선서는 라이선시에게 허가 지역 내에서 허가 콘텐츠를 배포할 수 있는 비독점 라이선스를 부여한다.",
+            "2. 기간: 본 계약은 발효일에 시작하여 위에 명시된 기간 동안 유지된다.",
+            "3. 지급: 라이선시는 계약 체결 후 30일 이내에 라이선서에게 대가를 지급한다.",
+            "4. 지식재산권: 모든 지식재산권은 라이선서에게 귀속된다.",
+            "5. 비밀 유지: 양 당사자는 모든 독점 정보의 비밀을 유지하기로 합의한다.",
+            "6. 해지: 어느 당사자든 90일 전 서면 통지로 계약을 해지할 수 있다.",
+        ],
+    },
+}
+
+
+INVOICE_CLIENTS = ["Global Studios Inc", "MediaTech Solutions", "Film Finance Co", "Creative Partners LLC"]
+ROYALTY_PAYEES = ["Stellar Productions", "Creative Artists Group", "Independent Films LLC", "Music Rights Holdings"]
+ROYALTY_TITLES = [
+    ("The Last Horizon", 10000, 50000, 0.15),
+    ("Midnight Symphony", 5000, 25000, 0.12),
+    ("Desert Wind", 8000, 40000, 0.18),
+    ("City Lights", 15000, 60000, 0.10),
+    ("Ocean Dreams", 3000, 15000, 0.20),
+]
+CONTRACT_LICENSORS = ["Paramount Media Holdings", "Universal Content Group", "Warner Distribution LLC", "Sony Pictures Entertainment"]
+CONTRACT_LICENSEES = ["Netflix International", "Amazon Prime Video", "Disney+ Worldwide", "HBO Max Global"]
+CONTRACT_TERRITORIES = ["Worldwide", "North America", "Europe", "Asia Pacific", "Latin America"]
+CONTRACT_MEDIA = ["SVOD", "AVOD", "TVOD", "EST", "Pay TV", "Free TV"]
+
+
+def royalty_title(row: int) -> tuple:
+    """(title, min units, max units, rate) for a statement row; long statements cycle the catalog by season."""
+    title, low, high, rate = ROYALTY_TITLES[row % len(ROYALTY_TITLES)]
+    season = row // len(ROYALTY_TITLES)
+    return (f"{title} S{season + 1}" if season else title), low, high, rate
+
+
+# ============================================================================
+# VARIABLE FIELDS
+# ============================================================================
+# Each builder returns (fields, truth): the display strings stamped into the
+# document, and the values AI_EXTRACT should recover from it (the fields
+# STG_ENRICHED_DOCUMENTS asks for), recorded in the ground-truth manifest.
+# ``rows`` sets the length of the document's table for multi-page documents;
+# None keeps the standard single-page table.
+
+def ground_truth(document_type: str, total_amount: float, document_date: datetime,
+                 vendor_territory: str, counterparty: str) -> dict:
+    return {
+        "document_type": document_type,
+        "total_amount": round(total_amount, 2),
+        "currency": "USD",
+        "document_date": document_date.strftime("%Y-%m-%d"),
+        "vendor_territory": vendor_territory,
+        "counterparty": counterparty,
     }
-    
-    c = content.get(lang, content["en"])
-    
-    pdf = MultilingualPDF()
-    pdf.add_page()
-    
+
+
+def invoice_fields(lang: str, invoice_num: int, rng=random, today: datetime = None, rows: int = None) -> tuple:
+    """Display values that differ between invoices, and their ground truth."""
+    c = INVOICE_CONTENT.get(lang, INVOICE_CONTENT["en"])
+    invoice_date = (today or datetime.now()) - timedelta(days=rng.randint(1, 60))
+    due_date = invoice_date + timedelta(days=30)
+
+    fields = {
+        "invoice_number": f"INV-2024-{invoice_num:04d}",
+        "invoice_date": invoice_date.strftime('%Y-%m-%d'),
+        "due_date": due_date.strftime('%Y-%m-%d'),
+        "client": rng.choice(INVOICE_CLIENTS),
+    }
+
+    # Each line's quantity and rate vary around the content's typical figures,
+    # rates in $5 steps, so totals differ between invoices
+    items = []
+    for i in range(max(len(c["items"]), rows or 0)):
+        desc, qty, price = c["items"][i % len(c["items"])]
+        if i >= len(c["items"]):
+            desc = f"{desc} ({i // len(c['items']) + 1})"
+        items.append((desc, rng.randint(max(1, qty // 2), qty * 2), 5 * round(price * rng.uniform(0.8, 1.25) / 5)))
+
+    subtotal = 0
+    for i, (desc, qty, price) in enumerate(items[:rows] if rows else items):
+        line_total = qty * price
+        subtotal += line_total
+        fields[f"item_{i}_description"] = desc
+        fields[f"item_{i}_quantity"] = str(qty)
+        fields[f"item_{i}_unit_price"] = f"${price:,.2f}"
+        fields[f"item_{i}_total"] = f"${line_total:,.2f}"
+
+    tax = subtotal * 0.08
+    fields["subtotal"] = f"${subtotal:,.2f}"
+    fields["tax"] = f"${tax:,.2f}"
+    fields["grand_total"] = f"${subtotal + tax:,.2f}"
+
+    truth = ground_truth("INVOICE", subtotal + tax, invoice_date, c["company"], fields["client"])
+    return fields, truth
+
+
+def royalty_fields(lang: str, stmt_num: int, rng=random, today: datetime = None, rows: int = None) -> tuple:
+    """Display values that differ between royalty statements, and their ground truth.
+
+    Statement periods are fixed to 2024 quarters, so ``today`` is unused.
+    """
+    c = ROYALTY_CONTENT.get(lang, ROYALTY_CONTENT["en"])
+    period_start = datetime(2024, rng.choice([1, 4, 7, 10]), 1)
+    period_end = period_start + timedelta(days=89)
+
+    fields = {
+        "period": f"{period_start.strftime('%Y-%m-%d')} to {period_end.strftime('%Y-%m-%d')}",
+        "territory": rng.choice(c["territories"]),
+        "payee": rng.choice(ROYALTY_PAYEES),
+    }
+
+    titles = [royalty_title(row) for row in range(rows or len(ROYALTY_TITLES))]
+    units_by_title = [rng.randint(low, high) for _, low, high, _ in titles]
+    total = 0
+    for i, ((_, _, _, rate), units) in enumerate(zip(titles, units_by_title)):
+        amount = units * rate
+        total += amount
+        fields[f"title_{i}_units"] = f"{units:,}"
+        fields[f"title_{i}_amount"] = f"${amount:,.2f}"
+
+    fields["total"] = f"${total:,.2f}"
+    fields["payment_date"] = (period_end + timedelta(days=45)).strftime('%Y-%m-%d')
+
+    truth = ground_truth("ROYALTY_STATEMENT", total, period_end, fields["territory"], fields["payee"])
+    return fields, truth
+
+
+def contract_fields(lang: str, contract_num: int, rng=random, today: datetime = None, rows: int = None) -> tuple:
+    """Display values that differ between contracts, and their ground truth.
+
+    ``rows`` adds a schedule of licensed titles on the following pages.
+    """
+    licensor = rng.choice(CONTRACT_LICENSORS)
+    licensee = rng.choice(CONTRACT_LICENSEES)
+    effective_date = (today or datetime.now()) - timedelta(days=rng.randint(1, 180))
+    term_years = rng.choice([1, 2, 3, 5])
+    consideration = rng.randint(50, 500) * 10000
+    territory = rng.choice(CONTRACT_TERRITORIES)
+
+    fields = {
+        "licensor": licensor,
+        "licensee": licensee,
+        "effective_date": effective_date.strftime("%Y-%m-%d"),
+        "term": f"{term_years} year(s)",
+        "territory": territory,
+        "consideration": f"${consideration:,} USD",
+    }
+    for i in range(rows or 0):
+        fields[f"schedule_{i}_title"] = royalty_title(i)[0]
+        fields[f"schedule_{i}_media"] = rng.choice(CONTRACT_MEDIA)
+    truth = ground_truth("CONTRACT", consideration, effective_date, territory, licensor)
+    return fields, truth
+
+
+# ============================================================================
+# LAYOUTS
+# ============================================================================
+# Each layout draws one document from its language content ``c`` and field
+# values ``f``. Variable fields must be drawn with cell() so compiled
+# templates can re-position them. Tables run over as many pages as their
+# rows need, repeating the header row on each page.
+
+TABLE_ROW_HEIGHT = 7
+# Height of the blocks that follow the tables and must not be split from each other
+INVOICE_CLOSING_HEIGHT = 5 + 7 + 7 + 8 + 15 + 8 + 8
+ROYALTY_CLOSING_HEIGHT = 5 + 10 + 5 + 8
+
+
+def table_rows(f: dict, suffix: str) -> int:
+    """Number of table rows in the fields, counted by one per-row field."""
+    return sum(1 for name in f if name.endswith(suffix))
+
+
+def table_header(pdf: FPDF, columns: list) -> None:
+    """Header row from (width, label, align) columns."""
+    pdf.set_font(pdf.body_font, "B", 10)
+    pdf.set_fill_color(240, 240, 240)
+    for i, (width, label, align) in enumerate(columns):
+        pdf.cell(width, 8, label, border=1, fill=True, align=align, ln=i == len(columns) - 1)
+    pdf.set_font(pdf.body_font, "", 10)
+
+
+def continue_table(pdf: FPDF, columns: list) -> None:
+    """Start a new page with the header row if the next row would not fit."""
+    if pdf.will_page_break(TABLE_ROW_HEIGHT):
+        pdf.add_page()
+        table_header(pdf, columns)
+
+
+def layout_invoice(pdf: FPDF, c: dict, f: dict) -> None:
     # Header
-    pdf.set_font("Helvetica", "B", 24)
+    pdf.set_font(pdf.body_font, "B", 24)
     pdf.cell(0, 15, c["title"], ln=True, align="C")
     
-    pdf.set_font("Helvetica", "", 10)
+    pdf.set_font(pdf.body_font, "", 10)
     pdf.cell(0, 8, c["company"], ln=True, align="C")
     pdf.cell(0, 5, "123 Media Boulevard, Los Angeles, CA 90028", ln=True, align="C")
     pdf.ln(10)
     
     # Invoice details
-    pdf.set_font("Helvetica", "B", 11)
-    invoice_date = datetime.now() - timedelta(days=random.randint(1, 60))
-    due_date = invoice_date + timedelta(days=30)
-    
-    pdf.cell(95, 8, f"{c['invoice_number']}: INV-2024-{invoice_num:04d}", ln=False)
-    pdf.cell(95, 8, f"{c['date']}: {invoice_date.strftime('%Y-%m-%d')}", ln=True, align="R")
-    pdf.cell(95, 8, f"{c['due_date']}: {due_date.strftime('%Y-%m-%d')}", ln=True, align="R")
+    pdf.set_font(pdf.body_font, "B", 11)
+    pdf.cell(95, 8, f"{c['invoice_number']}: {f['invoice_number']}", ln=False)
+    pdf.cell(95, 8, f"{c['date']}: {f['invoice_date']}", ln=True, align="R")
+    pdf.cell(95, 8, f"{c['due_date']}: {f['due_date']}", ln=True, align="R")
     pdf.ln(5)
     
     # Bill to
-    pdf.set_font("Helvetica", "B", 11)
+    pdf.set_font(pdf.body_font, "B", 11)
     pdf.cell(0, 8, c["bill_to"] + ":", ln=True)
-    pdf.set_font("Helvetica", "", 10)
-    clients = ["Global Studios Inc", "MediaTech Solutions", "Film Finance Co", "Creative Partners LLC"]
-    pdf.cell(0, 6, random.choice(clients), ln=True)
+    pdf.set_font(pdf.body_font, "", 10)
+    pdf.cell(0, 6, f["client"], ln=True)
     pdf.cell(0, 6, "456 Entertainment Way", ln=True)
     pdf.cell(0, 6, "Beverly Hills, CA 90210", ln=True)
     pdf.ln(10)
     
-    # Table header
-    pdf.set_font("Helvetica", "B", 10)
-    pdf.set_fill_color(240, 240, 240)
-    pdf.cell(80, 8, c["description"], border=1, fill=True)
-    pdf.cell(25, 8, c["quantity"], border=1, fill=True, align="C")
-    pdf.cell(40, 8, c["unit_price"], border=1, fill=True, align="R")
-    pdf.cell(45, 8, c["total"], border=1, fill=True, align="R", ln=True)
+    # Line items
+    columns = [(80, c["description"], "L"), (25, c["quantity"], "C"),
+               (40, c["unit_price"], "R"), (45, c["total"], "R")]
+    table_header(pdf, columns)
+    for i in range(table_rows(f, "_description")):
+        continue_table(pdf, columns)
+        pdf.cell(80, 7, f[f"item_{i}_description"], border=1)
+        pdf.cell(25, 7, f[f"item_{i}_quantity"], border=1, align="C")
+        pdf.cell(40, 7, f[f"item_{i}_unit_price"], border=1, align="R")
+        pdf.cell(45, 7, f[f"item_{i}_total"], border=1, align="R", ln=True)
     
-    # Table rows
-    pdf.set_font("Helvetica", "", 10)
-    subtotal = 0
-    for desc, qty, price in c["items"]:
-        line_total = qty * price
-        subtotal += line_total
-        pdf.cell(80, 7, desc, border=1)
-        pdf.cell(25, 7, str(qty), border=1, align="C")
-        pdf.cell(40, 7, f"${price:,.2f}", border=1, align="R")
-        pdf.cell(45, 7, f"${line_total:,.2f}", border=1, align="R", ln=True)
-    
-    # Totals
+    # Totals and footer stay together on the last page
+    if pdf.will_page_break(INVOICE_CLOSING_HEIGHT):
+        pdf.add_page()
     pdf.ln(5)
-    tax = subtotal * 0.08
-    grand_total = subtotal + tax
-    
-    pdf.set_font("Helvetica", "", 10)
+    pdf.set_font(pdf.body_font, "", 10)
     pdf.cell(145, 7, c["subtotal"] + ":", align="R")
-    pdf.cell(45, 7, f"${subtotal:,.2f}", align="R", ln=True)
+    pdf.cell(45, 7, f["subtotal"], align="R", ln=True)
     pdf.cell(145, 7, c["tax"] + ":", align="R")
-    pdf.cell(45, 7, f"${tax:,.2f}", align="R", ln=True)
-    pdf.set_font("Helvetica", "B", 11)
+    pdf.cell(45, 7, f["tax"], align="R", ln=True)
+    pdf.set_font(pdf.body_font, "B", 11)
     pdf.cell(145, 8, c["grand_total"] + ":", align="R")
-    pdf.cell(45, 8, f"${grand_total:,.2f}", align="R", ln=True)
+    pdf.cell(45, 8, f["grand_total"], align="R", ln=True)
     
     # Footer
     pdf.ln(15)
-    pdf.set_font("Helvetica", "I", 10)
+    pdf.set_font(pdf.body_font, "I", 10)
     pdf.cell(0, 8, c["payment_terms"], ln=True, align="C")
     pdf.cell(0, 8, c["thank_you"], ln=True, align="C")
-    
-    filename = f"invoice_{lang}_{invoice_num:03d}.pdf"
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    pdf.output(filepath)
-    return filename
 
 
-def generate_royalty_statement(lang: str, stmt_num: int) -> str:
-    """Generate a royalty statement PDF in the specified language."""
-    
-    content = {
-        "en": {
-            "title": "ROYALTY STATEMENT",
-            "period": "Reporting Period",
-            "territory": "Territory",
-            "recipient": "Payee",
-            "title_col": "Title",
-            "units": "Units",
-            "rate": "Rate",
-            "amount": "Amount",
-            "total_royalties": "Total Royalties Due",
-            "payment_date": "Payment Date",
-            "company": "Global Entertainment Royalties Inc.",
-            "territories": ["North America", "Europe", "Asia Pacific", "Latin America"],
-        },
-        "es": {
-            "title": "DECLARACION DE REGALIAS",
-            "period": "Periodo de Informe",
-            "territory": "Territorio",
-            "recipient": "Beneficiario",
-            "title_col": "Titulo",
-            "units": "Unidades",
-            "rate": "Tasa",
-            "amount": "Monto",
-            "total_royalties": "Total de Regalias Adeudadas",
-            "payment_date": "Fecha de Pago",
-            "company": "Global Entertainment Royalties Inc.",
-            "territories": ["America del Norte", "Europa", "Asia Pacifico", "America Latina"],
-        },
-        "de": {
-            "title": "LIZENZGEBUEHRENABRECHNUNG",
-            "period": "Berichtszeitraum",
-            "territory": "Territorium",
-            "recipient": "Zahlungsempfaenger",
-            "title_col": "Titel",
-            "units": "Einheiten",
-            "rate": "Satz",
-            "amount": "Betrag",
-            "total_royalties": "Gesamte faellige Lizenzgebuehren",
-            "payment_date": "Zahlungsdatum",
-            "company": "Global Entertainment Royalties Inc.",
-            "territories": ["Nordamerika", "Europa", "Asien-Pazifik", "Lateinamerika"],
-        },
-        "pt": {
-            "title": "DEMONSTRATIVO DE ROYALTIES",
-            "period": "Periodo do Relatorio",
-            "territory": "Territorio",
-            "recipient": "Beneficiario",
-            "title_col": "Titulo",
-            "units": "Unidades",
-            "rate": "Taxa",
-            "amount": "Valor",
-            "total_royalties": "Total de Royalties Devidos",
-            "payment_date": "Data de Pagamento",
-            "company": "Global Entertainment Royalties Inc.",
-            "territories": ["America do Norte", "Europa", "Asia-Pacifico", "America Latina"],
-        },
-    }
-    
-    c = content.get(lang, content["en"])
-    
-    pdf = MultilingualPDF()
-    pdf.add_page()
-    
+def layout_royalty_statement(pdf: FPDF, c: dict, f: dict) -> None:
     # Header
-    pdf.set_font("Helvetica", "B", 20)
+    pdf.set_font(pdf.body_font, "B", 20)
     pdf.cell(0, 12, c["title"], ln=True, align="C")
-    pdf.set_font("Helvetica", "", 10)
+    pdf.set_font(pdf.body_font, "", 10)
     pdf.cell(0, 6, c["company"], ln=True, align="C")
     pdf.ln(10)
     
     # Statement details
-    period_start = datetime(2024, random.choice([1, 4, 7, 10]), 1)
-    period_end = period_start + timedelta(days=89)
-    territory = random.choice(c["territories"])
-    
-    pdf.set_font("Helvetica", "B", 11)
+    pdf.set_font(pdf.body_font, "B", 11)
     pdf.cell(50, 8, c["period"] + ":")
-    pdf.set_font("Helvetica", "", 11)
-    pdf.cell(0, 8, f"{period_start.strftime('%Y-%m-%d')} to {period_end.strftime('%Y-%m-%d')}", ln=True)
+    pdf.set_font(pdf.body_font, "", 11)
+    pdf.cell(0, 8, f["period"], ln=True)
     
-    pdf.set_font("Helvetica", "B", 11)
+    pdf.set_font(pdf.body_font, "B", 11)
     pdf.cell(50, 8, c["territory"] + ":")
-    pdf.set_font("Helvetica", "", 11)
-    pdf.cell(0, 8, territory, ln=True)
+    pdf.set_font(pdf.body_font, "", 11)
+    pdf.cell(0, 8, f["territory"], ln=True)
     
-    pdf.set_font("Helvetica", "B", 11)
+    pdf.set_font(pdf.body_font, "B", 11)
     pdf.cell(50, 8, c["recipient"] + ":")
-    pdf.set_font("Helvetica", "", 11)
-    artists = ["Stellar Productions", "Creative Artists Group", "Independent Films LLC", "Music Rights Holdings"]
-    pdf.cell(0, 8, random.choice(artists), ln=True)
+    pdf.set_font(pdf.body_font, "", 11)
+    pdf.cell(0, 8, f["payee"], ln=True)
     pdf.ln(10)
     
     # Titles table
-    pdf.set_font("Helvetica", "B", 10)
-    pdf.set_fill_color(240, 240, 240)
-    pdf.cell(70, 8, c["title_col"], border=1, fill=True)
-    pdf.cell(35, 8, c["units"], border=1, fill=True, align="C")
-    pdf.cell(40, 8, c["rate"], border=1, fill=True, align="R")
-    pdf.cell(45, 8, c["amount"], border=1, fill=True, align="R", ln=True)
-    
-    titles = [
-        ("The Last Horizon", random.randint(10000, 50000), 0.15),
-        ("Midnight Symphony", random.randint(5000, 25000), 0.12),
-        ("Desert Wind", random.randint(8000, 40000), 0.18),
-        ("City Lights", random.randint(15000, 60000), 0.10),
-        ("Ocean Dreams", random.randint(3000, 15000), 0.20),
-    ]
-    
-    pdf.set_font("Helvetica", "", 10)
-    total = 0
-    for title, units, rate in titles:
-        amount = units * rate
-        total += amount
+    columns = [(70, c["title_col"], "L"), (35, c["units"], "C"), (40, c["rate"], "R"), (45, c["amount"], "R")]
+    table_header(pdf, columns)
+    for i in range(table_rows(f, "_units")):
+        continue_table(pdf, columns)
+        title, _, _, rate = royalty_title(i)
         pdf.cell(70, 7, title, border=1)
-        pdf.cell(35, 7, f"{units:,}", border=1, align="C")
+        pdf.cell(35, 7, f[f"title_{i}_units"], border=1, align="C")
         pdf.cell(40, 7, f"${rate:.2f}", border=1, align="R")
-        pdf.cell(45, 7, f"${amount:,.2f}", border=1, align="R", ln=True)
+        pdf.cell(45, 7, f[f"title_{i}_amount"], border=1, align="R", ln=True)
     
     # Total
+    if pdf.will_page_break(ROYALTY_CLOSING_HEIGHT):
+        pdf.add_page()
     pdf.ln(5)
-    pdf.set_font("Helvetica", "B", 12)
+    pdf.set_font(pdf.body_font, "B", 12)
     pdf.cell(145, 10, c["total_royalties"] + ":", align="R")
-    pdf.cell(45, 10, f"${total:,.2f}", align="R", ln=True)
+    pdf.cell(45, 10, f["total"], align="R", ln=True)
     
     pdf.ln(5)
-    pdf.set_font("Helvetica", "", 10)
-    payment_date = period_end + timedelta(days=45)
-    pdf.cell(0, 8, f"{c['payment_date']}: {payment_date.strftime('%Y-%m-%d')}", ln=True)
-    
-    filename = f"royalty_{lang}_{stmt_num:03d}.pdf"
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    pdf.output(filepath)
-    return filename
+    pdf.set_font(pdf.body_font, "", 10)
+    pdf.cell(0, 8, f"{c['payment_date']}: {f['payment_date']}", ln=True)
 
 
-def generate_contract(lang: str, contract_num: int) -> str:
-    """Generate a contract PDF in the specified language."""
-    
-    content = {
-        "en": {
-            "title": "LICENSING AGREEMENT",
-            "parties": "PARTIES",
-            "party_a": "Party A (Licensor)",
-            "party_b": "Party B (Licensee)",
-            "effective_date": "Effective Date",
-            "term": "Term",
-            "territory": "Licensed Territory",
-            "consideration": "Consideration",
-            "terms_title": "TERMS AND CONDITIONS",
-            "signature": "SIGNATURES",
-            "terms": [
-                "1. GRANT OF LICENSE: Licensor hereby grants to Licensee a non-exclusive license to distribute the Licensed Content in the Territory.",
-                "2. TERM: This Agreement shall commence on the Effective Date and continue for the period specified above.",
-                "3. PAYMENT: Licensee shall pay Licensor the Consideration amount within 30 days of execution.",
-                "4. INTELLECTUAL PROPERTY: All intellectual property rights remain with the Licensor.",
-                "5. CONFIDENTIALITY: Both parties agree to maintain confidentiality of all proprietary information.",
-                "6. TERMINATION: Either party may terminate with 90 days written notice.",
-            ],
-        },
-        "es": {
-            "title": "ACUERDO DE LICENCIA",
-            "parties": "PARTES",
-            "party_a": "Parte A (Licenciante)",
-            "party_b": "Parte B (Licenciatario)",
-            "effective_date": "Fecha de Vigencia",
-            "term": "Plazo",
-            "territory": "Territorio Licenciado",
-            "consideration": "Contraprestacion",
-            "terms_title": "TERMINOS Y CONDICIONES",
-            "signature": "FIRMAS",
-            "terms": [
-                "1. OTORGAMIENTO DE LICENCIA: El Licenciante otorga al Licenciatario una licencia no exclusiva para distribuir el Contenido en el Territorio.",
-                "2. PLAZO: Este Acuerdo comenzara en la Fecha de Vigencia y continuara por el periodo especificado.",
-                "3. PAGO: El Licenciatario pagara al Licenciante el monto de Contraprestacion dentro de 30 dias.",
-                "4. PROPIEDAD INTELECTUAL: Todos los derechos de propiedad intelectual permanecen con el Licenciante.",
-                "5. CONFIDENCIALIDAD: Ambas partes acuerdan mantener la confidencialidad de toda informacion.",
-                "6. TERMINACION: Cualquier parte puede terminar con 90 dias de aviso por escrito.",
-            ],
-        },
-        "de": {
-            "title": "LIZENZVEREINBARUNG",
-            "parties": "PARTEIEN",
-            "party_a": "Partei A (Lizenzgeber)",
-            "party_b": "Partei B (Lizenznehmer)",
-            "effective_date": "Wirksamkeitsdatum",
-            "term": "Laufzeit",
-            "territory": "Lizenziertes Gebiet",
-            "consideration": "Gegenleistung",
-            "terms_title": "GESCHAEFTSBEDINGUNGEN",
-            "signature": "UNTERSCHRIFTEN",
-            "terms": [
-                "1. LIZENZGEWAEHRUNG: Der Lizenzgeber gewaehrt dem Lizenznehmer eine nicht-exklusive Lizenz zur Verbreitung.",
-                "2. LAUFZEIT: Diese Vereinbarung beginnt am Wirksamkeitsdatum und laeuft fuer den angegebenen Zeitraum.",
-                "3. ZAHLUNG: Der Lizenznehmer zahlt dem Lizenzgeber den Gegenleistungsbetrag innerhalb von 30 Tagen.",
-                "4. GEISTIGES EIGENTUM: Alle geistigen Eigentumsrechte verbleiben beim Lizenzgeber.",
-                "5. VERTRAULICHKEIT: Beide Parteien vereinbaren die Vertraulichkeit aller Informationen.",
-                "6. KUENDIGUNG: Jede Partei kann mit 90 Tagen schriftlicher Kuendigung beenden.",
-            ],
-        },
-        "pt": {
-            "title": "CONTRATO DE LICENCIAMENTO",
-            "parties": "PARTES",
-            "party_a": "Parte A (Licenciador)",
-            "party_b": "Parte B (Licenciado)",
-            "effective_date": "Data de Vigencia",
-            "term": "Prazo",
-            "territory": "Territorio Licenciado",
-            "consideration": "Contraprestacao",
-            "terms_title": "TERMOS E CONDICOES",
-            "signature": "ASSINATURAS",
-            "terms": [
-                "1. CONCESSAO DE LICENCA: O Licenciador concede ao Licenciado uma licenca nao exclusiva para distribuir o Conteudo.",
-                "2. PRAZO: Este Contrato comecara na Data de Vigencia e continuara pelo periodo especificado.",
-                "3. PAGAMENTO: O Licenciado pagara ao Licenciador o valor da Contraprestacao em 30 dias.",
-                "4. PROPRIEDADE INTELECTUAL: Todos os direitos de propriedade intelectual permanecem com o Licenciador.",
-                "5. CONFIDENCIALIDADE: Ambas as partes concordam em manter a confidencialidade de todas as informacoes.",
-                "6. RESCISAO: Qualquer parte pode rescindir com 90 dias de aviso previo por escrito.",
-            ],
-        },
-    }
-    
-    c = content.get(lang, content["en"])
-    
-    pdf = MultilingualPDF()
-    pdf.add_page()
-    
+def layout_contract(pdf: FPDF, c: dict, f: dict) -> None:
     # Header
-    pdf.set_font("Helvetica", "B", 18)
+    pdf.set_font(pdf.body_font, "B", 18)
     pdf.cell(0, 12, c["title"], ln=True, align="C")
     pdf.ln(5)
     
     # Parties section
-    pdf.set_font("Helvetica", "B", 12)
+    pdf.set_font(pdf.body_font, "B", 12)
     pdf.cell(0, 8, c["parties"], ln=True)
-    pdf.set_font("Helvetica", "", 10)
-    
-    licensors = ["Paramount Media Holdings", "Universal Content Group", "Warner Distribution LLC", "Sony Pictures Entertainment"]
-    licensees = ["Netflix International", "Amazon Prime Video", "Disney+ Worldwide", "HBO Max Global"]
+    pdf.set_font(pdf.body_font, "", 10)
     
     pdf.cell(50, 7, c["party_a"] + ":")
-    pdf.cell(0, 7, random.choice(licensors), ln=True)
+    pdf.cell(0, 7, f["licensor"], ln=True)
     pdf.cell(50, 7, c["party_b"] + ":")
-    pdf.cell(0, 7, random.choice(licensees), ln=True)
+    pdf.cell(0, 7, f["licensee"], ln=True)
     pdf.ln(5)
     
     # Contract details
-    effective_date = datetime.now() - timedelta(days=random.randint(1, 180))
-    term_years = random.choice([1, 2, 3, 5])
-    territories = ["Worldwide", "North America", "Europe", "Asia Pacific", "Latin America"]
-    consideration = random.randint(50, 500) * 10000
-    
-    pdf.set_font("Helvetica", "B", 10)
+    pdf.set_font(pdf.body_font, "B", 10)
     pdf.cell(50, 7, c["effective_date"] + ":")
-    pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 7, effective_date.strftime("%Y-%m-%d"), ln=True)
+    pdf.set_font(pdf.body_font, "", 10)
+    pdf.cell(0, 7, f["effective_date"], ln=True)
     
-    pdf.set_font("Helvetica", "B", 10)
+    pdf.set_font(pdf.body_font, "B", 10)
     pdf.cell(50, 7, c["term"] + ":")
-    pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 7, f"{term_years} year(s)", ln=True)
+    pdf.set_font(pdf.body_font, "", 10)
+    pdf.cell(0, 7, f["term"], ln=True)
     
-    pdf.set_font("Helvetica", "B", 10)
+    pdf.set_font(pdf.body_font, "B", 10)
     pdf.cell(50, 7, c["territory"] + ":")
-    pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 7, random.choice(territories), ln=True)
+    pdf.set_font(pdf.body_font, "", 10)
+    pdf.cell(0, 7, f["territory"], ln=True)
     
-    pdf.set_font("Helvetica", "B", 10)
+    pdf.set_font(pdf.body_font, "B", 10)
     pdf.cell(50, 7, c["consideration"] + ":")
-    pdf.set_font("Helvetica", "", 10)
-    pdf.cell(0, 7, f"${consideration:,} USD", ln=True)
+    pdf.set_font(pdf.body_font, "", 10)
+    pdf.cell(0, 7, f["consideration"], ln=True)
     pdf.ln(10)
     
     # Terms and conditions
-    pdf.set_font("Helvetica", "B", 12)
+    pdf.set_font(pdf.body_font, "B", 12)
     pdf.cell(0, 8, c["terms_title"], ln=True)
     pdf.ln(3)
     
-    pdf.set_font("Helvetica", "", 9)
+    pdf.set_font(pdf.body_font, "", 9)
     for term in c["terms"]:
         pdf.multi_cell(0, 5, term)
         pdf.ln(2)
     
     # Signature block
     pdf.ln(10)
-    pdf.set_font("Helvetica", "B", 12)
+    pdf.set_font(pdf.body_font, "B", 12)
     pdf.cell(0, 8, c["signature"], ln=True)
     pdf.ln(15)
     
-    pdf.set_font("Helvetica", "", 10)
+    pdf.set_font(pdf.body_font, "", 10)
     pdf.cell(90, 5, "_" * 35)
     pdf.cell(10, 5, "")
     pdf.cell(90, 5, "_" * 35, ln=True)
     pdf.cell(90, 5, c["party_a"])
     pdf.cell(10, 5, "")
     pdf.cell(90, 5, c["party_b"], ln=True)
-    
-    filename = f"contract_{lang}_{contract_num:03d}.pdf"
-    filepath = os.path.join(OUTPUT_DIR, filename)
-    pdf.output(filepath)
-    return filename
 
+    # Schedule of licensed titles, from the second page (long contracts only)
+    schedule_rows = table_rows(f, "_media")
+    if schedule_rows:
+        pdf.add_page()
+        pdf.set_font(pdf.body_font, "B", 12)
+        pdf.cell(0, 8, c["schedule"], ln=True)
+        pdf.ln(3)
+        columns = [(15, "#", "C"), (85, c["title_col"], "L"), (55, c["territory"], "L"), (35, c["media"], "C")]
+        table_header(pdf, columns)
+        for i in range(schedule_rows):
+            continue_table(pdf, columns)
+            pdf.cell(15, 7, str(i + 1), border=1, align="C")
+            pdf.cell(85, 7, f[f"schedule_{i}_title"], border=1)
+            pdf.cell(55, 7, f["territory"], border=1)
+            pdf.cell(35, 7, f[f"schedule_{i}_media"], border=1, align="C", ln=True)
 
-def main():
-    """Generate all sample PDFs."""
+
+# ============================================================================
+# DOCUMENT COMPLEXITY
+# ============================================================================
+# Knobs for profiling how parse and extraction cost scale with document size:
+# a page-count distribution (tables grow to fill the drawn page count), raster
+# images per page, and a share of scanned-style documents. Documents that use
+# any of them are rendered directly with fpdf2, since templates only cover
+# the standard single-page layouts.
+
+MAX_PAGES = 100
+# Per kind: pages before the table starts, mm left for rows below the header
+# row on the table's first page, and height of the closing block after it
+TABLE_GEOMETRY = {
+    "invoice": (0, 169, INVOICE_CLOSING_HEIGHT),
+    "royalty": (0, 202, ROYALTY_CLOSING_HEIGHT),
+    "contract": (1, 253, 0),
+}
+# Page body (297 mm less 10 mm top and 15 mm bottom margin) under a repeated header row
+CONTINUED_TABLE_SPACE = 297 - 10 - 15 - 8
+_PAGE_OBJECT = re.compile(rb"/Type /Page\b(?!s)")
+_IMAGE_OBJECT = re.compile(rb"/Subtype /Image\b")
+
+
+class Complexity(NamedTuple):
+    """Corpus-wide complexity settings; the defaults give standard documents."""
+    page_weights: dict = None  # {page count: weight}; None for single-page documents
+    images_per_page: int = 0
+    scanned_share: float = 0.0
+
+
+class DocumentProfile(NamedTuple):
+    """Shape drawn for one document."""
+    pages: int = 1
+    rows: int = None  # table rows; None for the standard table
+    images_per_page: int = 0
+    scanned: bool = False
+
+
+STANDARD_PROFILE = DocumentProfile()
+
+
+def table_size(kind: str, pages: int, rng=random) -> int:
+    """Random table length that makes a document of ``kind`` run to ``pages`` pages."""
+    if pages <= 1:
+        return None
+    lead_pages, first_space, closing_height = TABLE_GEOMETRY[kind]
+
+    def capacity(table_pages: int) -> int:
+        # Most rows that fit on table_pages pages with the closing block after them
+        if not table_pages:
+            return 0
+        spaces = [first_space] + [CONTINUED_TABLE_SPACE] * (table_pages - 1)
+        spaces[-1] -= closing_height
+        return sum(int(space // TABLE_ROW_HEIGHT) for space in spaces)
+
+    table_pages = pages - lead_pages
+    return rng.randint(capacity(table_pages - 1) + 1, capacity(table_pages))
+
+
+def document_profile(kind: str, lang: str, number: int, seed: int = None,
+                     complexity: Complexity = None) -> tuple:
+    """(profile, rng) for one document; the same rng then draws its images."""
+    rng = random if seed is None else random.Random(f"{seed}:{kind}:{lang}:{number}:profile")
+    if complexity is None:
+        return STANDARD_PROFILE, rng
+    pages = 1
+    if complexity.page_weights:
+        pages = rng.choices(list(complexity.page_weights), weights=list(complexity.page_weights.values()))[0]
+    scanned = rng.random() < complexity.scanned_share
+    return DocumentProfile(pages, table_size(kind, pages, rng), complexity.images_per_page, scanned), rng
+
+
+def pdf_page_count(data: bytes) -> int:
+    return len(_PAGE_OBJECT.findall(data))
+
+
+def pdf_image_count(data: bytes) -> int:
+    return len(_IMAGE_OBJECT.findall(data))
+
+
+def document_shape(data: bytes, profile: DocumentProfile) -> dict:
+    """Manifest columns describing the rendered file: actual pages and embedded raster images."""
+    return {
+        "page_count": pdf_page_count(data),
+        "image_count": pdf_image_count(data),
+        "scanned": profile.scanned,
+    }
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+# Each (document kind, language) layout is compiled once per process into a
+# template; documents are produced by stamping their fields into it (see
+# pdf_templates.py). render_direct() is the full fpdf2 path: the reference
+# the templates are benchmarked and checked against, and the renderer for
+# documents with a non-standard profile.
+
+DOCUMENT_KINDS = {
+    "invoice": (INVOICE_CONTENT, invoice_fields, layout_invoice),
+    "royalty": (ROYALTY_CONTENT, royalty_fields, layout_royalty_statement),
+    "contract": (CONTRACT_CONTENT, contract_fields, layout_contract),
+}
+
+_templates = TemplateCache(MultilingualPDF)
+
+
+# Seeded runs fix the reference date and PDF creation date, so the same seed
+# produces byte-identical files on any machine, run order or worker count
+SEEDED_TODAY = datetime(2024, 12, 31)
+SEEDED_INFO = b"<<\n/CreationDate (D:20241231000000Z)\n>>\n"
+
+
+def compiled_template(kind: str, lang: str) -> CompiledTemplate:
+    content, build_fields, layout = DOCUMENT_KINDS[kind]
+    c = content.get(lang, content["en"])
+    field_names = list(build_fields(lang, 0, random.Random(0))[0])
+    # Localized item descriptions and territories are the non-ASCII field values
+    localized_values = [item[0] for item in c.get("items", [])] + c.get("territories", [])
+    charset = "".join(sorted(set("".join(localized_values))))
+    return _templates.get((kind, lang), lambda pdf, fields: layout(pdf, c, fields), field_names,
+                          charset=charset, lang=lang)
+
+
+def render_direct(kind: str, lang: str, fields: dict, profile: DocumentProfile = STANDARD_PROFILE,
+                  rng=random, creation_date: datetime = None) -> bytes:
+    """Lay out and render one document from scratch with fpdf2."""
+    content, _, layout = DOCUMENT_KINDS[kind]
+    pdf = MultilingualPDF(lang, profile.images_per_page, profile.scanned, rng)
+    if creation_date is not None:
+        pdf.set_creation_date(creation_date)
+    # The layouts use fpdf2's deprecated ln= argument, which warns once per call site
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        pdf.add_page()
+        layout(pdf, content.get(lang, content["en"]), fields)
+        return bytes(pdf.output())
+
+
+def document_fields(kind: str, lang: str, number: int, seed: int = None, rows: int = None) -> tuple:
+    """(fields, truth) for one document; seeded values depend only on the seed and the document."""
+    build_fields = DOCUMENT_KINDS[kind][1]
+    if seed is None:
+        return build_fields(lang, number, rows=rows)
+    return build_fields(lang, number, random.Random(f"{seed}:{kind}:{lang}:{number}"), SEEDED_TODAY, rows)
+
+
+def build_document(kind: str, lang: str, number: int, seed: int = None,
+                   complexity: Complexity = None) -> tuple:
+    """Render one document in memory; returns (pdf_bytes, truth)."""
+    profile, rng = document_profile(kind, lang, number, seed, complexity)
+    fields, truth = document_fields(kind, lang, number, seed, profile.rows)
+    if profile == STANDARD_PROFILE:
+        data = compiled_template(kind, lang).stamp(fields, info=SEEDED_INFO if seed is not None else None)
+    else:
+        creation_date = SEEDED_TODAY.replace(tzinfo=timezone.utc) if seed is not None else None
+        data = render_direct(kind, lang, fields, profile, rng, creation_date)
+    return data, {**truth, **document_shape(data, profile)}
+
+
+def document_filename(kind: str, lang: str, number: int) -> str:
+    return f"{kind}_{lang}_{number:03d}.pdf"
+
+
+def generate_document(kind: str, lang: str, number: int, output_dir: str = OUTPUT_DIR,
+                      seed: int = None, complexity: Complexity = None) -> tuple:
+    """Generate one document of ``kind`` in ``lang`` into output_dir; returns (filename, truth)."""
+    data, truth = build_document(kind, lang, number, seed, complexity)
+    filename = save_pdf(data, output_dir, document_filename(kind, lang, number))
+    return filename, {**truth, "file_size_bytes": len(data)}
+
+
+def generate_invoice(lang: str, invoice_num: int, output_dir: str = OUTPUT_DIR) -> str:
+    """Generate an invoice PDF in the specified language."""
+    return generate_document("invoice", lang, invoice_num, output_dir)[0]
+
+
+def generate_royalty_statement(lang: str, stmt_num: int, output_dir: str = OUTPUT_DIR) -> str:
+    """Generate a royalty statement PDF in the specified language."""
+    return generate_document("royalty", lang, stmt_num, output_dir)[0]
+
+
+def generate_contract(lang: str, contract_num: int, output_dir: str = OUTPUT_DIR) -> str:
+    """Generate a contract PDF in the specified language."""
+    return generate_document("contract", lang, contract_num, output_dir)[0]
+
+
+# ============================================================================
+# GROUND-TRUTH MANIFEST
+# ============================================================================
+
+MANIFEST_COLUMNS = [
+    "file_path", "file_name", "language", "seed", "file_size_bytes", "page_count", "image_count", "scanned",
+    "document_type", "total_amount", "currency", "document_date", "vendor_territory", "counterparty",
+]
+MANIFEST_BATCH_ROWS = 10_000
+
+
+def manifest_line(row: dict) -> str:
+    return json.dumps({column: row.get(column) for column in MANIFEST_COLUMNS}, ensure_ascii=False) + "\n"
+
+
+def manifest_row(file_path: str, lang: str, seed: int, truth: dict) -> dict:
+    return {
+        "file_path": file_path,
+        "file_name": os.path.basename(file_path),
+        "language": lang,
+        "seed": seed,
+        **truth,
+    }
+
+
+class ManifestWriter:
+    """Writes ground-truth rows as JSON Lines, or Parquet for a .parquet path."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows_written = 0
+        self._parquet = path.lower().endswith(".parquet")
+        self._pending = []
+        self._writer = None
+        if self._parquet:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise SystemExit("❌ Parquet manifests need pyarrow: pip install pyarrow (or use a .jsonl path)")
+            self._pa, self._pq = pa, pq
+            self._schema = pa.schema([
+                ("file_path", pa.string()), ("file_name", pa.string()), ("language", pa.string()),
+                ("seed", pa.int64()), ("file_size_bytes", pa.int64()), ("page_count", pa.int64()),
+                ("image_count", pa.int64()), ("scanned", pa.bool_()), ("document_type", pa.string()),
+                ("total_amount", pa.float64()), ("currency", pa.string()), ("document_date", pa.string()),
+                ("vendor_territory", pa.string()), ("counterparty", pa.string()),
+            ])
+        else:
+            self._handle = open(path, "w", encoding="utf-8")
+
+    def write(self, row: dict) -> None:
+        self.rows_written += 1
+        if not self._parquet:
+            self._handle.write(manifest_line(row))
+            return
+        self._pending.append(row)
+        if len(self._pending) >= MANIFEST_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, self._schema)
+        self._writer.write_table(self._pa.Table.from_pylist(self._pending, schema=self._schema))
+        self._pending = []
+
+    def close(self) -> None:
+        if not self._parquet:
+            self._handle.close()
+            return
+        if self._pending or self._writer is None:
+            self._flush()
+        self._writer.close()
+
+
+# ============================================================================
+# UPLOAD BUNDLES
+# ============================================================================
+# Writing and PUT-ing one small file per document dominates large runs. In
+# bundle mode documents are rendered in memory and packed into size-bounded
+# zip archives, each carrying a manifest of its documents; a 100k-document
+# corpus becomes a few hundred uploads. UNPACK_DOCUMENT_BUNDLES
+# (sql/02_ingestion) expands uploaded bundles onto the document stage.
+
+BUNDLE_PREFIX = "bundle_"
+BUNDLE_MANIFEST = "manifest.jsonl"
+# Local file header + central directory entry, excluding the name (twice)
+ZIP_ENTRY_OVERHEAD = 30 + 46
+
+
+class BundleWriter:
+    """Packs rendered PDFs into zip bundles of at most ``max_bytes`` each."""
+
+    def __init__(self, bundle_dir: str, max_bytes: int, start_index: int = 0):
+        self.bundle_dir = bundle_dir
+        self.max_bytes = max_bytes
+        self.index = start_index
+        self.bundles_written = 0
+        self._zip = None
+        self._rows = []
+        self._bytes = 0
+
+    def add(self, file_path: str, data: bytes, row: dict) -> None:
+        # Archive bytes this document adds: its entry plus its manifest line
+        size = ZIP_ENTRY_OVERHEAD + 2 * len(file_path.encode()) + len(data) + len(manifest_line(row).encode())
+        if self._zip is not None and self._bytes + size > self.max_bytes:
+            self._seal()
+        if self._zip is None:
+            self._temp_path = self._path() + PARTIAL_SUFFIX
+            # PDF content streams are already deflated; storing avoids recompressing them
+            self._zip = zipfile.ZipFile(self._temp_path, "w", compression=zipfile.ZIP_STORED)
+            self._bytes = ZIP_ENTRY_OVERHEAD + 2 * len(BUNDLE_MANIFEST) + 22  # + end of central directory
+        self._zip.writestr(file_path, data)
+        self._rows.append(row)
+        self._bytes += size
+
+    def _path(self) -> str:
+        return os.path.join(self.bundle_dir, f"{BUNDLE_PREFIX}{self.index:05d}.zip")
+
+    def _seal(self) -> None:
+        self._zip.writestr(BUNDLE_MANIFEST, "".join(manifest_line(row) for row in self._rows))
+        self._zip.close()
+        os.replace(self._temp_path, self._path())
+        self.index += 1
+        self.bundles_written += 1
+        self._zip = None
+        self._rows = []
+        self._bytes = 0
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._seal()
+
+
+def existing_bundles(bundle_dir: str) -> tuple:
+    """Manifest rows of completed bundles keyed by file path, and the next bundle index.
+
+    Leftover partial bundles from a crash are removed.
+    """
+    rows = {}
+    next_index = 0
+    if not os.path.isdir(bundle_dir):
+        return rows, next_index
+    for entry in os.scandir(bundle_dir):
+        if entry.name.endswith(PARTIAL_SUFFIX):
+            os.remove(entry.path)
+        elif entry.name.startswith(BUNDLE_PREFIX) and entry.name.endswith(".zip"):
+            next_index = max(next_index, int(entry.name[len(BUNDLE_PREFIX):-len(".zip")]) + 1)
+            with zipfile.ZipFile(entry.path) as bundle:
+                for line in bundle.read(BUNDLE_MANIFEST).decode("utf-8").splitlines():
+                    row = json.loads(line)
+                    rows[row["file_path"]] = row
+    return rows, next_index
+
+
+# ============================================================================
+# LARGE-CORPUS MODE
+# ============================================================================
+
+SUPPORTED_LANGUAGES = ["en", "es", "de", "pt", *UNICODE_FONTS]
+PROGRESS_EVERY = 1000
+
+
+def parse_language_weights(spec: str) -> dict:
+    """Parse "en=4,es=3,de=2,pt=1" into {"en": 4.0, ...}."""
+    weights = {}
+    for part in spec.split(","):
+        lang, _, weight = part.partition("=")
+        lang = lang.strip()
+        if lang not in SUPPORTED_LANGUAGES:
+            raise argparse.ArgumentTypeError(f"unsupported language {lang!r} (choose from {', '.join(SUPPORTED_LANGUAGES)})")
+        weights[lang] = float(weight or 1)
+    if sum(weights.values()) <= 0:
+        raise argparse.ArgumentTypeError("language weights must sum to more than zero")
+    return weights
+
+
+def parse_page_weights(spec: str) -> dict:
+    """Parse "1=6,2=3,5=1" into {1: 6.0, 2: 3.0, 5: 1.0}."""
+    weights = {}
+    for part in spec.split(","):
+        pages, _, weight = part.partition("=")
+        try:
+            pages, weight = int(pages), float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected PAGES=WEIGHT pairs, got {part!r}") from None
+        if not 1 <= pages <= MAX_PAGES or weight < 0:
+            raise argparse.ArgumentTypeError(f"page counts must be 1-{MAX_PAGES} with non-negative weights")
+        weights[pages] = weight
+    if sum(weights.values()) <= 0:
+        raise argparse.ArgumentTypeError("page weights must sum to more than zero")
+    return weights
+
+
+def allocate(count: int, weights: dict) -> dict:
+    """Split count across languages by weight (largest remainder, so totals are exact)."""
+    total = sum(weights.values())
+    exact = {lang: count * weight / total for lang, weight in weights.items()}
+    counts = {lang: int(value) for lang, value in exact.items()}
+    by_remainder = sorted(exact, key=lambda lang: exact[lang] - counts[lang], reverse=True)
+    for lang in by_remainder[:count - sum(counts.values())]:
+        counts[lang] += 1
+    return counts
+
+
+def plan_corpus(type_counts: dict, weights: dict, shard_size: int) -> list:
+    """Deterministic job list of (doc_kind, lang, number, shard).
+
+    The same arguments always produce the same file names, which is what
+    lets an interrupted run resume.
+    """
+    jobs = []
+    for kind, count in type_counts.items():
+        number = 0
+        for lang, lang_count in allocate(count, weights).items():
+            for _ in range(lang_count):
+                number += 1
+                jobs.append((kind, lang, number, f"shard_{(number - 1) // shard_size:04d}"))
+    return jobs
+
+
+def existing_files(output_dir: str) -> set:
+    """Completed files per shard; leftover partial files from a crash are removed."""
+    completed = set()
+    if not os.path.isdir(output_dir):
+        return completed
+    for shard in os.scandir(output_dir):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            if entry.name.endswith(PARTIAL_SUFFIX):
+                os.remove(entry.path)
+            else:
+                completed.add((shard.name, entry.name))
+    return completed
+
+
+def init_worker(font_dir: str):
+    # Forked workers inherit the parent's random state; reseed so they
+    # do not all render identical documents
+    random.seed()
+    set_font_dir(font_dir)
+
+
+def render_job(output_dir: str, seed: int, complexity: Complexity, job: tuple) -> tuple:
+    """Render one document to its shard; returns (row, render_seconds)."""
+    kind, lang, number, shard = job
+    started = time.perf_counter()
+    filename, truth = generate_document(kind, lang, number, os.path.join(output_dir, shard), seed, complexity)
+    return manifest_row(f"{shard}/{filename}", lang, seed, truth), time.perf_counter() - started
+
+
+def bundle_job(seed: int, complexity: Complexity, job: tuple) -> tuple:
+    """Render one document in memory for bundling; returns (file_path, pdf_bytes, row, render_seconds)."""
+    kind, lang, number, shard = job
+    started = time.perf_counter()
+    data, truth = build_document(kind, lang, number, seed, complexity)
+    file_path = f"{shard}/{document_filename(kind, lang, number)}"
+    row = manifest_row(file_path, lang, seed, {**truth, "file_size_bytes": len(data)})
+    return file_path, data, row, time.perf_counter() - started
+
+
+def existing_row(output_dir: str, seed: int, complexity: Complexity, job: tuple) -> dict:
+    """Manifest row for a file written by an earlier seeded run, without re-rendering it."""
+    kind, lang, number, shard = job
+    file_path = f"{shard}/{document_filename(kind, lang, number)}"
+    profile = document_profile(kind, lang, number, seed, complexity)[0]
+    truth = document_fields(kind, lang, number, seed, profile.rows)[1]
+    with open(os.path.join(output_dir, file_path), "rb") as handle:
+        data = handle.read()
+    truth.update(document_shape(data, profile), file_size_bytes=len(data))
+    return manifest_row(file_path, lang, seed, truth)
+
+
+class LanguageStats:
+    """Per-language document count, pages, output size and worker render time."""
+
+    def __init__(self):
+        self._totals = {}
+
+    def add(self, row: dict, seconds: float) -> None:
+        totals = self._totals.setdefault(row["language"], [0, 0, 0, 0.0])
+        totals[0] += 1
+        totals[1] += row["page_count"]
+        totals[2] += row["file_size_bytes"]
+        totals[3] += seconds
+
+    def report(self) -> None:
+        """Per-language averages; "vs Latin" compares file size with the run's Latin-script documents."""
+        latin = [totals for lang, totals in self._totals.items() if lang not in UNICODE_FONTS]
+        latin_size = sum(totals[2] for totals in latin) / sum(totals[0] for totals in latin) if latin else None
+        print(f"   {'lang':<6}{'docs':>10}{'avg pages':>11}{'avg KB':>10}{'vs Latin':>10}{'docs/sec/worker':>18}")
+        for lang in sorted(self._totals, key=SUPPORTED_LANGUAGES.index):
+            count, pages, size, seconds = self._totals[lang]
+            ratio = f"{size / count / latin_size:.1f}x" if latin_size else "-"
+            print(f"   {lang:<6}{count:>10,}{pages / count:>11.1f}{size / count / 1024:>10.1f}{ratio:>10}"
+                  f"{count / seconds:>18,.1f}")
+
+
+def generate_corpus(args) -> None:
+    """Render a large corpus across a process pool, resuming where a prior run stopped."""
+    type_counts = {"invoice": args.invoices, "royalty": args.royalties, "contract": args.contracts}
+    jobs = plan_corpus(type_counts, args.languages, args.shard_size)
+
+    if args.bundle_mb:
+        bundled, next_bundle = existing_bundles(args.output_dir)
+        done = {tuple(file_path.split("/")) for file_path in bundled}
+        os.makedirs(args.output_dir, exist_ok=True)
+    else:
+        done = existing_files(args.output_dir)
+    pending = [job for job in jobs if (job[3], document_filename(*job[:3])) not in done]
+    if not args.bundle_mb:
+        for shard in sorted({job[3] for job in pending}):
+            os.makedirs(os.path.join(args.output_dir, shard), exist_ok=True)
+
+    print("=" * 60)
+    print("Generating Large PDF Corpus")
+    print("=" * 60)
+    print(f"   Planned:  {len(jobs):,} documents ({', '.join(f'{k}={v:,}' for k, v in type_counts.items())})")
+    print(f"   Existing: {len(jobs) - len(pending):,} (skipped)")
+    print(f"   Workers:  {args.workers}  |  Shard size: {args.shard_size:,}")
+    print(f"   Output:   {args.output_dir}")
+    if args.bundle_mb:
+        print(f"   Bundles:  zip, up to {args.bundle_mb:,} MB each")
+    if args.seed is not None:
+        print(f"   Seed:     {args.seed}")
+    if args.pages or args.images or args.scanned:
+        pages = ",".join(f"{count}={weight:g}" for count, weight in (args.pages or {1: 1}).items())
+        print(f"   Shape:    pages {pages}  |  images/page {args.images}  |  scanned {args.scanned:.0%}")
+    embedded = [lang for lang in args.languages if lang in UNICODE_FONTS]
+    if embedded:
+        print(f"   Fonts:    {args.font_dir} ({', '.join(embedded)})")
+
+    manifest = ManifestWriter(args.manifest) if args.manifest else None
+    # Bundles carry their own manifests, so existing documents are always describable
+    describe_existing = manifest is not None and (args.seed is not None or args.bundle_mb)
+    if manifest and not describe_existing and len(pending) < len(jobs):
+        print("   ⚠️  Unseeded resume: the manifest covers only documents rendered by this run")
+
+    bundles = (BundleWriter(args.output_dir, args.bundle_mb * 1024 * 1024, next_bundle)
+               if args.bundle_mb else None)
+    complexity = Complexity(args.pages, args.images, args.scanned)
+    render = (partial(bundle_job, args.seed, complexity) if bundles
+              else partial(render_job, args.output_dir, args.seed, complexity))
+
+    started = time.perf_counter()
+    rendered = 0
+    stats = LanguageStats()
+    pending_jobs = set(pending)
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                             initargs=(args.font_dir,)) as executor:
+        results = executor.map(render, pending, chunksize=32)
+        # Walk the plan so the manifest is in plan order whether or not the run resumed
+        for job in jobs:
+            if job not in pending_jobs:
+                if describe_existing:
+                    file_path = f"{job[3]}/{document_filename(*job[:3])}"
+                    manifest.write(bundled[file_path] if bundles
+                                   else existing_row(args.output_dir, args.seed, complexity, job))
+                continue
+            if bundles:
+                file_path, data, row, seconds = next(results)
+                bundles.add(file_path, data, row)
+            else:
+                row, seconds = next(results)
+            stats.add(row, seconds)
+            if manifest:
+                manifest.write(row)
+            rendered += 1
+            if rendered % PROGRESS_EVERY == 0 or rendered == len(pending):
+                elapsed = time.perf_counter() - started
+                print(f"   ✓ {rendered:,}/{len(pending):,}  ({rendered / elapsed:,.1f} docs/sec)")
+    if bundles:
+        bundles.close()
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "=" * 60)
+    print(f"Rendered {rendered:,} documents in {elapsed:,.1f}s"
+          + (f" ({rendered / elapsed:,.1f} docs/sec)" if rendered else ""))
+    if rendered:
+        stats.report()
+    if bundles:
+        print(f"Bundles: {bundles.bundles_written:,} written -> {args.output_dir}")
+    if manifest:
+        manifest.close()
+        print(f"Manifest: {manifest.rows_written:,} rows -> {manifest.path}")
+    print("=" * 60)
+    if bundles and bundles.bundles_written:
+        print("\n✅ Upload the bundles and unpack them onto the document stage:")
+        print(f"   PUT file://{os.path.abspath(args.output_dir)}/{BUNDLE_PREFIX}*.zip "
+              "@SNOWFLAKE_EXAMPLE.SWIFTCLAW.BUNDLE_STAGE AUTO_COMPRESS=FALSE PARALLEL=16;")
+        print("   CALL SNOWFLAKE_EXAMPLE.SWIFTCLAW.UNPACK_DOCUMENT_BUNDLES();")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate sample PDFs for the AI document processing demo")
+    corpus = parser.add_argument_group("large-corpus mode (enabled by any document count)")
+    corpus.add_argument("--invoices", type=int, default=0, help="Number of invoices")
+    corpus.add_argument("--royalties", type=int, default=0, help="Number of royalty statements")
+    corpus.add_argument("--contracts", type=int, default=0, help="Number of contracts")
+    corpus.add_argument("--languages", type=parse_language_weights, default=parse_language_weights("en=1,es=1,de=1,pt=1"),
+                        help="Language weights, e.g. en=4,es=3,de=2,pt=1 (default: equal)")
+    corpus.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    corpus.add_argument("--shard-size", type=int, default=1000, help="Documents per shard subdirectory")
+    corpus.add_argument("--output-dir", default=os.path.join(OUTPUT_DIR, "corpus"), help="Corpus output directory")
+    corpus.add_argument("--bundle-mb", type=int, default=0,
+                        help="Render in memory into zip upload bundles of at most this many MB (default: one file per document)")
+    shape = parser.add_argument_group("document complexity (large-corpus mode)")
+    shape.add_argument("--pages", type=parse_page_weights,
+                       help="Page-count weights, e.g. 1=6,2=3,5=1; tables grow to fill each document's pages (default: 1)")
+    shape.add_argument("--images", type=int, default=0, help=f"Raster images per page (0-{MAX_IMAGES_PER_PAGE})")
+    shape.add_argument("--scanned", type=float, default=0.0,
+                       help="Share of documents rendered scanned-style: paper-grain page image, specks, skew (0-1)")
+    parser.add_argument("--font-dir", default=FONT_DIR,
+                        help=f"Fonts for {', '.join(UNICODE_FONTS)} documents (default: ${FONT_DIR_ENV} or ./fonts)")
+    parser.add_argument("--seed", type=int, help="Make output byte-reproducible: same seed, same files")
+    parser.add_argument("--manifest", help="Write ground-truth fields per file to this .jsonl or .parquet path")
+    args = parser.parse_args()
+    if min(args.invoices, args.royalties, args.contracts, args.bundle_mb) < 0 or args.shard_size < 1 or args.workers < 1:
+        parser.error("counts and --bundle-mb must be >= 0; --shard-size and --workers must be >= 1")
+    if not 0 <= args.images <= MAX_IMAGES_PER_PAGE or not 0 <= args.scanned <= 1:
+        parser.error(f"--images must be 0-{MAX_IMAGES_PER_PAGE} and --scanned 0-1")
+    if (args.pages or args.images or args.scanned) and not (args.invoices or args.royalties or args.contracts):
+        parser.error("--pages, --images and --scanned apply to large-corpus mode; add a document count")
+    # Check fonts up front rather than failing in every worker
+    set_font_dir(args.font_dir)
+    for lang in args.languages:
+        if lang in UNICODE_FONTS:
+            try:
+                unicode_font_files(lang)
+            except FileNotFoundError as exc:
+                parser.error(str(exc))
+    return args
+
+
+def generate_sample_set(seed: int = None, manifest_path: str = None):
+    """Generate the demo's sample PDFs."""
     
     # Create output directory
     os.makedirs(OUTPUT_DIR, exist_ok=True)
+    manifest = ManifestWriter(manifest_path) if manifest_path else None
     
     print("=" * 60)
     print("Generating Sample PDFs for AI Document Processing Demo")
@@ -536,14 +1730,15 @@ def main():
     
     generated_files = []
     
-    # Languages to generate (excluding ru/zh which need special font handling)
-    languages = ["en", "es", "de", "pt"]
-    
+    # The sample set sticks to Latin-script languages, which need no font files;
+    # use large-corpus mode with --languages for ru/zh/ja/ko
     # Generate Invoices (6 total: 2 en, 2 es, 1 de, 1 pt)
     print("\n📄 Generating Invoices...")
     invoice_distribution = [("en", 1), ("en", 2), ("es", 3), ("es", 4), ("de", 5), ("pt", 6)]
     for lang, num in invoice_distribution:
-        filename = generate_invoice(lang, num)
+        filename, truth = generate_document("invoice", lang, num, OUTPUT_DIR, seed)
+        if manifest:
+            manifest.write(manifest_row(filename, lang, seed, truth))
         generated_files.append(("Invoice", lang, filename))
         print(f"   ✓ {filename}")
     
@@ -551,7 +1746,9 @@ def main():
     print("\n💰 Generating Royalty Statements...")
     royalty_distribution = [("en", 1), ("en", 2), ("es", 3), ("es", 4), ("de", 5), ("pt", 6)]
     for lang, num in royalty_distribution:
-        filename = generate_royalty_statement(lang, num)
+        filename, truth = generate_document("royalty", lang, num, OUTPUT_DIR, seed)
+        if manifest:
+            manifest.write(manifest_row(filename, lang, seed, truth))
         generated_files.append(("Royalty Statement", lang, filename))
         print(f"   ✓ {filename}")
     
@@ -559,7 +1756,9 @@ def main():
     print("\n📝 Generating Contracts...")
     contract_distribution = [("en", 1), ("en", 2), ("es", 3), ("es", 4), ("de", 5), ("pt", 6)]
     for lang, num in contract_distribution:
-        filename = generate_contract(lang, num)
+        filename, truth = generate_document("contract", lang, num, OUTPUT_DIR, seed)
+        if manifest:
+            manifest.write(manifest_row(filename, lang, seed, truth))
         generated_files.append(("Contract", lang, filename))
         print(f"   ✓ {filename}")
     
@@ -567,6 +1766,9 @@ def main():
     print("\n" + "=" * 60)
     print(f"Generated {len(generated_files)} PDF documents")
     print(f"Output directory: {OUTPUT_DIR}")
+    if manifest:
+        manifest.close()
+        print(f"Manifest: {manifest.path}")
     print("=" * 60)
     
     print("\n📊 Summary by Type:")
@@ -585,6 +1787,14 @@ def main():
     print(f"   PUT file://{OUTPUT_DIR}/*.pdf @SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE AUTO_COMPRESS=FALSE;")
 
 
+def main():
+    args = parse_args()
+    if args.invoices or args.royalties or args.contracts:
+        generate_corpus(args)
+    else:
+        generate_sample_set(args.seed, args.manifest)
+
+
 if __name__ == "__main__":
     main()
 
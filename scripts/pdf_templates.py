@@ -0,0 +1,463 @@
+"""
+Compiled PDF Templates for the Sample Document Generator
+
+Rendering a document with fpdf2 lays out every static cell (titles, labels,
+table headers, terms) again for each file, although only a handful of
+fields differ between documents. A CompiledTemplate renders the layout once
+with placeholder tokens, keeps the resulting PDF objects, and produces each
+later document by stamping the real field values into the pre-rendered
+content stream and re-serializing the file.
+
+Stamping keeps fpdf2's output exact: every variable cell remembers its
+geometry, alignment and font metrics, so the text is positioned where fpdf2
+would have put it. Layouts that change with the data (page breaks, row
+counts) must be rendered directly.
+
+Embedded TrueType/OpenType fonts are subset once, when the template is
+compiled: the subset holds the layout's own glyphs plus a field character
+set (printable ASCII and any extra characters the caller names), and field
+values are stamped as subset glyph codes. Each document then embeds that
+program cut down to the glyphs it actually shows: unused glyph outlines are
+emptied in place, so glyph ids, widths and the ToUnicode map stay valid and
+no font parsing or subsetting happens per document.
+
+Author: SE Community
+"""
+
+import hashlib
+import io
+import re
+import string
+import struct
+import zlib
+
+from fontTools import ttLib
+
+TOKEN = re.compile(r"@@(\w+)@@")
+
+_OBJECT = re.compile(rb"(\d+) 0 obj\n(.*?)endobj\n", re.DOTALL)
+_STREAM = re.compile(rb"<<\n/Length \d+\n>>\nstream\n(.*?)\nendstream\n", re.DOTALL)
+_TEXT_SHOW = re.compile(rb"BT ([-\d.]+) ([-\d.]+) Td ((?:[^()]*? )?)\(((?:[^()\\]|\\.)*)\) Tj ET")
+_TRAILER = re.compile(rb"/Root (\d+) 0 R\n/Info (\d+) 0 R")
+_FONT_RESOURCE = re.compile(rb"/(F\d+) (\d+) 0 R")
+_DESCENDANT_FONT = re.compile(rb"/DescendantFonts \[(\d+) 0 R\]")
+_CID_TO_GID_MAP = re.compile(rb"/CIDToGIDMap (\d+) 0 R")
+_FONT_DESCRIPTOR = re.compile(rb"/FontDescriptor (\d+) 0 R")
+_FONT_FILE2_REF = re.compile(rb"/FontFile2 (\d+) 0 R")
+_FLATE_STREAM = re.compile(rb"/FlateDecode\n/Length \d+\n(?:/Length1 \d+\n)?>>\nstream\n(.*)\nendstream\n", re.DOTALL)
+# A font selection or a string literal (only text operators take strings)
+_FONT_OR_STRING = re.compile(rb"/(F\d+) [-\d.]+ Tf|\(((?:[^()\\]|\\.)*)\)")
+_STRING_ESCAPE = re.compile(rb"\\(.)", re.DOTALL)
+
+PDF_HEADER = b"%PDF-1.3\n%\xe9\xeb\xf1\xbf\n"
+
+# Characters every embedded-font subset keeps available for field values
+FIELD_CHARACTERS = "".join(char for char in string.printable if char.isprintable())
+
+
+def placeholder(name: str) -> str:
+    return f"@@{name}@@"
+
+
+def escape_pdf_string(raw: bytes) -> bytes:
+    # Same escaping fpdf2 applies to text strings
+    return raw.replace(b"\\", b"\\\\").replace(b")", b"\\)").replace(b"(", b"\\(").replace(b"\r", b"\\r")
+
+
+def escape_pdf_text(text: str) -> bytes:
+    return escape_pdf_string(text.encode("latin-1"))
+
+
+def unescape_pdf_string(escaped: bytes) -> bytes:
+    return _STRING_ESCAPE.sub(lambda match: b"\r" if match.group(1) == b"r" else match.group(1), escaped)
+
+
+def _glyph_codes(glyph_string: bytes) -> list:
+    """Split an Identity-H string into its 2-byte glyph codes."""
+    return [glyph_string[i:i + 2] for i in range(0, len(glyph_string), 2)]
+
+
+def _uint16(data: bytes, offset: int) -> int:
+    return int.from_bytes(data[offset:offset + 2], "big")
+
+
+def _checksum(data: bytes) -> int:
+    data += b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+
+class _FontProgram:
+    """An embedded TrueType subset, cut down per document to the glyphs it shows.
+
+    Unused glyphs are emptied rather than removed, so glyph ids do not
+    change and the template's CIDToGIDMap, widths and ToUnicode map apply
+    unchanged. Glyph data is split once here; trimming only concatenates.
+    """
+
+    def __init__(self, program: bytes, cid_to_gid: bytes):
+        font = ttLib.TTFont(io.BytesIO(program), recalcTimestamp=False)
+        self._tables = {tag: font.reader[tag] for tag in font.reader.keys() if tag not in ("glyf", "loca")}
+        head = bytearray(self._tables["head"])
+        head[8:12] = bytes(4)  # checkSumAdjustment, recomputed per document
+        self._tables["head"] = bytes(head)
+        self._long_offsets = _uint16(head, 50) == 1
+        glyf, loca = font.reader["glyf"], font.reader["loca"]
+        if self._long_offsets:
+            offsets = [int.from_bytes(loca[i:i + 4], "big") for i in range(0, len(loca), 4)]
+        else:
+            offsets = [_uint16(loca, i) * 2 for i in range(0, len(loca), 2)]
+        self._glyphs = [glyf[start:end] for start, end in zip(offsets, offsets[1:])]
+        self._components = {gid: self._component_gids(data) for gid, data in enumerate(self._glyphs)
+                            if data and int.from_bytes(data[:2], "big", signed=True) < 0}
+        self._cid_to_gid = cid_to_gid
+
+    @staticmethod
+    def _component_gids(data: bytes) -> list:
+        """Glyph ids referenced by a composite glyph."""
+        gids = []
+        position = 10
+        more = True
+        while more:
+            flags = _uint16(data, position)
+            gids.append(_uint16(data, position + 2))
+            position += 4 + (4 if flags & 0x0001 else 2)
+            if flags & 0x0008:
+                position += 2
+            elif flags & 0x0040:
+                position += 4
+            elif flags & 0x0080:
+                position += 8
+            more = flags & 0x0020
+        return gids
+
+    def trimmed(self, codes: set) -> bytes:
+        """The font program keeping only the glyphs for ``codes`` (2-byte CIDs)."""
+        keep = {0}
+        pending = [_uint16(self._cid_to_gid, int.from_bytes(code, "big") * 2) for code in codes]
+        while pending:
+            gid = pending.pop()
+            if gid not in keep:
+                keep.add(gid)
+                pending.extend(self._components.get(gid, ()))
+
+        glyf = bytearray()
+        offsets = [0]
+        for gid, data in enumerate(self._glyphs):
+            if gid in keep:
+                glyf += data + b"\0" * (-len(data) % (4 if self._long_offsets else 2))
+            offsets.append(len(glyf))
+        if self._long_offsets:
+            loca = b"".join(offset.to_bytes(4, "big") for offset in offsets)
+        else:
+            loca = b"".join((offset // 2).to_bytes(2, "big") for offset in offsets)
+        return self._sfnt({**self._tables, "glyf": bytes(glyf), "loca": loca})
+
+    @staticmethod
+    def _sfnt(tables: dict) -> bytes:
+        """Serialize an sfnt file with table checksums and head.checkSumAdjustment."""
+        count = len(tables)
+        power = 1 << (count.bit_length() - 1)
+        header = (0x00010000).to_bytes(4, "big") + b"".join(
+            value.to_bytes(2, "big")
+            for value in (count, power * 16, power.bit_length() - 1, count * 16 - power * 16)
+        )
+        records = []
+        body = []
+        offset = len(header) + 16 * count
+        head_offset = None
+        for tag in sorted(tables):
+            data = tables[tag]
+            if tag == "head":
+                head_offset = offset
+            records.append(tag.encode("latin-1") + b"".join(
+                value.to_bytes(4, "big") for value in (_checksum(data), offset, len(data))
+            ))
+            padded = data + b"\0" * (-len(data) % 4)
+            body.append(padded)
+            offset += len(padded)
+        program = bytearray(header + b"".join(records) + b"".join(body))
+        adjustment = (0xB1B0AFBA - _checksum(bytes(program))) & 0xFFFFFFFF
+        program[head_offset + 8:head_offset + 12] = adjustment.to_bytes(4, "big")
+        return bytes(program)
+
+
+class _Slot:
+    """A variable cell: its text pattern and everything needed to place and encode it.
+
+    ``glyph_codes`` maps characters to subset codes for an embedded font and
+    is None for core fonts, whose text is written as latin-1.
+    """
+
+    __slots__ = ("pattern", "x", "width", "align", "margin", "char_widths", "size", "glyph_codes")
+
+    def __init__(self, pattern, x, width, align, margin, char_widths, size, glyph_codes=None):
+        self.pattern = pattern
+        self.x = x
+        self.width = width
+        self.align = align
+        self.margin = margin
+        self.char_widths = char_widths
+        self.size = size
+        self.glyph_codes = glyph_codes
+
+    def glyph_string(self, text: str) -> bytes:
+        """Unescaped subset glyph codes of ``text`` (embedded fonts only)."""
+        try:
+            return b"".join(self.glyph_codes[char] for char in text)
+        except KeyError as exc:
+            raise ValueError(f"Character {exc.args[0]!r} is not in the template's font subset") from None
+
+    def encode(self, text: str) -> bytes:
+        if self.glyph_codes is None:
+            return escape_pdf_text(text)
+        return escape_pdf_string(self.glyph_string(text))
+
+    def text_x(self, text: str) -> float:
+        if self.align == "L":
+            return self.x + self.margin
+        text_width = sum(self.char_widths.get(char, 0) for char in text) * self.size / 1000
+        if self.align == "R":
+            return self.x + self.width - self.margin - text_width
+        return self.x + (self.width - text_width) / 2
+
+
+def recording_pdf_class(base: type, charset: str = "") -> type:
+    """Subclass of ``base`` that records the geometry of cells holding placeholders.
+
+    ``charset`` names characters beyond printable ASCII that field values
+    may contain; they are kept in the subset of any embedded font.
+    """
+
+    class TemplateRecorder(base):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.set_compression(False)
+            self.slots = {}
+            self.encoded_slots = {}
+            self._glyph_codes = {}
+
+        def _embedded_font_codes(self) -> dict:
+            """Character -> subset code map for the current embedded font (filled in output())."""
+            font = self.current_font
+            if font.fontkey not in self._glyph_codes:
+                for char in FIELD_CHARACTERS + charset:
+                    font.subset.pick(ord(char))
+                self._glyph_codes[font.fontkey] = {}
+            return self._glyph_codes[font.fontkey]
+
+        def cell(self, w=None, h=None, text="", *args, **kwargs):
+            text = kwargs.pop("txt", text)
+            match = TOKEN.search(text or "")
+            if match:
+                width = self.w - self.r_margin - self.x if not w else w
+                align = kwargs.get("align", "L")
+                align = getattr(align, "value", align)[:1].upper()
+                if align not in ("L", "R", "C"):
+                    raise ValueError(f"Unsupported alignment for a template field: {align}")
+                font = self.current_font
+                if font.type == "TTF":
+                    glyph_codes = self._embedded_font_codes()
+                    char_widths = {char: font.cw[ord(char)] for char in FIELD_CHARACTERS + charset + text}
+                else:
+                    glyph_codes, char_widths = None, font.cw
+                slot = _Slot(
+                    text, self.x * self.k, width * self.k, align, self.c_margin * self.k,
+                    char_widths, self.font_size_pt, glyph_codes
+                )
+                self.slots[match.group(1)] = slot
+                # The exact string fpdf2 writes for this cell identifies its text-show op
+                encoded = font.encode_text(text)
+                self.encoded_slots[encoded[1:-len(") Tj")].encode("latin-1")] = slot
+            return super().cell(w, h, text, *args, **kwargs)
+
+        def output(self, *args, **kwargs):
+            result = super().output(*args, **kwargs)
+            for fontkey, glyph_codes in self._glyph_codes.items():
+                for glyph, code in self.fonts[fontkey].subset.items():
+                    if glyph is not None and glyph.unicode:
+                        glyph_codes[chr(glyph.unicode[0])] = code.to_bytes(2, "big")
+            return result
+
+    return TemplateRecorder
+
+
+class CompiledTemplate:
+    """A pre-rendered document layout that is stamped with field values."""
+
+    def __init__(self, pdf_bytes: bytes, slots: dict):
+        bodies = {int(number): body for number, body in _OBJECT.findall(pdf_bytes)}
+        font_files = self._embedded_font_files(bodies)
+        # Glyph codes the static text shows, per font resource name
+        self._static_codes = {name: set() for name, _ in font_files.values()}
+        self._objects = []
+        for number, body in bodies.items():
+            stream = _STREAM.fullmatch(body)
+            if stream:
+                body = self._compile_stream(stream.group(1), slots, self._static_codes)
+            elif number in font_files:
+                name, cid_to_gid = font_files[number]
+                program = zlib.decompress(_FLATE_STREAM.search(body).group(1))
+                body = (name, _FontProgram(self._strip_font_hinting(program), cid_to_gid))
+            self._objects.append((number, body))
+        root, info = _TRAILER.search(pdf_bytes).groups()
+        self._root, self._info = int(root), int(info)
+
+    @staticmethod
+    def _embedded_font_files(bodies: dict) -> dict:
+        """FontFile2 object number -> (font resource name, CIDToGIDMap) for embedded fonts."""
+        font_files = {}
+        for name, number in set(_FONT_RESOURCE.findall(b"".join(bodies.values()))):
+            descendant = _DESCENDANT_FONT.search(bodies[int(number)])
+            if descendant is None:
+                continue  # core font, nothing embedded
+            cid_font = bodies[int(descendant.group(1))]
+            descriptor = bodies[int(_FONT_DESCRIPTOR.search(cid_font).group(1))]
+            font_file = _FONT_FILE2_REF.search(descriptor)
+            if font_file is None:
+                continue  # not a TrueType program; embedded unchanged
+            cid_map = bodies[int(_CID_TO_GID_MAP.search(cid_font).group(1))]
+            font_files[int(font_file.group(1))] = (
+                name.decode(), zlib.decompress(_FLATE_STREAM.search(cid_map).group(1))
+            )
+        return font_files
+
+    @classmethod
+    def compile(cls, pdf_class: type, layout, field_names, charset: str = "",
+                **pdf_kwargs) -> "CompiledTemplate":
+        """Render ``layout(pdf, fields)`` once with a placeholder for every field."""
+        pdf = recording_pdf_class(pdf_class, charset)(**pdf_kwargs)
+        pdf.add_page()
+        layout(pdf, {name: placeholder(name) for name in field_names})
+        template = cls(bytes(pdf.output()), pdf.encoded_slots)
+        missing = set(field_names) - set(pdf.slots)
+        if missing:
+            raise ValueError(f"Fields not drawn with cell(): {', '.join(sorted(missing))}")
+        return template
+
+    @staticmethod
+    def _strip_font_hinting(program: bytes) -> bytes:
+        """Drop TrueType hinting and unused tables from an embedded font subset (FontFile2 program).
+
+        Hinting only improves low-resolution screen rendering and is often
+        more than half of a subset's size. Done once per template.
+        """
+        font = ttLib.TTFont(io.BytesIO(program), recalcTimestamp=False)
+        # name and gasp are not read from fonts embedded as CIDFontType2
+        for tag in ("fpgm", "prep", "cvt ", "hdmx", "LTSH", "VDMX", "name", "gasp"):
+            if tag in font:
+                del font[tag]
+        glyphs = font["glyf"]
+        for name in font.getGlyphOrder():
+            glyphs[name].removeHinting()
+        output = io.BytesIO()
+        font.save(output)
+        return output.getvalue()
+
+    @staticmethod
+    def _compile_stream(stream: bytes, encoded_slots: dict, static_codes: dict) -> list:
+        """Split a content stream into static bytes and variable text-show ops.
+
+        Each variable op records the font resource it is drawn with. Glyph
+        codes of static text in embedded fonts are added to ``static_codes``.
+        """
+        parts = []
+        position = 0
+        for match in _TEXT_SHOW.finditer(stream):
+            slot = encoded_slots.get(match.group(4))
+            if slot is None:
+                continue
+            parts.append(stream[position:match.start()])
+            parts.append((slot, match.group(2), match.group(3)))
+            position = match.end()
+        parts.append(stream[position:])
+
+        font = None
+        for index, part in enumerate(parts):
+            if not isinstance(part, bytes):
+                parts[index] = part + (font,)
+                continue
+            for match in _FONT_OR_STRING.finditer(part):
+                if match.group(1) is not None:
+                    font = match.group(1).decode()
+                elif font in static_codes:
+                    static_codes[font].update(_glyph_codes(unescape_pdf_string(match.group(2))))
+        return parts
+
+    def _stamp_stream(self, parts: list, fields: dict, used_codes: dict) -> bytes:
+        """Stamp one content stream, adding the glyph codes of embedded-font fields to ``used_codes``."""
+        chunks = []
+        for part in parts:
+            if isinstance(part, bytes):
+                chunks.append(part)
+                continue
+            slot, y, operators, font = part
+            text = TOKEN.sub(lambda match: str(fields[match.group(1)]), slot.pattern)
+            if slot.glyph_codes is None:
+                encoded = slot.encode(text)
+            else:
+                glyph_string = slot.glyph_string(text)
+                used_codes[font].update(_glyph_codes(glyph_string))
+                encoded = escape_pdf_string(glyph_string)
+            chunks.append(b"BT %.2f %s Td %s(%s) Tj ET" % (slot.text_x(text), y, operators, encoded))
+        return b"".join(chunks)
+
+    def stamp(self, fields: dict, info: bytes = None) -> bytes:
+        """Serialize a complete PDF with ``fields`` stamped in.
+
+        ``info`` optionally replaces the document information dictionary
+        (e.g. a fixed CreationDate for reproducible output).
+        """
+        # Content streams first: they decide which glyphs each font keeps
+        used_codes = {font: set(codes) for font, codes in self._static_codes.items()}
+        streams = {
+            number: zlib.compress(self._stamp_stream(body, fields, used_codes))
+            for number, body in self._objects if isinstance(body, list)
+        }
+
+        out = [PDF_HEADER]
+        size = len(PDF_HEADER)
+        offsets = []
+        digest = hashlib.md5()
+
+        for number, body in self._objects:
+            if isinstance(body, list):
+                stream = streams[number]
+                digest.update(stream)
+                body = b"<<\n/Filter /FlateDecode\n/Length %d\n>>\nstream\n%s\nendstream\n" % (len(stream), stream)
+            elif isinstance(body, tuple):
+                font, program = body
+                program = program.trimmed(used_codes[font])
+                data = zlib.compress(program)
+                body = b"<<\n/Filter /FlateDecode\n/Length %d\n/Length1 %d\n>>\nstream\n%s\nendstream\n" % (
+                    len(data), len(program), data
+                )
+            elif number == self._info and info is not None:
+                body = info
+            chunk = b"%d 0 obj\n%sendobj\n" % (number, body)
+            offsets.append(size)
+            out.append(chunk)
+            size += len(chunk)
+
+        document_id = digest.hexdigest().upper().encode()
+        out.append(b"xref\n0 %d\n0000000000 65535 f \n" % (len(offsets) + 1))
+        out.extend(b"%010d 00000 n \n" % offset for offset in offsets)
+        out.append(
+            b"trailer\n<<\n/Size %d\n/Root %d 0 R\n/Info %d 0 R\n/ID [<%s><%s>]\n>>\nstartxref\n%d\n%%%%EOF\n"
+            % (len(offsets) + 1, self._root, self._info, document_id, document_id, size)
+        )
+        return b"".join(out)
+
+
+class TemplateCache:
+    """Per-process cache of compiled templates keyed by (document kind, language)."""
+
+    def __init__(self, pdf_class: type):
+        self._pdf_class = pdf_class
+        self._templates = {}
+
+    def get(self, key, layout, field_names, charset: str = "", **pdf_kwargs) -> CompiledTemplate:
+        template = self._templates.get(key)
+        if template is None:
+            template = CompiledTemplate.compile(self._pdf_class, layout, field_names, charset, **pdf_kwargs)
+            self._templates[key] = template
+        return template
@@ -10,6 +10,9 @@
  *
  * OBJECTS CREATED:
  *   - SNOWFLAKE_EXAMPLE.SWIFTCLAW (schema)
+ *   - SWIFTCLAW.DOCUMENT_STAGE (document files)
+ *   - SWIFTCLAW.EXPORT_STAGE (dashboard exports)
+ *   - SWIFTCLAW.BUNDLE_STAGE (zipped document upload bundles)
  *
  * CLEANUP:
  *   See sql/99_cleanup/teardown_all.sql
@@ -42,7 +45,30 @@ CREATE STAGE IF NOT EXISTS SWIFTCLAW.DOCUMENT_STAGE
     DIRECTORY = (ENABLE = TRUE)
     COMMENT = 'DEMO: swiftclaw - Internal stage for document files (PDF, DOCX, etc.) | Expires: 2026-02-20 | Author: SE Community';
 
--- Verify stage created successfully
+-- ============================================================================
+-- EXPORT STAGE: Server-side unload target for dashboard exports
+-- ============================================================================
+
+-- Large dashboard exports are unloaded here with COPY INTO and downloaded
+-- through presigned URLs (GET_PRESIGNED_URL requires SNOWFLAKE_SSE)
+CREATE STAGE IF NOT EXISTS SWIFTCLAW.EXPORT_STAGE
+    ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
+    DIRECTORY = (ENABLE = TRUE)
+    COMMENT = 'DEMO: swiftclaw - Unload target for dashboard exports (CSV/Parquet) | Expires: 2026-02-20 | Author: SE Community';
+
+-- ============================================================================
+-- BUNDLE STAGE: Bulk upload landing area
+-- ============================================================================
+
+-- Large generated corpora are uploaded as zip bundles (see
+-- scripts/generate_sample_pdfs.py --bundle-mb) and expanded onto
+-- DOCUMENT_STAGE by UNPACK_DOCUMENT_BUNDLES (sql/02_ingestion)
+CREATE STAGE IF NOT EXISTS SWIFTCLAW.BUNDLE_STAGE
+    ENCRYPTION = (TYPE = 'SNOWFLAKE_SSE')
+    DIRECTORY = (ENABLE = TRUE)
+    COMMENT = 'DEMO: swiftclaw - Zipped document upload bundles | Expires: 2026-02-20 | Author: SE Community';
+
+-- Verify stages created successfully
 SHOW STAGES IN SCHEMA SWIFTCLAW;
 
 -- ============================================================================
@@ -0,0 +1,127 @@
+/*******************************************************************************
+ * DEMO PROJECT: AI Document Processing for Entertainment Industry
+ * Script: Bulk Document Ingestion from Upload Bundles
+ *
+ * NOT FOR PRODUCTION USE - EXAMPLE IMPLEMENTATION ONLY
+ *
+ * PURPOSE:
+ *   Expand zipped document bundles into the document stage. Large generated
+ *   corpora (scripts/generate_sample_pdfs.py --bundle-mb) are uploaded as a
+ *   few hundred size-bounded zip files instead of one PUT per document; this
+ *   procedure unpacks each new bundle onto DOCUMENT_STAGE/generated/, where
+ *   the document catalog picks the PDFs up as usual.
+ *
+ * OBJECTS CREATED:
+ *   - DOCUMENT_BUNDLE_LOG (table): Bundles already unpacked
+ *   - UNPACK_DOCUMENT_BUNDLES (procedure)
+ *
+ * USAGE:
+ *   PUT file:///tmp/swiftclaw_bundles/bundle_*.zip
+ *       @SNOWFLAKE_EXAMPLE.SWIFTCLAW.BUNDLE_STAGE AUTO_COMPRESS=FALSE PARALLEL=16;
+ *   CALL SNOWFLAKE_EXAMPLE.SWIFTCLAW.UNPACK_DOCUMENT_BUNDLES();
+ *
+ *   Re-running the call is safe: bundles are logged by path and MD5, and only
+ *   new or changed bundles are unpacked.
+ *
+ * REQUIREMENTS:
+ *   - SWIFTCLAW.BUNDLE_STAGE and SWIFTCLAW.DOCUMENT_STAGE (sql/01_setup)
+ *
+ * Author: SE Community
+ * Created: 2026-02-17 | Expires: 2026-02-20
+ ******************************************************************************/
+
+USE ROLE ACCOUNTADMIN;
+USE DATABASE SNOWFLAKE_EXAMPLE;
+USE SCHEMA SWIFTCLAW;
+USE WAREHOUSE SFE_DOCUMENT_AI_WH;
+
+-- ============================================================================
+-- BUNDLE LOG
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS DOCUMENT_BUNDLE_LOG (
+    bundle_path STRING,
+    bundle_md5 STRING,
+    bundle_size_bytes NUMBER,
+    document_count NUMBER,
+    unpacked_at TIMESTAMP_NTZ
+)
+COMMENT = 'DEMO: swiftclaw - Upload bundles unpacked onto the document stage | Expires: 2026-02-20 | Author: SE Community';
+
+-- ============================================================================
+-- UNPACK PROCEDURE
+-- ============================================================================
+-- Each bundle is read from the stage with SnowflakeFile, extracted to the
+-- procedure's scratch space, and uploaded one PUT per shard directory
+-- (hundreds of files per call) rather than one per document. Bundles keep
+-- their shard_NNNN/ paths, so DOCUMENT_STAGE/generated/ mirrors the local
+-- corpus layout and the catalog classifies files by name as usual.
+
+CREATE OR REPLACE PROCEDURE UNPACK_DOCUMENT_BUNDLES()
+RETURNS STRING
+LANGUAGE PYTHON
+RUNTIME_VERSION = '3.11'
+PACKAGES = ('snowflake-snowpark-python')
+HANDLER = 'unpack_bundles'
+EXECUTE AS OWNER
+AS
+$$
+import os
+import shutil
+import tempfile
+import zipfile
+
+from snowflake.snowpark.files import SnowflakeFile
+
+DOCUMENT_TARGET = "@SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE/generated"
+
+
+def unpack_bundles(session):
+    session.sql("ALTER STAGE SNOWFLAKE_EXAMPLE.SWIFTCLAW.BUNDLE_STAGE REFRESH").collect()
+    bundles = session.sql("""
+        SELECT
+            d.relative_path,
+            d.md5,
+            d.size,
+            BUILD_SCOPED_FILE_URL(@SNOWFLAKE_EXAMPLE.SWIFTCLAW.BUNDLE_STAGE, d.relative_path) AS file_url
+        FROM DIRECTORY(@SNOWFLAKE_EXAMPLE.SWIFTCLAW.BUNDLE_STAGE) d
+        LEFT JOIN SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_BUNDLE_LOG l
+            ON l.bundle_path = d.relative_path
+           AND l.bundle_md5 = d.md5
+        WHERE LOWER(d.relative_path) LIKE '%.zip'
+          AND l.bundle_path IS NULL
+        ORDER BY d.relative_path
+    """).collect()
+
+    documents = 0
+    for bundle in bundles:
+        workdir = tempfile.mkdtemp()
+        try:
+            with SnowflakeFile.open(bundle["FILE_URL"], "rb") as handle:
+                with zipfile.ZipFile(handle) as archive:
+                    names = [name for name in archive.namelist() if name.lower().endswith(".pdf")]
+                    archive.extractall(workdir, members=names)
+
+            for directory in sorted({os.path.dirname(name) for name in names}):
+                target = f"{DOCUMENT_TARGET}/{directory}/" if directory else f"{DOCUMENT_TARGET}/"
+                session.file.put(
+                    os.path.join(workdir, directory, "*.pdf"), target,
+                    auto_compress=False, overwrite=True
+                )
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        session.sql(
+            "INSERT INTO SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_BUNDLE_LOG "
+            "SELECT ?, ?, ?, ?, CURRENT_TIMESTAMP()::TIMESTAMP_NTZ",
+            params=[bundle["RELATIVE_PATH"], bundle["MD5"], bundle["SIZE"], len(names)]
+        ).collect()
+        documents += len(names)
+
+    if documents:
+        session.sql("ALTER STAGE SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE REFRESH").collect()
+    return f"Unpacked {documents} documents from {len(bundles)} bundles"
+$$;
+
+-- Verify procedure created successfully
+SHOW PROCEDURES LIKE 'UNPACK_DOCUMENT_BUNDLES' IN SCHEMA SWIFTCLAW;
@@ -6,7 +6,7 @@
  *
  * PURPOSE:
  *   Remove all objects created by this demo, including:
- *   - Project schema: SWIFTCLAW (dynamic tables, views, stage, Streamlit)
+ *   - Project schema: SWIFTCLAW (dynamic tables, views, stages, Streamlit)
  *   - Git repository stage
  *   - Dedicated warehouse
  *   - API integration
@@ -22,7 +22,7 @@
  *   2. Open Snowsight: https://app.snowflake.com
  *   3. Create new worksheet: Click "+" then "SQL Worksheet"
  *   4. Paste the entire script (Ctrl+V or Cmd+V)
- *   5. REVIEW the warning summary below (lines 47-62)
+ *   5. REVIEW the warning summary below (lines 54-86)
  *   6. Click "Run All"
  *   7. All demo objects will be deleted immediately
  *   8. No undo available - objects are permanently removed
@@ -57,9 +57,21 @@ USE ROLE ACCOUNTADMIN;
 --
 -- When you click "Run All", these objects will be IMMEDIATELY deleted:
 --   - Streamlit app: SFE_DOCUMENT_DASHBOARD
---   - Schema: SWIFTCLAW (dynamic tables, views, stage)
---   - Dynamic tables: 4
---   - Views: 2
+--   - Schema: SWIFTCLAW (document, export and bundle stages, and the objects below)
+--   - Dynamic tables (11): AI_PARSE_CACHE, STG_PARSED_PAGES, STG_PARSED_DOCUMENTS,
+--       STG_DOCUMENT_SEGMENTS, AI_TRANSLATE_CACHE, STG_TRANSLATED_CONTENT,
+--       AI_ENRICH_CACHE, AI_FILE_EXTRACT_CACHE, STG_ENRICHED_DOCUMENTS,
+--       FCT_DOCUMENT_INSIGHTS, FCT_PIPELINE_METRICS
+--   - Views (3): V_PROCESSING_METRICS, V_DOCUMENT_STAGE_TIMESTAMPS, V_PIPELINE_LATENCY
+--   - Tasks (4): REFRESH_DOCUMENT_CATALOG_TASK, PARSE_REGISTERED_CONTENT_TASK,
+--       REFRESH_TRANSLATION_MEMORY_TASK, RECORD_STAGE_TIMESTAMPS_TASK, and their procedures
+--   - Streams (8): DOCUMENT_STAGE_STREAM, DOCUMENT_CONTENT_REGISTRY_STREAM,
+--       IMAGE_EXTRACTION_POLICY_STREAM, TRANSLATION_SEGMENT_STREAM,
+--       STG_PARSED_DOCUMENTS_STREAM, STG_TRANSLATED_CONTENT_STREAM,
+--       STG_ENRICHED_DOCUMENTS_STREAM, FCT_DOCUMENT_INSIGHTS_STREAM
+--   - Tables: RAW_DOCUMENT_CATALOG, DOCUMENT_CONTENT_REGISTRY (registry),
+--       TRANSLATION_MEMORY, AI_PARSE_RESULTS, STG_DOCUMENT_IMAGES,
+--       IMAGE_EXTRACTION_POLICY, DOCUMENT_STAGE_EVENTS, DOCUMENT_BUNDLE_LOG
 --   - Warehouse: SFE_DOCUMENT_AI_WH
 --   - Git repository: sfe_swiftclaw_repo
 --   - API Integration: SFE_GIT_API_INTEGRATION
@@ -100,6 +112,8 @@ DROP STREAMLIT IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.SFE_DOCUMENT_DASHBOARD;
 -- ============================================================================
 
 DROP VIEW IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.V_PROCESSING_METRICS;
+DROP VIEW IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.V_PIPELINE_LATENCY;
+DROP VIEW IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.V_DOCUMENT_STAGE_TIMESTAMPS;
 -- ============================================================================
 -- STEP 2b: DROP TASKS AND PROCEDURES
 -- ============================================================================
@@ -108,24 +122,54 @@ DROP VIEW IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.V_PROCESSING_METRICS;
 -- Kept here with IF EXISTS for backward compatibility with older deployments.
 
 DROP TASK IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.REFRESH_DOCUMENT_CATALOG_TASK;
+DROP PROCEDURE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.REFRESH_DOCUMENT_CATALOG(BOOLEAN);
 DROP PROCEDURE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.REFRESH_DOCUMENT_CATALOG();
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE_STREAM;
+DROP TASK IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.PARSE_REGISTERED_CONTENT_TASK;
+DROP PROCEDURE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.PARSE_REGISTERED_CONTENT();
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_CONTENT_REGISTRY_STREAM;
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.IMAGE_EXTRACTION_POLICY_STREAM;
+DROP TASK IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.REFRESH_TRANSLATION_MEMORY_TASK;
+DROP PROCEDURE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.REFRESH_TRANSLATION_MEMORY();
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.TRANSLATION_SEGMENT_STREAM;
+DROP TASK IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.RECORD_STAGE_TIMESTAMPS_TASK;
+DROP PROCEDURE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.RECORD_STAGE_TIMESTAMPS();
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_PARSED_DOCUMENTS_STREAM;
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_TRANSLATED_CONTENT_STREAM;
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_ENRICHED_DOCUMENTS_STREAM;
+DROP STREAM IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.FCT_DOCUMENT_INSIGHTS_STREAM;
 DROP TASK IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.REFRESH_ENRICHED_DOCUMENTS_TASK;
 DROP PROCEDURE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.REFRESH_ENRICHED_DOCUMENTS();
+DROP PROCEDURE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.UNPACK_DOCUMENT_BUNDLES();
 
--- Tasks and procedures have been dropped
+-- Tasks, procedures and streams have been dropped
 
 -- ============================================================================
 -- STEP 3: DROP DYNAMIC TABLES (in dependency order)
 -- ============================================================================
 
+DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.FCT_PIPELINE_METRICS;
 DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.FCT_DOCUMENT_INSIGHTS;
 DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_ENRICHED_DOCUMENTS;
 DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_TRANSLATED_CONTENT;
 DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_PARSED_DOCUMENTS;
+DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.AI_FILE_EXTRACT_CACHE;
+DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.AI_ENRICH_CACHE;
+DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.AI_TRANSLATE_CACHE;
+DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_DOCUMENT_SEGMENTS;
+DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_PARSED_PAGES;
+DROP DYNAMIC TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.AI_PARSE_CACHE;
 
 DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.RAW_DOCUMENT_CATALOG;
+DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_CONTENT_REGISTRY;
+DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.AI_PARSE_RESULTS;
+DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.STG_DOCUMENT_IMAGES;
+DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.TRANSLATION_MEMORY;
+DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.IMAGE_EXTRACTION_POLICY;
+DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_STAGE_EVENTS;
 DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.RAW_DOCUMENT_ERRORS;
 DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.RAW_DOCUMENT_PROCESSING_LOG;
+DROP TABLE IF EXISTS SNOWFLAKE_EXAMPLE.SWIFTCLAW.DOCUMENT_BUNDLE_LOG;
 
 -- Dynamic tables have been dropped
 
@@ -207,9 +251,21 @@ SHOW GIT REPOSITORIES IN SCHEMA SNOWFLAKE_EXAMPLE.GIT_REPOS;
 --
 -- Removed Objects:
 --   - Streamlit app: SFE_DOCUMENT_DASHBOARD
---   - Schema: SWIFTCLAW (dynamic tables, views, stage)
---   - Dynamic tables: 4
---   - Views: 2
+--   - Schema: SWIFTCLAW (document, export and bundle stages, and the objects below)
+--   - Dynamic tables (11): AI_PARSE_CACHE, STG_PARSED_PAGES, STG_PARSED_DOCUMENTS,
+--       STG_DOCUMENT_SEGMENTS, AI_TRANSLATE_CACHE, STG_TRANSLATED_CONTENT,
+--       AI_ENRICH_CACHE, AI_FILE_EXTRACT_CACHE, STG_ENRICHED_DOCUMENTS,
+--       FCT_DOCUMENT_INSIGHTS, FCT_PIPELINE_METRICS
+--   - Views (3): V_PROCESSING_METRICS, V_DOCUMENT_STAGE_TIMESTAMPS, V_PIPELINE_LATENCY
+--   - Tasks (4): REFRESH_DOCUMENT_CATALOG_TASK, PARSE_REGISTERED_CONTENT_TASK,
+--       REFRESH_TRANSLATION_MEMORY_TASK, RECORD_STAGE_TIMESTAMPS_TASK, and their procedures
+--   - Streams (8): DOCUMENT_STAGE_STREAM, DOCUMENT_CONTENT_REGISTRY_STREAM,
+--       IMAGE_EXTRACTION_POLICY_STREAM, TRANSLATION_SEGMENT_STREAM,
+--       STG_PARSED_DOCUMENTS_STREAM, STG_TRANSLATED_CONTENT_STREAM,
+--       STG_ENRICHED_DOCUMENTS_STREAM, FCT_DOCUMENT_INSIGHTS_STREAM
+--   - Tables: RAW_DOCUMENT_CATALOG, DOCUMENT_CONTENT_REGISTRY (registry),
+--       TRANSLATION_MEMORY, AI_PARSE_RESULTS, STG_DOCUMENT_IMAGES,
+--       IMAGE_EXTRACTION_POLICY, DOCUMENT_STAGE_EVENTS, DOCUMENT_BUNDLE_LOG
 --   - Warehouse: SFE_DOCUMENT_AI_WH
 --   - Git repository: sfe_swiftclaw_repo
 --   - API Integration: SFE_GIT_API_INTEGRATION (if not shared)
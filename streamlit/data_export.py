@@ -0,0 +1,205 @@
+"""
+DEMO PROJECT: AI Document Processing for Entertainment Industry
+Dashboard Data Export
+
+NOT FOR PRODUCTION USE - EXAMPLE IMPLEMENTATION ONLY
+
+PURPOSE:
+    Export full query results (not just what the dashboard displays) with
+    raw column types and bounded memory:
+
+    - stream_to_file(): pulls results in batches and appends each batch to
+      a CSV or Parquet file, so memory use depends on the batch size, not
+      on the row count. Files larger than DOWNLOAD_MAX_BYTES are not served
+      through the app (the download button holds the whole file in memory)
+    - unload_to_stage(): for very large exports, runs COPY INTO on the
+      warehouse and returns presigned download URLs; no rows pass through
+      the Streamlit process at all
+
+Author: SE Community
+Created: 2026-02-17 | Expires: 2026-02-20
+"""
+
+import os
+import re
+import tempfile
+import time
+import uuid
+from typing import NamedTuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+EXPORT_STAGE = "SNOWFLAKE_EXAMPLE.SWIFTCLAW.EXPORT_STAGE"
+EXPORT_FORMATS = ("CSV", "Parquet")
+PRESIGNED_URL_SECONDS = 3600
+UNLOAD_MAX_FILE_BYTES = 256 * 1024 * 1024
+
+# Prepared files live in one directory so abandoned sessions' files can be
+# swept; anything larger than DOWNLOAD_MAX_BYTES goes through the stage.
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "swiftclaw_exports")
+EXPORT_FILE_MAX_AGE_SECONDS = 3600
+DOWNLOAD_MAX_BYTES = 100 * 1024 * 1024
+
+# Snowpark column types -> Arrow types of the frames to_pandas_batches()
+# returns. NUMBER columns with a scale arrive as float64; semi-structured
+# values arrive as JSON text.
+_ARROW_TYPES = {
+    "StringType": pa.string(),
+    "BooleanType": pa.bool_(),
+    "ByteType": pa.int64(),
+    "ShortType": pa.int64(),
+    "IntegerType": pa.int64(),
+    "LongType": pa.int64(),
+    "FloatType": pa.float64(),
+    "DoubleType": pa.float64(),
+    "DateType": pa.date32(),
+    "TimeType": pa.time64("ns"),
+    "BinaryType": pa.binary(),
+}
+
+_QUERY_ID = re.compile(r"^[0-9a-fA-F-]{36}$")
+
+
+class ExportFile(NamedTuple):
+    path: str
+    file_name: str
+    mime: str
+    rows: int
+    size: int
+
+
+class UnloadedFile(NamedTuple):
+    name: str
+    size: int
+    url: str
+
+
+def _arrow_type(datatype) -> pa.DataType:
+    type_name = type(datatype).__name__
+    if type_name == "DecimalType":
+        return pa.int64() if datatype.scale == 0 else pa.float64()
+    if type_name == "TimestampType":
+        # TIMESTAMP_LTZ / TIMESTAMP_TZ arrive time zone aware
+        tz = str(getattr(getattr(datatype, "tz", None), "value", "")).lower()
+        return pa.timestamp("ns", tz="UTC" if tz in ("ltz", "tz") else None)
+    return _ARROW_TYPES.get(type_name, pa.string())
+
+
+def arrow_schema(result_schema) -> pa.Schema:
+    """Arrow schema for a Snowpark result schema (StructType)."""
+    return pa.schema([
+        (field.name.strip('"'), _arrow_type(field.datatype))
+        for field in result_schema.fields
+    ])
+
+
+def remove_stale_exports(max_age_seconds: int = EXPORT_FILE_MAX_AGE_SECONDS) -> None:
+    """Delete prepared export files older than ``max_age_seconds``.
+
+    Sessions remove their own files when they prepare a new one or change
+    filters; this catches files left behind by sessions that ended.
+    """
+    if not os.path.isdir(EXPORT_DIR):
+        return
+    cutoff = time.time() - max_age_seconds
+    for entry in os.scandir(EXPORT_DIR):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            # Another session swept it first
+            pass
+
+
+def stream_to_file(session, query, export_format: str, name: str) -> ExportFile:
+    """Run ``query`` and write its results to a temporary file batch by batch.
+
+    Values keep their warehouse types: CSV is written from the raw frames
+    (no display formatting) and every Parquet batch is cast to one schema
+    built from the result metadata, so a column that is all null in one
+    batch keeps its type. An empty result still yields a readable file
+    with the column header or schema.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    suffix = ".csv" if export_format == "CSV" else ".parquet"
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix=f"{name}_", suffix=suffix, dir=EXPORT_DIR)
+    os.close(fd)
+
+    dataframe = session.sql(query.sql, params=list(query.params))
+    schema = arrow_schema(dataframe.schema)
+    rows = 0
+    try:
+        if export_format == "CSV":
+            with open(path, "w", encoding="utf-8", newline="") as handle:
+                for batch in dataframe.to_pandas_batches():
+                    if batch.empty:
+                        continue
+                    batch.to_csv(handle, index=False, header=rows == 0)
+                    rows += len(batch)
+                if rows == 0:
+                    handle.write(",".join(schema.names) + "\n")
+        else:
+            # The writer is opened up front so an empty result still gets a
+            # valid file carrying the schema
+            with pq.ParquetWriter(path, schema) as writer:
+                for batch in dataframe.to_pandas_batches():
+                    writer.write_table(pa.Table.from_pandas(batch, schema=schema, preserve_index=False))
+                    rows += len(batch)
+    except BaseException:
+        os.remove(path)
+        raise
+
+    mime = "text/csv" if export_format == "CSV" else "application/vnd.apache.parquet"
+    return ExportFile(path, f"{name}{suffix}", mime, rows, os.path.getsize(path))
+
+
+def unload_to_stage(session, query, export_format: str, name: str) -> list:
+    """Unload query results to EXPORT_STAGE and return presigned URLs.
+
+    The query runs once with its bind parameters; COPY INTO then reads its
+    persisted result via RESULT_SCAN, so filter values are never spliced
+    into SQL text. Large results are split into multiple files.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    job = session.sql(query.sql, params=list(query.params)).collect_nowait()
+    job.result("no_result")
+    query_id = job.query_id
+    if not _QUERY_ID.match(query_id):
+        raise ValueError(f"Unexpected query ID: {query_id}")
+
+    prefix = f"{name}/{uuid.uuid4().hex}/"
+    file_format = (
+        "TYPE = CSV COMPRESSION = GZIP FIELD_OPTIONALLY_ENCLOSED_BY = '\"'"
+        if export_format == "CSV"
+        else "TYPE = PARQUET"
+    )
+    session.sql(f"""
+COPY INTO @{EXPORT_STAGE}/{prefix}
+FROM (SELECT * FROM TABLE(RESULT_SCAN('{query_id}')))
+FILE_FORMAT = ({file_format})
+HEADER = TRUE
+MAX_FILE_SIZE = {UNLOAD_MAX_FILE_BYTES}
+""").collect()
+
+    # Internal stages do not auto-refresh their directory table
+    session.sql(f"ALTER STAGE {EXPORT_STAGE} REFRESH SUBPATH = '{prefix}'").collect()
+
+    files = session.sql(
+        f"""
+SELECT
+    relative_path,
+    size,
+    GET_PRESIGNED_URL(@{EXPORT_STAGE}, relative_path, {PRESIGNED_URL_SECONDS}) AS url
+FROM DIRECTORY(@{EXPORT_STAGE})
+WHERE STARTSWITH(relative_path, ?)
+ORDER BY relative_path
+""",
+        params=[prefix]
+    ).collect()
+    return [UnloadedFile(row["RELATIVE_PATH"], row["SIZE"], row["URL"]) for row in files]
@@ -0,0 +1,371 @@
+"""
+DEMO PROJECT: AI Document Processing for Entertainment Industry
+Local Session Stand-In (SQLite)
+
+NOT FOR PRODUCTION USE - EXAMPLE IMPLEMENTATION ONLY
+
+PURPOSE:
+    Offline stand-in for the Snowpark session, backed by an embedded SQLite
+    store with the FCT_DOCUMENT_INSIGHTS and V_PROCESSING_METRICS shapes.
+    Used for local development and the dashboard benchmark
+    (scripts/benchmark_dashboard.py); selected by session_provider when
+    SWIFTCLAW_LOCAL_DB is set.
+
+SCOPE:
+    - Implements the subset of the Snowpark API the dashboard uses:
+      session.sql(sql, params).to_pandas() / to_pandas_batches() / schema
+    - Rewrites the Snowflake constructs the query builder emits (VARIANT
+      paths, ARRAY_CONTAINS over bound JSON arrays, ::TIMESTAMP_NTZ casts,
+      INITCAP/LEAST/FLOOR) into SQLite equivalents
+    - Server-side operations (collect(), COPY INTO, stages) are not
+      available; the dashboard hides the stage unload in local mode
+
+    Timings measure the dashboard's own overhead and relative query cost on
+    one machine; they are not a prediction of warehouse latency.
+
+Author: SE Community
+Created: 2026-02-17 | Expires: 2026-02-20
+"""
+
+import math
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+DOCUMENT_TYPES = ["INVOICE", "ROYALTY_STATEMENT", "CONTRACT", "OTHER"]
+DOCUMENT_TYPE_WEIGHTS = [0.45, 0.30, 0.20, 0.05]
+PRIORITY_LEVELS = ["HIGH", "MEDIUM", "LOW"]
+PRIORITY_WEIGHTS = [0.15, 0.35, 0.50]
+BUSINESS_CATEGORIES = ["MUSIC", "FILM", "TELEVISION", "PUBLISHING", "GAMING"]
+VENDOR_TERRITORIES = [
+    "North America", "Latin America", "United Kingdom", "Germany", "Spain",
+    "Brazil", "Japan", "China", "Russia", "Australia"
+]
+CURRENCIES = ["USD", "EUR", "GBP"]
+HISTORY_DAYS = 3 * 365
+
+# Order matters: ARRAY_CONTAINS is rewritten before the VARIANT paths it wraps
+_REWRITES = [
+    (re.compile(r"SNOWFLAKE_EXAMPLE\.SWIFTCLAW\.", re.IGNORECASE), ""),
+    (
+        re.compile(r"ARRAY_CONTAINS\(([\w:]+?)(?:::VARIANT)?,\s*PARSE_JSON\(\?\)\)", re.IGNORECASE),
+        r"\1 IN (SELECT value FROM json_each(?))"
+    ),
+    (re.compile(r"\b(metadata):(\w+)(?:::STRING)?", re.IGNORECASE), r"json_extract(\1, '$.\2')"),
+    (re.compile(r"::TIMESTAMP_NTZ", re.IGNORECASE), ""),
+]
+
+_SCHEMA = """
+CREATE TABLE FCT_DOCUMENT_INSIGHTS (
+    insight_id TEXT PRIMARY KEY,
+    document_id TEXT NOT NULL,
+    document_type TEXT,
+    total_amount REAL,
+    currency TEXT,
+    document_date TEXT,
+    vendor_territory TEXT,
+    overall_confidence_score REAL,
+    requires_manual_review INTEGER,
+    manual_review_reason TEXT,
+    insight_created_at TEXT,
+    insight_version INTEGER,
+    metadata TEXT
+);
+
+CREATE TABLE CATALOG_STATS (total_catalog_documents INTEGER);
+
+CREATE VIEW V_PROCESSING_METRICS AS
+WITH insight_stats AS (
+    SELECT
+        COUNT(*) AS total_insights,
+        AVG(overall_confidence_score) AS avg_overall_confidence,
+        SUM(requires_manual_review) AS documents_needing_review,
+        SUM(CASE WHEN document_type IN ('INVOICE', 'ROYALTY_STATEMENT', 'CONTRACT')
+                 THEN total_amount ELSE 0 END) AS total_value,
+        MAX(insight_created_at) AS last_insight_timestamp,
+        SUM(insight_version % 4294967296) AS insights_checksum
+    FROM FCT_DOCUMENT_INSIGHTS
+),
+metrics AS (
+    SELECT
+        c.total_catalog_documents,
+        i.*,
+        ROUND(i.total_insights * 100.0 / NULLIF(c.total_catalog_documents, 0), 2) AS completion_percentage,
+        ROUND(i.documents_needing_review * 100.0 / NULLIF(i.total_insights, 0), 2) AS manual_review_percentage
+    FROM CATALOG_STATS c, insight_stats i
+)
+SELECT
+    total_catalog_documents AS catalog_documents,
+    MAX(total_catalog_documents - total_insights, 0) AS pending_documents,
+    total_insights AS completed_documents,
+    0 AS failed_documents,
+    total_insights AS parsed_documents,
+    total_insights AS translated_documents,
+    0 AS translation_memory_segments,
+    0 AS translation_segment_hits,
+    0.0 AS translation_memory_hit_percentage,
+    0 AS translation_characters_saved,
+    total_insights AS enriched_documents,
+    0 AS file_extraction_fallbacks,
+    total_insights AS insight_documents,
+    0 AS content_cache_hits,
+    total_catalog_documents AS content_cache_misses,
+    0.0 AS content_cache_hit_percentage,
+    completion_percentage,
+    ROUND(avg_overall_confidence, 4) AS avg_overall_confidence,
+    documents_needing_review,
+    manual_review_percentage,
+    ROUND(total_value, 2) AS total_value_processed_usd,
+    last_insight_timestamp AS last_parsing_timestamp,
+    last_insight_timestamp AS last_translation_timestamp,
+    last_insight_timestamp AS last_enrichment_timestamp,
+    last_insight_timestamp,
+    CAST((julianday('now') - julianday(last_insight_timestamp)) * 1440 AS INTEGER) AS minutes_since_last_insight,
+    insights_checksum,
+    CASE
+        WHEN completion_percentage >= 95
+             AND avg_overall_confidence >= 0.85
+             AND manual_review_percentage < 5 THEN 'Healthy'
+        WHEN completion_percentage >= 80
+             AND avg_overall_confidence >= 0.75
+             AND manual_review_percentage < 10 THEN 'Warning'
+        ELSE 'Attention Required'
+    END AS pipeline_health_status
+FROM metrics;
+"""
+
+# Same sort key and pruning column the warehouse relies on
+_INDEXES = """
+CREATE INDEX idx_insights_created ON FCT_DOCUMENT_INSIGHTS (insight_created_at DESC, insight_id DESC);
+CREATE INDEX idx_insights_document_date ON FCT_DOCUMENT_INSIGHTS (document_date);
+"""
+
+
+def translate_sql(sql: str) -> str:
+    """Rewrite query-builder SQL into the SQLite dialect."""
+    for pattern, replacement in _REWRITES:
+        sql = pattern.sub(replacement, sql)
+    return sql
+
+
+def _bind(value):
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _initcap(value):
+    return None if value is None else value.title()
+
+
+def _least(*values):
+    return None if any(value is None for value in values) else min(values)
+
+
+def _floor(value):
+    return None if value is None else float(math.floor(value))
+
+
+def _typed(frame: pd.DataFrame) -> pd.DataFrame:
+    """Match Snowpark's result shape: upper-case names and native column types."""
+    frame.columns = [column.upper() for column in frame.columns]
+    for column in frame.columns:
+        if column.endswith("_AT") or column.endswith("_TIMESTAMP"):
+            frame[column] = pd.to_datetime(frame[column])
+        elif column == "DOCUMENT_DATE":
+            frame[column] = pd.to_datetime(frame[column]).dt.date
+        elif column == "REQUIRES_MANUAL_REVIEW":
+            frame[column] = frame[column].astype(bool)
+    return frame
+
+
+# Result column types, named after their snowflake.snowpark.types classes
+# (data_export maps them to Arrow by class name). Columns not listed are text.
+class StringType:
+    pass
+
+
+class BooleanType:
+    pass
+
+
+class DoubleType:
+    pass
+
+
+class LongType:
+    pass
+
+
+class DateType:
+    pass
+
+
+class TimestampType:
+    tz = None
+
+
+class StructField(NamedTuple):
+    name: str
+    datatype: object
+
+
+class StructType(NamedTuple):
+    fields: list
+
+
+_NUMERIC_COLUMNS = {"TOTAL_AMOUNT", "CONFIDENCE_SCORE", "OVERALL_CONFIDENCE_SCORE", "TOTAL_VALUE",
+                    "BIN_START", "BIN_END"}
+
+
+def _column_type(column: str):
+    if column.endswith("_AT") or column.endswith("_TIMESTAMP"):
+        return TimestampType()
+    if column == "DOCUMENT_DATE":
+        return DateType()
+    if column == "REQUIRES_MANUAL_REVIEW":
+        return BooleanType()
+    if column in ("DOCUMENT_COUNT", "INSIGHT_VERSION"):
+        return LongType()
+    if column in _NUMERIC_COLUMNS:
+        return DoubleType()
+    return StringType()
+
+
+class _LocalJob:
+    """Completed stand-in for a Snowpark AsyncJob."""
+
+    def __init__(self, result):
+        self.query_id = str(uuid.uuid4())
+        self._result = result
+
+    def result(self, result_type=None):
+        return self._result
+
+
+class LocalDataFrame:
+    def __init__(self, session, sql: str, params):
+        self._session = session
+        self._sql = translate_sql(sql)
+        self._params = [_bind(value) for value in (params or ())]
+
+    @property
+    def schema(self) -> StructType:
+        cursor = self._session.connection().execute(f"SELECT * FROM ({self._sql}) LIMIT 0", self._params)
+        columns = [description[0].upper() for description in cursor.description]
+        return StructType([StructField(column, _column_type(column)) for column in columns])
+
+    def to_pandas(self, *, statement_params=None, block=True, **kwargs):
+        frame = _typed(pd.read_sql_query(self._sql, self._session.connection(), params=self._params))
+        return frame if block else _LocalJob(frame)
+
+    def to_pandas_batches(self, *, statement_params=None, batch_size=100_000, **kwargs):
+        for chunk in pd.read_sql_query(
+            self._sql, self._session.connection(), params=self._params, chunksize=batch_size
+        ):
+            yield _typed(chunk)
+
+
+class LocalSession:
+    """Snowpark-compatible session over a SQLite store; one connection per thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            connection.create_function("INITCAP", 1, _initcap, deterministic=True)
+            connection.create_function("LEAST", -1, _least, deterministic=True)
+            connection.create_function("FLOOR", 1, _floor, deterministic=True)
+            self._local.connection = connection
+        return connection
+
+    def sql(self, sql: str, params=None) -> LocalDataFrame:
+        return LocalDataFrame(self, sql, params)
+
+
+def _synthetic_chunk(rng: np.random.Generator, start: int, size: int, total: int,
+                     history_start: datetime) -> list:
+    """One chunk of insight rows; ids and created_at increase with row number."""
+    ids = np.arange(start, start + size)
+    document_types = rng.choice(DOCUMENT_TYPES, size, p=DOCUMENT_TYPE_WEIGHTS)
+    priorities = rng.choice(PRIORITY_LEVELS, size, p=PRIORITY_WEIGHTS)
+    categories = rng.choice(BUSINESS_CATEGORIES, size)
+    amounts = np.round(rng.lognormal(mean=8.5, sigma=1.4, size=size), 2)
+    confidence = np.round(rng.beta(8, 1.5, size), 4)
+    requires_review = (confidence < 0.80) | (amounts > 100000)
+    reasons = np.where(
+        confidence < 0.80, "Low confidence score",
+        np.where(amounts > 100000, "High value document", None)
+    )
+
+    # Uploads spread evenly over the history window at one-second resolution;
+    # document dates precede their upload by up to 90 days
+    upload_seconds = (ids * (HISTORY_DAYS * 86400 // max(total, 1))).astype("int64")
+    created_at = pd.Timestamp(history_start) + pd.to_timedelta(upload_seconds, unit="s")
+    document_dates = (created_at - pd.to_timedelta(rng.integers(0, 90, size), unit="D")).strftime("%Y-%m-%d")
+    created_at = created_at.strftime("%Y-%m-%d %H:%M:%S")
+
+    metadata = (
+        '{"priority_level": "' + pd.Series(priorities)
+        + '", "business_category": "' + pd.Series(categories) + '"}'
+    )
+    document_ids = pd.Series(ids).map("DOC_{:09d}".format)
+    versions = pd.util.hash_pandas_object(
+        pd.DataFrame({"type": document_types, "amount": amounts, "confidence": confidence,
+                      "priority": priorities, "created_at": created_at}),
+        index=False
+    ).to_numpy().view("int64")
+
+    return list(zip(
+        "INS_" + document_ids,
+        document_ids,
+        document_types,
+        amounts.tolist(),
+        rng.choice(CURRENCIES, size),
+        document_dates,
+        rng.choice(VENDOR_TERRITORIES, size),
+        confidence.tolist(),
+        requires_review.astype(int).tolist(),
+        reasons,
+        created_at,
+        versions.tolist(),
+        metadata,
+    ))
+
+
+def build_store(path: str, rows: int, seed: int = 42, chunk_size: int = 100_000,
+                pending_documents: int = 0) -> None:
+    """Create a synthetic insights store at ``path`` with ``rows`` documents."""
+    rng = np.random.default_rng(seed)
+    history_start = datetime.combine(date.today() - timedelta(days=HISTORY_DAYS), datetime.min.time())
+
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.executescript(_SCHEMA)
+        for start in range(0, rows, chunk_size):
+            connection.executemany(
+                "INSERT INTO FCT_DOCUMENT_INSIGHTS VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                _synthetic_chunk(rng, start, min(chunk_size, rows - start), rows, history_start)
+            )
+        connection.execute("INSERT INTO CATALOG_STATS VALUES (?)", (rows + pending_documents,))
+        connection.executescript(_INDEXES)
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
@@ -0,0 +1,191 @@
+"""
+DEMO PROJECT: AI Document Processing for Entertainment Industry
+Dashboard Query Cache
+
+NOT FOR PRODUCTION USE - EXAMPLE IMPLEMENTATION ONLY
+
+PURPOSE:
+    Process-wide result cache shared by every dashboard session. Streamlit
+    reruns the whole script on each widget interaction, so without a shared
+    cache every analyst click resumes the warehouse for identical results.
+
+BEHAVIOR:
+    - Keys are normalized SQL text plus bound filter values
+    - Concurrent misses for the same key are coalesced (single-flight):
+      one session runs the query, the others wait for its result
+    - Entries live until the pipeline watermark moves or invalidate() is
+      called (Refresh Data button); optional per-entry TTL for probes
+    - Total size is capped (entry count and, given a sizeof function,
+      bytes); the least recently used entries are evicted first
+
+Author: SE Community
+Created: 2026-02-17 | Expires: 2026-02-20
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+_WHITESPACE = re.compile(r"\s+")
+_UNSET = object()
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace so formatting differences share one cache key."""
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class _InFlight:
+    """A query currently being executed on behalf of one or more sessions."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class QueryCache:
+    """Thread-safe result cache with single-flight loading and watermark invalidation.
+
+    ``max_entries`` caps the number of cached results; ``max_bytes`` caps
+    their total size as measured by ``sizeof(result)``. Past either cap the
+    least recently used entries are evicted. A single result larger than
+    ``max_bytes`` is handed to its callers but not stored.
+    """
+
+    def __init__(self, max_entries=256, max_bytes=None, sizeof=None):
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("max_bytes requires a sizeof function")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._in_flight = {}
+        self._generation = 0
+        self._watermark = _UNSET
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(sql: str, params=None) -> tuple:
+        return (normalize_sql(sql), tuple(params or ()))
+
+    def get_or_load(self, sql: str, params, loader, ttl_seconds=None):
+        """Return the cached result for (sql, params), running loader() on a miss.
+
+        If another session is already loading the same key, wait for its
+        result instead of issuing a second warehouse query.
+        """
+        key = self.make_key(sql, params)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires_at, _ = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                self._remove(key)
+
+            flight = self._in_flight.get(key)
+            is_owner = flight is None
+            if is_owner:
+                self.misses += 1
+                flight = _InFlight()
+                self._in_flight[key] = flight
+            else:
+                self.hits += 1
+            generation = self._generation
+
+        if not is_owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        size = 0
+        try:
+            flight.result = loader()
+            if self._sizeof is not None:
+                size = self._sizeof(flight.result)
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+                # Results loaded across an invalidation may predate the new
+                # watermark, so they are handed to waiters but not stored.
+                if flight.error is None and generation == self._generation:
+                    expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+                    self._store(key, (flight.result, expires_at, size))
+            flight.done.set()
+
+        return flight.result
+
+    def _store(self, key, entry) -> None:
+        """Insert an entry as most recently used and evict down to the caps (lock held)."""
+        if key in self._entries:
+            self._remove(key)
+        if self.max_bytes is not None and entry[2] > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += entry[2]
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key) -> None:
+        """Drop one entry and its bytes (lock held)."""
+        self._bytes -= self._entries.pop(key)[2]
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every invalidation; unchanged means no new data was observed."""
+        return self._generation
+
+    def observe_watermark(self, watermark, keep=None) -> bool:
+        """Record the pipeline watermark; invalidate everything if it moved.
+
+        Returns True when cached entries were dropped. ``keep`` is an
+        optional (sql, params) pair that survives the invalidation, used for
+        the probe query that produced the watermark.
+        """
+        with self._lock:
+            if watermark == self._watermark:
+                return False
+            moved = self._watermark is not _UNSET
+            self._watermark = watermark
+        if moved:
+            self.invalidate(keep=keep)
+        return moved
+
+    def invalidate(self, keep=None) -> None:
+        """Drop all cached entries (optionally keeping one) and detach in-flight loads."""
+        keep_key = self.make_key(*keep) if keep is not None else None
+        with self._lock:
+            kept = self._entries.get(keep_key) if keep_key is not None else None
+            self._entries.clear()
+            self._bytes = 0
+            if kept is not None:
+                self._entries[keep_key] = kept
+                self._bytes = kept[2]
+            self._in_flight.clear()
+            self._generation += 1
+
+    @property
+    def bytes(self) -> int:
+        """Total sizeof() of the cached results (0 without a sizeof function)."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
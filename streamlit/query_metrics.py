@@ -0,0 +1,62 @@
+"""
+DEMO PROJECT: AI Document Processing for Entertainment Industry
+Dashboard Query Metrics
+
+NOT FOR PRODUCTION USE - EXAMPLE IMPLEMENTATION ONLY
+
+PURPOSE:
+    Record one entry per dashboard query: which section issued it, wall
+    time, rows and bytes returned, whether the shared cache served it, and
+    the Snowflake query ID. Every entry is emitted as a JSON log line and
+    kept in a bounded in-memory log for the diagnostics panel.
+
+    Query IDs (and the QUERY_TAG set on each statement) link a slow section
+    to QUERY_HISTORY, where compilation, queuing and scan details live.
+
+Author: SE Community
+Created: 2026-02-17 | Expires: 2026-02-20
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger("swiftclaw.dashboard.queries")
+
+QUERY_TAG_PREFIX = "swiftclaw_dashboard"
+
+
+def query_tag(section: str) -> str:
+    """QUERY_TAG for statements issued by one dashboard section."""
+    return f"{QUERY_TAG_PREFIX}:{section}"
+
+
+class QueryRecord(NamedTuple):
+    run_id: str
+    section: str
+    cache: str              # "hit" (served from the shared cache) or "miss"
+    wall_ms: float
+    rows: int
+    bytes: int              # in-memory size of results fetched from Snowflake; 0 on a hit
+    query_id: Optional[str]
+    sql: str
+
+
+class QueryLog:
+    """Thread-safe, bounded log of recent query records."""
+
+    def __init__(self, max_records: int = 1000):
+        self._lock = threading.Lock()
+        self._records = deque(maxlen=max_records)
+
+    def record(self, record: QueryRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+        logger.info(json.dumps({"event": "dashboard_query", **record._asdict()}))
+
+    def for_run(self, run_id: str) -> list:
+        """Records issued by one script run (one page render)."""
+        with self._lock:
+            return [record for record in self._records if record.run_id == run_id]
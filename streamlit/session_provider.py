@@ -0,0 +1,44 @@
+"""
+DEMO PROJECT: AI Document Processing for Entertainment Industry
+Dashboard Session Provider
+
+NOT FOR PRODUCTION USE - EXAMPLE IMPLEMENTATION ONLY
+
+PURPOSE:
+    Single place the dashboard obtains its Snowpark session from. In
+    Streamlit in Snowflake this is the active session. Pointing the
+    SWIFTCLAW_LOCAL_DB environment variable at a synthetic store (see
+    local_session.build_store) swaps in a local SQLite stand-in, so the
+    dashboard can be developed and benchmarked without an account.
+
+Author: SE Community
+Created: 2026-02-17 | Expires: 2026-02-20
+"""
+
+import os
+import threading
+
+LOCAL_DB_ENV = "SWIFTCLAW_LOCAL_DB"
+
+_local_sessions = {}
+_local_sessions_lock = threading.Lock()
+
+
+def is_local_session() -> bool:
+    """True when the dashboard runs against the local stand-in (no stages or COPY INTO)."""
+    return bool(os.environ.get(LOCAL_DB_ENV))
+
+
+def get_session():
+    """Return the session the dashboard should query."""
+    local_db = os.environ.get(LOCAL_DB_ENV)
+    if local_db:
+        # One stand-in per store, so reruns reuse its per-thread connections
+        from local_session import LocalSession
+        with _local_sessions_lock:
+            if local_db not in _local_sessions:
+                _local_sessions[local_db] = LocalSession(local_db)
+            return _local_sessions[local_db]
+
+    from snowflake.snowpark.context import get_active_session
+    return get_active_session()
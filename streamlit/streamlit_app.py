@@ -15,15 +15,37 @@ FEATURES:
     - Business value analytics
     - Manual review queue
 
+QUERY EXECUTION:
+    Section queries are submitted together on a bounded thread pool and
+    each section renders as soon as its own results arrive, so page latency
+    tracks the slowest single query rather than the sum of all of them.
+
 Author: SE Community
 Created: 2025-11-24 | Expires: 2026-02-20
 """
 
+import os
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+
 import streamlit as st
-from snowflake.snowpark.context import get_active_session
 import pandas as pd
 import altair as alt
 
+import query_builder as qb
+from data_export import (
+    DOWNLOAD_MAX_BYTES,
+    EXPORT_FORMATS,
+    remove_stale_exports,
+    stream_to_file,
+    unload_to_stage,
+)
+from query_cache import QueryCache, normalize_sql
+from query_metrics import QueryLog, QueryRecord, query_tag
+from session_provider import get_session, is_local_session
+
 # ============================================================================
 # PAGE CONFIGURATION
 # ============================================================================
@@ -34,8 +56,109 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Get Snowflake session
-session = get_active_session()
+# Get Snowflake session (or the local stand-in when SWIFTCLAW_LOCAL_DB is set)
+session = get_session()
+
+# ============================================================================
+# SHARED QUERY CACHE & EXECUTOR
+# ============================================================================
+# One cache per Streamlit server process, shared by all sessions. Results are
+# reused until the pipeline watermark (last_insight_timestamp and
+# insights_checksum) moves or the Refresh Data button is pressed. The metrics
+# view doubles as the watermark probe, so it is re-read at most once per
+# WATERMARK_PROBE_SECONDS. The cache
+# is capped at QUERY_CACHE_MAX_BYTES of result frames; least recently used
+# results (typically other sessions' deep insights pages) are evicted first.
+#
+# Queries run on a bounded pool, also shared process-wide, so a burst of
+# sessions cannot open an unbounded number of concurrent warehouse queries.
+#
+# Every query is timed and recorded (section, cache hit/miss, rows, bytes,
+# Snowflake query ID) in a shared QueryLog, which also writes one JSON log
+# line per query. Statements carry a QUERY_TAG naming the dashboard section.
+
+WATERMARK_PROBE_SECONDS = 60
+QUERY_WORKERS = 8
+QUERY_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def frame_bytes(frame: pd.DataFrame) -> int:
+    return int(frame.memory_usage(deep=True).sum())
+
+
+@st.cache_resource
+def get_query_cache() -> QueryCache:
+    return QueryCache(max_bytes=QUERY_CACHE_MAX_BYTES, sizeof=frame_bytes)
+
+
+def shutdown_executor(executor: ThreadPoolExecutor) -> None:
+    # Queued queries still finish; the worker threads exit once they have
+    executor.shutdown(wait=False)
+
+
+# Clearing the resource cache shuts the old pool down rather than leaking its threads
+@st.cache_resource(on_release=shutdown_executor)
+def get_query_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix="swiftclaw-query")
+
+
+@st.cache_resource
+def get_query_log() -> QueryLog:
+    return QueryLog()
+
+
+query_cache = get_query_cache()
+query_executor = get_query_executor()
+query_log = get_query_log()
+
+# Prepared export files of sessions that ended are never downloaded again
+remove_stale_exports()
+
+# Identifies this script run in the query log (one run per page render)
+RUN_ID = uuid.uuid4().hex
+
+
+def run_query(query: qb.Query, section: str, ttl_seconds=None) -> pd.DataFrame:
+    """Execute a parameterized query through the shared cache and record it.
+
+    Returned frames are shared across sessions: do not mutate them.
+    """
+    executed = {}
+
+    def load() -> pd.DataFrame:
+        job = session.sql(query.sql, params=list(query.params)).to_pandas(
+            block=False,
+            statement_params={"QUERY_TAG": query_tag(section)}
+        )
+        executed["query_id"] = job.query_id
+        result = job.result()
+        executed["bytes"] = frame_bytes(result)
+        return result
+
+    started = time.perf_counter()
+    result = query_cache.get_or_load(query.sql, query.params, load, ttl_seconds=ttl_seconds)
+    query_log.record(QueryRecord(
+        run_id=RUN_ID,
+        section=section,
+        cache="miss" if executed else "hit",
+        wall_ms=round((time.perf_counter() - started) * 1000, 1),
+        rows=len(result),
+        bytes=executed.get("bytes", 0),
+        query_id=executed.get("query_id"),
+        sql=normalize_sql(query.sql)
+    ))
+    return result
+
+
+def submit_query(query: qb.Query, section: str, ttl_seconds=None):
+    """Start a query on the shared pool and return its Future."""
+    return query_executor.submit(run_query, query, section, ttl_seconds)
+
+
+def prefetch_query(query: qb.Query, section: str) -> None:
+    """Warm the shared cache in the background; a later run_query joins or hits it."""
+    submit_query(query, section)
+
 
 # ============================================================================
 # HEADER & INTRO
@@ -74,28 +197,302 @@ priority_levels = st.sidebar.multiselect(
 # Manual review filter
 show_review_only = st.sidebar.checkbox("Show Manual Review Queue Only", value=False)
 
-# Date range filter
-date_range = st.sidebar.date_input(
-    "Document Date Range",
-    value=None,
-    help="Filter by document date (leave blank for all dates)"
-)
+# Date range filter (bounds are applied as plain range predicates on
+# document_date so clustered micro-partitions outside the range are pruned)
+DATE_PRESETS = {
+    "All dates": None,
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "Last 365 days": 365,
+    "Custom range": None,
+}
+date_preset = st.sidebar.selectbox("Document Date", list(DATE_PRESETS), index=0)
+
+date_from = date_to = None
+if date_preset == "Custom range":
+    date_range = st.sidebar.date_input(
+        "Document Date Range",
+        value=(),
+        help="Pick a start and end date (leave blank for all dates)"
+    )
+    # The picker returns a single date while the user is mid-selection
+    if len(date_range) == 2:
+        date_from, date_to = date_range
+elif DATE_PRESETS[date_preset] is not None:
+    date_to = date.today()
+    date_from = date_to - timedelta(days=DATE_PRESETS[date_preset])
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("**Quick Actions**")
 refresh_btn = st.sidebar.button("Refresh Data", use_container_width=True)
 
+if refresh_btn:
+    query_cache.invalidate()
+
+show_diagnostics = st.sidebar.checkbox(
+    "Show Query Diagnostics",
+    value=False,
+    help="Per-query timings, cache hits and Snowflake query IDs for this page load"
+)
+
+filters = qb.DashboardFilters.from_widgets(
+    doc_types,
+    priority_levels,
+    show_review_only,
+    date_from=date_from,
+    date_to=date_to
+)
+
 # ============================================================================
-# SECTION 1: PIPELINE HEALTH (Top KPIs)
+# SECTION RENDERERS
 # ============================================================================
+# Each renderer receives its query results and draws one dashboard section.
+# They run on the script thread once the section's queries have completed.
 
-st.header("Pipeline Health")
+PAGE_SIZE_OPTIONS = [100, 500, 1000, 10000]
+
+# Most insights rows a session keeps in memory. Paging deeper drops the
+# earliest rows; paging back to them re-reads them with keyset queries.
+SNAPSHOT_ROW_LIMIT = 50000
+
+# Largest number of new or changed rows merged into a session's insights
+# snapshot; a bigger delta reloads the snapshot from the newest rows instead.
+DELTA_MERGE_LIMIT = 1000
+
+# Rows shown in the review queue; the export holds the whole queue
+REVIEW_QUEUE_LIMIT = 50
+
+# Display formatting is declarative: st.dataframe renders these columns from
+# the raw query results (shared, never mutated or copied). Human-readable
+# type/priority labels are computed in the warehouse by the query builder.
+AMOUNT_COLUMN = st.column_config.NumberColumn("Amount", format="dollar")
+CONFIDENCE_COLUMN = st.column_config.ProgressColumn(
+    "Confidence", format="percent", min_value=0.0, max_value=1.0
+)
+
+INSIGHT_COLUMN_ORDER = [
+    'DOCUMENT_TYPE_LABEL',
+    'VENDOR_TERRITORY',
+    'TOTAL_AMOUNT',
+    'DOCUMENT_DATE',
+    'PRIORITY_LABEL',
+    'CONFIDENCE_SCORE',
+    'REQUIRES_MANUAL_REVIEW'
+]
+INSIGHT_COLUMN_CONFIG = {
+    'DOCUMENT_TYPE_LABEL': st.column_config.TextColumn("Type"),
+    'VENDOR_TERRITORY': st.column_config.TextColumn("Vendor/Territory"),
+    'TOTAL_AMOUNT': AMOUNT_COLUMN,
+    'DOCUMENT_DATE': st.column_config.DateColumn("Date", format="YYYY-MM-DD"),
+    'PRIORITY_LABEL': st.column_config.TextColumn("Priority"),
+    'CONFIDENCE_SCORE': CONFIDENCE_COLUMN,
+    'REQUIRES_MANUAL_REVIEW': st.column_config.CheckboxColumn("Needs Review")
+}
+
+REVIEW_COLUMN_ORDER = [
+    'DOCUMENT_TYPE_LABEL',
+    'VENDOR_TERRITORY',
+    'TOTAL_AMOUNT',
+    'PRIORITY_LABEL',
+    'CONFIDENCE_SCORE',
+    'INSIGHT_CREATED_AT'
+]
+REVIEW_COLUMN_CONFIG = {
+    'DOCUMENT_TYPE_LABEL': st.column_config.TextColumn("Type"),
+    'VENDOR_TERRITORY': st.column_config.TextColumn("Vendor/Territory"),
+    'TOTAL_AMOUNT': AMOUNT_COLUMN,
+    'PRIORITY_LABEL': st.column_config.TextColumn("Priority"),
+    'CONFIDENCE_SCORE': CONFIDENCE_COLUMN,
+    'INSIGHT_CREATED_AT': st.column_config.DatetimeColumn("Uploaded", format="YYYY-MM-DD HH:mm")
+}
+
+
+def row_cursor(row: pd.Series) -> tuple:
+    """(insight_created_at, insight_id) keyset position of one insights row."""
+    return (row['INSIGHT_CREATED_AT'].isoformat(sep=' '), row['INSIGHT_ID'])
+
+
+def refresh_snapshot(filters: qb.DashboardFilters, rows: pd.DataFrame, head):
+    """Bring rows held from the top of the result set up to date, or None to reload.
+
+    Rows newer than ``head`` come from a delta query. For the range the rows
+    already cover, the current (insight_id, insight_version) pairs are read
+    and compared with the held ones: rows whose version changed, and rows
+    that newly match the filters, are re-read by id; rows that were deleted
+    or no longer match are dropped. Returns None when more than
+    DELTA_MERGE_LIMIT rows are new or changed.
+    """
+    delta = run_query(qb.insights_delta_query(filters, head, DELTA_MERGE_LIMIT), "insights_delta")
+    if len(delta) > DELTA_MERGE_LIMIT:
+        return None
+
+    versions = run_query(
+        qb.insights_versions_query(filters, head, row_cursor(rows.iloc[-1])), "insights_delta"
+    )
+    current = versions.set_index('INSIGHT_ID')['INSIGHT_VERSION']
+    held = rows.set_index('INSIGHT_ID')['INSIGHT_VERSION'].reindex(current.index)
+    stale = current.index[held.ne(current)]
+    if len(delta) + len(stale) > DELTA_MERGE_LIMIT:
+        return None
+
+    if delta.empty and stale.empty and len(current) == len(rows):
+        return rows
+
+    kept = rows[rows['INSIGHT_ID'].isin(current.index) & ~rows['INSIGHT_ID'].isin(stale)]
+    parts = [delta, kept]
+    if not stale.empty:
+        parts.append(run_query(qb.insights_rows_query(filters, stale), "insights_delta"))
+
+    # Re-uploaded documents keep their insight_id; the newer copy wins
+    return (
+        pd.concat(parts, ignore_index=True)
+        .drop_duplicates('INSIGHT_ID', keep='first')
+        .sort_values(['INSIGHT_CREATED_AT', 'INSIGHT_ID'], ascending=False, ignore_index=True)
+    )
+
+
+def load_insights(filters: qb.DashboardFilters, rows, offset: int, head, exhausted: bool,
+                  check_delta: bool, page_start: int, page_size: int) -> tuple:
+    """Bring a session's insights snapshot up to date; returns (rows, offset, head, exhausted).
+
+    ``rows`` is the window of the result set the session already holds
+    (newest first), starting ``offset`` rows below the newest matching row,
+    or None after a filter change. ``head`` is the (insight_created_at,
+    insight_id) of the newest row seen. Only keyset queries are issued:
+
+    - when ``check_delta`` says the cache was invalidated since the last
+      load (insights were added, changed or deleted), refresh_snapshot()
+      brings the held rows up to date; a window scrolled away from the
+      newest rows is reloaded instead, since changes above it shift it
+    - chunks above the window, only when paging back to rows it dropped
+    - chunks after the window's tail, only when paging past it
+
+    The window holds at most SNAPSHOT_ROW_LIMIT rows (plus the requested
+    page): paging deeper drops the earliest rows. All queries go through the
+    shared cache, so a rerun with nothing new costs no warehouse work. Runs
+    on the query pool; touches no session state.
+    """
+    if rows is not None and not rows.empty and check_delta:
+        rows = None if offset else refresh_snapshot(filters, rows, head)
+
+    if rows is not None and not rows.empty and page_start < offset:
+        if page_start == 0:
+            rows = None
+        else:
+            # Paging back into dropped rows: re-read just the rows above the window
+            wanted = offset - page_start
+            above = run_query(
+                qb.insights_preceding_query(filters, row_cursor(rows.iloc[0]), wanted),
+                "insights"
+            )
+            rows = pd.concat([above.iloc[::-1], rows], ignore_index=True)
+            offset = offset - len(above) if len(above) == wanted else 0
+            if len(rows) > SNAPSHOT_ROW_LIMIT:
+                rows, exhausted = rows.iloc[:SNAPSHOT_ROW_LIMIT], False
+
+    if rows is None or rows.empty:
+        # Full (re)load: first chunk of the newest rows
+        rows = run_query(qb.insights_page_query(filters, None, page_size), "insights")
+        offset = 0
+        exhausted = len(rows) <= page_size
+
+    while not exhausted and offset + len(rows) <= page_start + page_size:
+        chunk = run_query(
+            qb.insights_page_query(filters, row_cursor(rows.iloc[-1]), page_size),
+            "insights"
+        )
+        exhausted = len(chunk) <= page_size
+        rows = pd.concat([rows, chunk], ignore_index=True)
+
+        # Keep the window bounded, but never drop rows of the requested page
+        excess = min(len(rows) - SNAPSHOT_ROW_LIMIT, page_start - offset)
+        if excess > 0:
+            rows = rows.iloc[excess:].reset_index(drop=True)
+            offset += excess
+
+    if offset == 0 and not rows.empty:
+        head = row_cursor(rows.iloc[0])
+
+    return rows, offset, head, exhausted
+
+
+def discard_export(state_key: str) -> None:
+    """Forget a session's prepared export file and delete it."""
+    previous = st.session_state.pop(state_key, None)
+    if previous is not None and os.path.exists(previous[1].path):
+        os.remove(previous[1].path)
+
+
+def render_export(name: str, query: qb.Query) -> None:
+    """Export every row of ``query`` with raw types, not just the rows on screen.
+
+    "Prepare download" streams the results to a file in batches (bounded
+    memory); "Unload on warehouse" writes files to the export stage with
+    COPY INTO and links presigned URLs. The download button holds the whole
+    file in memory, so files over DOWNLOAD_MAX_BYTES are only offered
+    through the stage.
+    """
+    state_key = f"{name}_export"
+    format_col, file_col, stage_col = st.columns([2, 2, 2])
+    export_format = format_col.radio(
+        "Export format", EXPORT_FORMATS, horizontal=True, key=f"{name}_export_format"
+    )
 
-# Query monitoring view
-monitoring_sql = "SELECT * FROM SNOWFLAKE_EXAMPLE.SWIFTCLAW.V_PROCESSING_METRICS"
-monitoring_df = session.sql(monitoring_sql).to_pandas()
+    # A file prepared under other filters is stale: delete it
+    prepared = st.session_state.get(state_key)
+    if prepared is not None and prepared[0] != query:
+        discard_export(state_key)
+
+    if file_col.button("Prepare download", key=f"{name}_export_file"):
+        discard_export(state_key)
+        with st.spinner("Exporting..."):
+            try:
+                export = stream_to_file(session, query, export_format, name)
+            except Exception as exc:
+                file_col.error(f"Export failed: {exc}")
+            else:
+                st.session_state[state_key] = (query, export)
+
+    prepared = st.session_state.get(state_key)
+    if prepared is not None and os.path.exists(prepared[1].path):
+        export = prepared[1]
+        if export.size > DOWNLOAD_MAX_BYTES:
+            file_col.warning(
+                f"{export.rows:,} rows ({export.size / 1e6:,.0f} MB) is too large to download "
+                "through the app; use Unload on warehouse"
+            )
+            discard_export(state_key)
+        else:
+            with open(export.path, "rb") as handle:
+                file_col.download_button(
+                    label=f"Download {export.rows:,} rows",
+                    data=handle,
+                    file_name=export.file_name,
+                    mime=export.mime,
+                    key=f"{name}_export_download"
+                )
+
+    # The local stand-in has no stages, so the unload is warehouse-only
+    if stage_col.button("Unload on warehouse", key=f"{name}_export_stage", disabled=is_local_session(),
+                        help="For very large exports: files are written on the warehouse and downloaded directly from the stage"):
+        with st.spinner("Unloading..."):
+            try:
+                unloaded = unload_to_stage(session, query, export_format, name)
+            except Exception as exc:
+                stage_col.error(f"Unload failed: {exc}")
+                unloaded = []
+        for file in unloaded:
+            stage_col.markdown(f"[{file.name.rsplit('/', 1)[-1]}]({file.url}) ({file.size / 1e6:,.1f} MB)")
+
+
+def go_to_page(delta: int) -> None:
+    st.session_state["insights_page"] += delta
+
+
+def render_pipeline_health(monitoring_df: pd.DataFrame) -> None:
+    if monitoring_df.empty:
+        return
 
-if not monitoring_df.empty:
     row = monitoring_df.iloc[0]
 
     # KPI Columns
@@ -137,113 +534,69 @@ if not monitoring_df.empty:
             delta="USD"
         )
 
-st.markdown("---")
 
-# ============================================================================
-# SECTION 2: DOCUMENT INSIGHTS TABLE
-# ============================================================================
+def render_insights(snapshot_update: tuple) -> None:
+    rows, offset, head, exhausted = snapshot_update
+    insights_snapshot["rows"] = rows
+    insights_snapshot["offset"] = offset
+    insights_snapshot["head"] = head
+    insights_snapshot["exhausted"] = exhausted
+    insights_snapshot["generation"] = insights_generation
 
-st.header("Document Insights")
+    window_start = page_start - offset
+    insights_df = rows.iloc[window_start:window_start + page_size]
+    has_next_page = offset + len(rows) > page_start + page_size
 
-# Build dynamic SQL query based on filters
-base_query = """
-SELECT
-    insight_id,
-    document_id,
-    document_type,
-    total_amount,
-    currency,
-    document_date,
-    vendor_territory,
-    overall_confidence_score AS confidence_score,
-    requires_manual_review,
-    metadata:priority_level::STRING AS priority_level,
-    metadata:business_category::STRING AS business_category,
-    insight_created_at
-FROM SNOWFLAKE_EXAMPLE.SWIFTCLAW.FCT_DOCUMENT_INSIGHTS
-WHERE 1=1
-"""
+    # Prefetch the chunk the next page will need so "Next" is a cache hit
+    if not exhausted and offset + len(rows) < page_start + 2 * page_size + 1:
+        prefetch_query(
+            qb.insights_page_query(filters, row_cursor(rows.iloc[-1]), page_size),
+            "insights_prefetch"
+        )
 
-# Apply filters
-if doc_types:
-    doc_type_list = ", ".join([f"'{dt}'" for dt in doc_types])
-    base_query += f" AND document_type IN ({doc_type_list})"
-
-if priority_levels:
-    priority_list = ", ".join([f"'{pl}'" for pl in priority_levels])
-    base_query += f" AND metadata:priority_level::STRING IN ({priority_list})"
-
-if show_review_only:
-    base_query += " AND requires_manual_review = TRUE"
-
-base_query += " ORDER BY insight_created_at DESC LIMIT 1000"
-
-# Execute query
-insights_df = session.sql(base_query).to_pandas()
-
-if not insights_df.empty:
-    insights_df['DOCUMENT_TYPE'] = insights_df['DOCUMENT_TYPE'].str.replace('_', ' ').str.title()
-    insights_df['PRIORITY_LEVEL'] = insights_df['PRIORITY_LEVEL'].str.title()
-
-    # Display count
-    st.write(f"**Showing {len(insights_df):,} documents** (max 1,000)")
-
-    # Format dataframe for display
-    display_df = insights_df[[
-        'DOCUMENT_TYPE',
-        'VENDOR_TERRITORY',
-        'TOTAL_AMOUNT',
-        'DOCUMENT_DATE',
-        'PRIORITY_LEVEL',
-        'CONFIDENCE_SCORE',
-        'REQUIRES_MANUAL_REVIEW'
-    ]].copy()
-
-    display_df.columns = [
-        'Type',
-        'Vendor/Territory',
-        'Amount',
-        'Date',
-        'Priority',
-        'Confidence',
-        'Needs Review'
-    ]
-
-    # Format columns
-    display_df['Amount'] = display_df['Amount'].apply(lambda x: f"${x:,.2f}" if pd.notna(x) else "N/A")
-    display_df['Confidence'] = display_df['Confidence'].apply(lambda x: f"{x:.2%}" if pd.notna(x) else "N/A")
-    display_df['Needs Review'] = display_df['Needs Review'].apply(lambda x: "Yes" if x else "No")
-
-    # Display as interactive table
+    if insights_df.empty:
+        st.info("No documents match the selected filters.")
+        return
+
+    first_row = page_start + 1
+    st.write(f"**Page {page_index + 1}** · documents {first_row:,}–{first_row + len(insights_df) - 1:,}")
+
+    # Display as interactive table (formatting via column config, no copies)
     st.dataframe(
-        display_df,
+        insights_df,
+        column_order=INSIGHT_COLUMN_ORDER,
+        column_config=INSIGHT_COLUMN_CONFIG,
+        hide_index=True,
         use_container_width=True,
         height=400
     )
-else:
-    st.info("No documents match the selected filters.")
 
-st.markdown("---")
+    nav_prev, nav_next, _ = st.columns([1, 1, 6])
+    nav_prev.button("Previous", on_click=go_to_page, args=(-1,), disabled=page_index == 0)
+    nav_next.button("Next", on_click=go_to_page, args=(1,), disabled=not has_next_page)
 
-# ============================================================================
-# SECTION 3: ANALYTICS & CHARTS
-# ============================================================================
+    render_export("document_insights", qb.insights_export_query(filters))
 
-st.header("Analytics")
 
-if not insights_df.empty:
+def render_analytics(value_by_type: pd.DataFrame, priority_counts: pd.DataFrame,
+                     confidence_bins: pd.DataFrame) -> None:
+    if priority_counts.empty:
+        st.info("No documents match the selected filters.")
+        return
+
     # Create two columns for charts
     chart_col1, chart_col2 = st.columns(2)
 
     with chart_col1:
         st.subheader("Value by Document Type")
 
-        # Aggregate by document type
-        value_by_type = insights_df.groupby('DOCUMENT_TYPE')['TOTAL_AMOUNT'].sum().reset_index()
-        value_by_type.columns = ['Document Type', 'Total Value']
+        value_chart_df = pd.DataFrame({
+            'Document Type': value_by_type['DOCUMENT_TYPE'].str.replace('_', ' ').str.title(),
+            'Total Value': value_by_type['TOTAL_VALUE'].astype(float)
+        })
 
         # Create bar chart
-        chart1 = alt.Chart(value_by_type).mark_bar().encode(
+        chart1 = alt.Chart(value_chart_df).mark_bar().encode(
             x=alt.X('Document Type:N', title='Document Type'),
             y=alt.Y('Total Value:Q', title='Total Value (USD)'),
             color='Document Type:N',
@@ -255,12 +608,13 @@ if not insights_df.empty:
     with chart_col2:
         st.subheader("Documents by Priority")
 
-        # Count by priority
-        priority_counts = insights_df.groupby('PRIORITY_LEVEL').size().reset_index()
-        priority_counts.columns = ['Priority', 'Count']
+        priority_chart_df = pd.DataFrame({
+            'Priority': priority_counts['PRIORITY_LEVEL'].str.title(),
+            'Count': priority_counts['DOCUMENT_COUNT']
+        })
 
         # Create pie chart
-        chart2 = alt.Chart(priority_counts).mark_arc().encode(
+        chart2 = alt.Chart(priority_chart_df).mark_arc().encode(
             theta='Count:Q',
             color=alt.Color('Priority:N', scale=alt.Scale(domain=['High', 'Medium', 'Low'], range=['#FF6B6B', '#FFA500', '#4ECDC4'])),
             tooltip=['Priority:N', 'Count:Q']
@@ -268,17 +622,102 @@ if not insights_df.empty:
 
         st.altair_chart(chart2, use_container_width=True)
 
-    # Third chart: Confidence Distribution
+    # Third chart: Confidence Distribution (pre-binned in the warehouse)
     st.subheader("Confidence Score Distribution")
 
-    chart3 = alt.Chart(insights_df).mark_bar().encode(
-        x=alt.X('CONFIDENCE_SCORE:Q', bin=alt.Bin(step=0.05), title='Confidence Score'),
-        y=alt.Y('count():Q', title='Number of Documents'),
-        tooltip=['count():Q']
+    chart3 = alt.Chart(confidence_bins).mark_bar().encode(
+        x=alt.X('BIN_START:Q', title='Confidence Score', scale=alt.Scale(domain=[0, 1])),
+        x2='BIN_END:Q',
+        y=alt.Y('DOCUMENT_COUNT:Q', title='Number of Documents'),
+        tooltip=[
+            alt.Tooltip('BIN_START:Q', title='From', format='.2f'),
+            alt.Tooltip('BIN_END:Q', title='To', format='.2f'),
+            alt.Tooltip('DOCUMENT_COUNT:Q', title='Documents')
+        ]
     ).properties(height=250)
 
     st.altair_chart(chart3, use_container_width=True)
 
+
+def render_review_queue(review_df: pd.DataFrame) -> None:
+    if review_df.empty:
+        st.success("No documents currently require manual review.")
+        return
+
+    if len(review_df) < REVIEW_QUEUE_LIMIT:
+        st.write(f"**{len(review_df)} documents require manual review**, sorted by {qb.REVIEW_QUEUE_ORDER}")
+    else:
+        st.write(f"**Showing the top {REVIEW_QUEUE_LIMIT} documents awaiting manual review** "
+                 f"by {qb.REVIEW_QUEUE_ORDER}; export the queue for the rest")
+
+    st.dataframe(
+        review_df,
+        column_order=REVIEW_COLUMN_ORDER,
+        column_config=REVIEW_COLUMN_CONFIG,
+        hide_index=True,
+        use_container_width=True,
+        height=300
+    )
+
+    # Export the full queue for offline review or import into external systems
+    render_export("review_queue", qb.review_queue_query(filters, limit=None))
+
+
+# ============================================================================
+# SECTION 1: PIPELINE HEALTH (Top KPIs)
+# ============================================================================
+
+st.header("Pipeline Health")
+health_slot = st.empty()
+
+st.markdown("---")
+
+# ============================================================================
+# SECTION 2: DOCUMENT INSIGHTS TABLE
+# ============================================================================
+
+st.header("Document Insights")
+
+page_size = st.selectbox("Rows per page", PAGE_SIZE_OPTIONS, index=0)
+
+# The session keeps a bounded window of the insights rows it has already
+# loaded (newest first). When insights are added, changed or deleted, reruns
+# fetch rows above its high-water mark plus the rows whose version changed and
+# merge them in; a filter change discards the snapshot and reloads. Page-size
+# changes keep the rows and return to the first page.
+insights_snapshot = st.session_state.get("insights_snapshot")
+if insights_snapshot is None or insights_snapshot["filters"] != filters:
+    insights_snapshot = {
+        "filters": filters, "rows": None, "offset": 0, "head": None,
+        "exhausted": False, "generation": None
+    }
+    st.session_state["insights_snapshot"] = insights_snapshot
+    st.session_state["insights_page"] = 0
+
+if st.session_state.get("insights_page_size") != page_size:
+    st.session_state["insights_page_size"] = page_size
+    st.session_state["insights_page"] = 0
+
+page_index = st.session_state["insights_page"]
+page_start = page_index * page_size
+
+# The cache generation moves when new insights are observed or Refresh Data
+# is pressed; until then the snapshot cannot be stale and no delta is needed.
+insights_generation = query_cache.generation
+
+insights_slot = st.empty()
+
+st.markdown("---")
+
+# ============================================================================
+# SECTION 3: ANALYTICS & CHARTS
+# ============================================================================
+# Aggregates run in the warehouse over every matching document, so result
+# size depends on the number of groups, not the number of documents.
+
+st.header("Analytics")
+analytics_slot = st.empty()
+
 st.markdown("---")
 
 # ============================================================================
@@ -311,60 +750,112 @@ To build a production review workflow, consider these next steps:
 - Leverage row access policies to assign documents to specific reviewers
 """)
 
-review_query = """
-SELECT
-    document_id,
-    document_type,
-    total_amount,
-    vendor_territory,
-    overall_confidence_score AS confidence_score,
-    metadata:priority_level::STRING AS priority_level,
-    insight_created_at
-FROM SNOWFLAKE_EXAMPLE.SWIFTCLAW.FCT_DOCUMENT_INSIGHTS
-WHERE requires_manual_review = TRUE
-ORDER BY
-    CASE metadata:priority_level::STRING
-        WHEN 'HIGH' THEN 1
-        WHEN 'MEDIUM' THEN 2
-        ELSE 3
-    END,
-    overall_confidence_score ASC
-LIMIT 50
-"""
+review_slot = st.empty()
 
-review_df = session.sql(review_query).to_pandas()
-
-if not review_df.empty:
-    st.write(f"**{len(review_df)} documents require manual review** (showing top 50 by priority)")
-
-    # Format for display
-    review_display = review_df[[
-        'DOCUMENT_TYPE',
-        'VENDOR_TERRITORY',
-        'TOTAL_AMOUNT',
-        'PRIORITY_LEVEL',
-        'CONFIDENCE_SCORE',
-        'INSIGHT_CREATED_AT'
-    ]].copy()
-
-    review_display.columns = ['Type', 'Vendor/Territory', 'Amount', 'Priority', 'Confidence', 'Created']
-    review_display['Amount'] = review_display['Amount'].apply(lambda x: f"${x:,.2f}" if pd.notna(x) else "N/A")
-    review_display['Confidence'] = review_display['Confidence'].apply(lambda x: f"{x:.2%}" if pd.notna(x) else "N/A")
-    review_display['Type'] = review_display['Type'].str.replace('_', ' ').str.title()
-    review_display['Priority'] = review_display['Priority'].str.title()
-
-    st.dataframe(review_display, use_container_width=True, height=300)
-
-    # Export option
-    st.download_button(
-        label="Export Review Queue to CSV",
-        data=review_display.to_csv(index=False).encode('utf-8'),
-        file_name=f"review_queue_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv",
-        mime="text/csv",
-        help="Download this queue for offline review or import into external systems"
+# ============================================================================
+# CONCURRENT QUERY EXECUTION
+# ============================================================================
+# Submit every section's queries at once, then render each section as soon
+# as all of its own results are in. Cached results complete immediately.
+
+monitoring_query = qb.metrics_query()
+run_started = time.perf_counter()
+
+sections = {
+    "health": (
+        health_slot,
+        render_pipeline_health,
+        [submit_query(monitoring_query, "health", ttl_seconds=WATERMARK_PROBE_SECONDS)]
+    ),
+    "insights": (
+        insights_slot,
+        render_insights,
+        [query_executor.submit(
+            load_insights,
+            filters,
+            insights_snapshot["rows"],
+            insights_snapshot["offset"],
+            insights_snapshot["head"],
+            insights_snapshot["exhausted"],
+            insights_snapshot["generation"] != insights_generation,
+            page_start,
+            page_size
+        )]
+    ),
+    "analytics": (
+        analytics_slot,
+        render_analytics,
+        [
+            submit_query(qb.value_by_type_query(filters), "analytics"),
+            submit_query(qb.priority_counts_query(filters), "analytics"),
+            submit_query(qb.confidence_bins_query(filters), "analytics")
+        ]
+    ),
+    "review": (
+        review_slot,
+        render_review_queue,
+        [submit_query(qb.review_queue_query(filters, limit=REVIEW_QUEUE_LIMIT), "review")]
+    ),
+}
+
+for slot, _, _ in sections.values():
+    slot.caption("Loading...")
+
+section_render_ms = {}
+pending = dict(sections)
+while pending:
+    wait(
+        [future for _, _, futures in pending.values() for future in futures],
+        return_when=FIRST_COMPLETED
     )
-else:
-    st.success("No documents currently require manual review.")
+    for name, (slot, render, futures) in list(pending.items()):
+        if not all(future.done() for future in futures):
+            continue
+        del pending[name]
+        with slot.container():
+            try:
+                results = [future.result() for future in futures]
+            except Exception as exc:
+                st.error(f"Could not load this section: {exc}")
+                continue
+            render(*results)
+        section_render_ms[name] = round((time.perf_counter() - run_started) * 1000, 1)
+
+        # Insights were added, changed or deleted since the cached results
+        # were loaded: the checksum moves on in-place updates and deletions,
+        # which leave the latest insight time unchanged
+        if name == "health" and not results[0].empty:
+            watermark = tuple(
+                None if pd.isna(value) else value
+                for value in results[0].iloc[0][['LAST_INSIGHT_TIMESTAMP', 'INSIGHTS_CHECKSUM']]
+            )
+            query_cache.observe_watermark(watermark, keep=monitoring_query)
+
+# ============================================================================
+# QUERY DIAGNOSTICS
+# ============================================================================
+# Background prefetches may still be running and appear on the next render.
+
+if show_diagnostics:
+    with st.sidebar.expander("Query Diagnostics", expanded=True):
+        st.caption("Section ready (ms since queries were submitted)")
+        st.dataframe(
+            pd.DataFrame(list(section_render_ms.items()), columns=['Section', 'Ready (ms)']),
+            hide_index=True,
+            use_container_width=True
+        )
+        st.caption(f"Queries · run `{RUN_ID[:8]}` · tag `{query_tag('<section>')}`")
+        st.dataframe(
+            pd.DataFrame(query_log.for_run(RUN_ID), columns=QueryRecord._fields),
+            column_order=['section', 'cache', 'wall_ms', 'rows', 'bytes', 'query_id', 'sql'],
+            column_config={
+                'wall_ms': st.column_config.NumberColumn("Wall (ms)", format="%.1f"),
+                'bytes': st.column_config.NumberColumn("Bytes", format="%d"),
+                'query_id': st.column_config.TextColumn("Query ID"),
+            },
+            hide_index=True,
+            use_container_width=True
+        )
 
 # ============================================================================
 # FOOTER
@@ -376,6 +867,6 @@ st.markdown("""
 This dashboard demonstrates production-grade patterns for AI document processing. Review and customize for your organization's specific requirements before deployment.
 
 **Data Source:** `SNOWFLAKE_EXAMPLE.SWIFTCLAW`
-**Refresh:** Data updates automatically when underlying tables are refreshed
+**Refresh:** Cached results reload automatically when the pipeline publishes new or updated insights; use **Refresh Data** to force a reload
 **Demo Expires:** 2026-02-20
 """)
@@ -0,0 +1,77 @@
+"""Tests for streamlit/data_export.py stream_to_file()."""
+
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit"))
+
+import data_export  # noqa: E402
+from data_export import stream_to_file  # noqa: E402
+from local_session import DateType, DoubleType, StringType, StructField, StructType  # noqa: E402
+from query_builder import Query  # noqa: E402
+
+SCHEMA = StructType([
+    StructField("VENDOR_TERRITORY", StringType()),
+    StructField("TOTAL_AMOUNT", DoubleType()),
+    StructField("DOCUMENT_DATE", DateType()),
+])
+
+
+class FakeDataFrame:
+    def __init__(self, batches):
+        self.schema = SCHEMA
+        self._batches = batches
+
+    def to_pandas_batches(self):
+        return iter(self._batches)
+
+
+class FakeSession:
+    def __init__(self, batches):
+        self._batches = batches
+
+    def sql(self, sql, params=None):
+        return FakeDataFrame(self._batches)
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_export, "EXPORT_DIR", str(tmp_path))
+
+
+def test_parquet_keeps_types_when_first_batch_is_all_null():
+    batches = [
+        pd.DataFrame({"VENDOR_TERRITORY": [None, None], "TOTAL_AMOUNT": [None, None],
+                      "DOCUMENT_DATE": [None, None]}),
+        pd.DataFrame({"VENDOR_TERRITORY": ["Japan"], "TOTAL_AMOUNT": [12.5],
+                      "DOCUMENT_DATE": [pd.Timestamp("2026-01-31").date()]}),
+    ]
+    export = stream_to_file(FakeSession(batches), Query("SELECT 1"), "Parquet", "insights")
+
+    table = pq.read_table(export.path)
+    assert export.rows == 3
+    assert table.schema.field("VENDOR_TERRITORY").type == pa.string()
+    assert table.schema.field("TOTAL_AMOUNT").type == pa.float64()
+    assert table.schema.field("DOCUMENT_DATE").type == pa.date32()
+    assert table.column("TOTAL_AMOUNT").to_pylist() == [None, None, 12.5]
+
+
+def test_empty_parquet_result_is_readable():
+    export = stream_to_file(FakeSession([]), Query("SELECT 1"), "Parquet", "insights")
+
+    table = pq.read_table(export.path)
+    assert export.rows == 0
+    assert table.num_rows == 0
+    assert table.schema.names == ["VENDOR_TERRITORY", "TOTAL_AMOUNT", "DOCUMENT_DATE"]
+
+
+def test_empty_csv_result_has_header():
+    export = stream_to_file(FakeSession([]), Query("SELECT 1"), "CSV", "insights")
+
+    with open(export.path, encoding="utf-8") as handle:
+        assert handle.read() == "VENDOR_TERRITORY,TOTAL_AMOUNT,DOCUMENT_DATE\n"
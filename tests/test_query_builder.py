@@ -0,0 +1,217 @@
+"""Tests for streamlit/query_builder.py, run against the local SQLite stand-in."""
+
+import os
+import sqlite3
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit"))
+
+import query_builder as qb  # noqa: E402
+from local_session import LocalSession, build_store  # noqa: E402
+
+ROWS = 500
+ALL = qb.DashboardFilters()
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("store") / "insights.db")
+    build_store(path, ROWS, seed=7)
+    return path
+
+
+@pytest.fixture
+def session(store):
+    return LocalSession(store)
+
+
+@pytest.fixture
+def writable_store(tmp_path):
+    path = str(tmp_path / "insights.db")
+    build_store(path, ROWS, seed=7)
+    return path
+
+
+def run(session, query: qb.Query):
+    return session.sql(query.sql, params=list(query.params)).to_pandas()
+
+
+def cursor_of(row) -> tuple:
+    return (row["INSIGHT_CREATED_AT"].isoformat(sep=" "), row["INSIGHT_ID"])
+
+
+def all_pages(session, filters, page_size):
+    """Insight ids of every page walked by keyset cursor, in page order."""
+    ids, cursor = [], None
+    while True:
+        page = run(session, qb.insights_page_query(filters, cursor, page_size))
+        ids += page["INSIGHT_ID"].iloc[:page_size].tolist()
+        if len(page) <= page_size:
+            return ids
+        cursor = cursor_of(page.iloc[page_size - 1])
+
+
+FILTERED = qb.DashboardFilters.from_widgets(
+    ["ROYALTY_STATEMENT", "INVOICE"], ["MEDIUM", "HIGH"],
+    date_from=date(2024, 1, 1), date_to=date(2025, 12, 31),
+)
+
+
+def test_date_predicates_compare_the_bare_column_to_bound_dates():
+    start, end = date(2024, 1, 1), date(2024, 3, 31)
+
+    assert qb.date_predicates(qb.DashboardFilters()) == qb.Query("", ())
+    assert qb.date_predicates(qb.DashboardFilters(date_from=start)) == \
+        qb.Query(" AND document_date >= ?", (start,))
+    assert qb.date_predicates(qb.DashboardFilters(date_to=end)) == \
+        qb.Query(" AND document_date <= ?", (end,))
+    assert qb.date_predicates(qb.DashboardFilters(date_from=start, date_to=end)) == \
+        qb.Query(" AND document_date >= ? AND document_date <= ?", (start, end))
+
+
+def test_filter_predicates_bind_values_in_placeholder_order():
+    filters = qb.DashboardFilters.from_widgets(
+        ["ROYALTY_STATEMENT", "INVOICE"], ["HIGH"], review_only=True,
+        date_from=date(2024, 1, 1), date_to=date(2024, 6, 30),
+    )
+    predicates = qb.filter_predicates(filters)
+
+    assert predicates.sql == (
+        " AND ARRAY_CONTAINS(document_type::VARIANT, PARSE_JSON(?))"
+        " AND ARRAY_CONTAINS(metadata:priority_level, PARSE_JSON(?))"
+        " AND requires_manual_review = ?"
+        " AND document_date >= ? AND document_date <= ?"
+    )
+    assert predicates.params == (
+        '["INVOICE", "ROYALTY_STATEMENT"]', '["HIGH"]', True, date(2024, 1, 1), date(2024, 6, 30)
+    )
+
+
+def test_filter_sql_depends_only_on_which_filters_are_active():
+    one = qb.filter_predicates(qb.DashboardFilters.from_widgets(["INVOICE"], [], date_from=date(2024, 1, 1)))
+    other = qb.filter_predicates(qb.DashboardFilters.from_widgets(["CONTRACT", "OTHER"], [], date_from=date(2025, 5, 1)))
+
+    assert one.sql == other.sql
+    assert one.params != other.params
+
+
+def test_cursor_queries_bind_filters_and_cursor_in_placeholder_order():
+    cursor = ("2024-05-01 12:00:00", "INS_DOC_000000100")
+    predicates = qb.filter_predicates(FILTERED)
+
+    for query, expected in [
+        (qb.insights_page_query(FILTERED, None, 50), predicates.params),
+        (qb.insights_page_query(FILTERED, cursor, 50), predicates.params + (cursor[0], cursor[0], cursor[1])),
+        (qb.insights_delta_query(FILTERED, cursor, 50), (cursor[0], cursor[0], cursor[1]) + predicates.params),
+        (qb.insights_preceding_query(FILTERED, cursor, 50), (cursor[0], cursor[0], cursor[1]) + predicates.params),
+    ]:
+        assert query.params == expected
+        assert query.sql.count("?") == len(expected)
+
+
+@pytest.mark.parametrize("filters", [ALL, FILTERED], ids=["unfiltered", "filtered"])
+def test_keyset_pages_cover_the_filtered_set_once_in_order(session, filters):
+    expected = run(session, qb.insights_export_query(filters))["INSIGHT_ID"].tolist()
+
+    assert expected
+    assert all_pages(session, filters, 37) == expected
+
+
+def test_keyset_pages_break_timestamp_ties_by_id(writable_store):
+    connection = sqlite3.connect(writable_store)
+    connection.execute(
+        "UPDATE FCT_DOCUMENT_INSIGHTS SET insight_created_at = '2024-06-01 09:00:00' "
+        "WHERE insight_id IN (SELECT insight_id FROM FCT_DOCUMENT_INSIGHTS ORDER BY insight_id LIMIT 25)"
+    )
+    connection.commit()
+    connection.close()
+    session = LocalSession(writable_store)
+
+    expected = run(session, qb.insights_export_query(ALL))["INSIGHT_ID"].tolist()
+    assert all_pages(session, ALL, 10) == expected
+
+
+def test_filtered_results_match_the_filters(session):
+    rows = run(session, qb.insights_export_query(FILTERED))
+
+    assert set(rows["DOCUMENT_TYPE"]) <= {"INVOICE", "ROYALTY_STATEMENT"}
+    assert set(rows["PRIORITY_LEVEL"]) <= {"MEDIUM", "HIGH"}
+    assert rows["DOCUMENT_DATE"].between(date(2024, 1, 1), date(2025, 12, 31)).all()
+
+
+def test_delta_and_preceding_queries_read_above_the_cursor(session):
+    rows = run(session, qb.insights_export_query(FILTERED))
+    mark = cursor_of(rows.iloc[10])
+
+    delta = run(session, qb.insights_delta_query(FILTERED, mark, 50))
+    assert delta["INSIGHT_ID"].tolist() == rows["INSIGHT_ID"].iloc[:10].tolist()
+
+    preceding = run(session, qb.insights_preceding_query(FILTERED, mark, 3))
+    assert preceding["INSIGHT_ID"].tolist() == rows["INSIGHT_ID"].iloc[7:10].tolist()[::-1]
+
+    # limit + 1 rows tell the caller the delta is too large to merge
+    assert len(run(session, qb.insights_delta_query(FILTERED, mark, 4))) == 5
+
+
+def test_versions_query_covers_the_range_inclusively(session):
+    rows = run(session, qb.insights_page_query(ALL, None, 50)).iloc[:50]
+
+    versions = run(session, qb.insights_versions_query(ALL, cursor_of(rows.iloc[0]), cursor_of(rows.iloc[-1])))
+
+    assert sorted(versions["INSIGHT_ID"]) == sorted(rows["INSIGHT_ID"])
+    assert dict(zip(versions["INSIGHT_ID"], versions["INSIGHT_VERSION"])) == \
+        dict(zip(rows["INSIGHT_ID"], rows["INSIGHT_VERSION"]))
+
+
+def test_versions_query_shows_changed_and_deleted_rows(writable_store):
+    session = LocalSession(writable_store)
+    rows = run(session, qb.insights_page_query(ALL, None, 20)).iloc[:20]
+    changed, deleted = rows.iloc[3]["INSIGHT_ID"], rows.iloc[5]["INSIGHT_ID"]
+
+    connection = sqlite3.connect(writable_store)
+    connection.execute(
+        "UPDATE FCT_DOCUMENT_INSIGHTS SET total_amount = 1, insight_version = 7 WHERE insight_id = ?",
+        (changed,)
+    )
+    connection.execute("DELETE FROM FCT_DOCUMENT_INSIGHTS WHERE insight_id = ?", (deleted,))
+    connection.commit()
+    connection.close()
+
+    versions = run(session, qb.insights_versions_query(ALL, cursor_of(rows.iloc[0]), cursor_of(rows.iloc[-1])))
+    current = dict(zip(versions["INSIGHT_ID"], versions["INSIGHT_VERSION"]))
+    assert deleted not in current
+    assert current[changed] == 7
+
+    refreshed = run(session, qb.insights_rows_query(ALL, [changed]))
+    assert refreshed["INSIGHT_ID"].tolist() == [changed]
+    assert refreshed["TOTAL_AMOUNT"].tolist() == [1]
+
+
+def test_metrics_checksum_moves_on_update_and_delete(writable_store):
+    session = LocalSession(writable_store)
+    before = run(session, qb.metrics_query()).iloc[0]
+
+    connection = sqlite3.connect(writable_store)
+    connection.execute(
+        "UPDATE FCT_DOCUMENT_INSIGHTS SET insight_version = insight_version + 1 WHERE insight_id = 'INS_DOC_000000010'"
+    )
+    connection.commit()
+    updated = run(session, qb.metrics_query()).iloc[0]
+    connection.execute("DELETE FROM FCT_DOCUMENT_INSIGHTS WHERE insight_id = 'INS_DOC_000000020'")
+    connection.commit()
+    connection.close()
+    deleted = run(session, qb.metrics_query()).iloc[0]
+
+    assert updated["LAST_INSIGHT_TIMESTAMP"] == before["LAST_INSIGHT_TIMESTAMP"]
+    assert len({before["INSIGHTS_CHECKSUM"], updated["INSIGHTS_CHECKSUM"], deleted["INSIGHTS_CHECKSUM"]}) == 3
+
+
+def test_rows_query_text_does_not_depend_on_id_count():
+    one = qb.insights_rows_query(ALL, ["INS_B"])
+    two = qb.insights_rows_query(ALL, ["INS_B", "INS_A"])
+
+    assert one.sql == two.sql
+    assert two.params == ('["INS_A", "INS_B"]',)
@@ -0,0 +1,123 @@
+"""Tests for streamlit/query_cache.py QueryCache."""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "streamlit"))
+
+from query_cache import QueryCache  # noqa: E402
+
+
+def test_concurrent_misses_share_one_load():
+    cache = QueryCache()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("SELECT 1", (), loader)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    while cache.hits + cache.misses < 5:
+        pass
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == [1]
+    assert results == ["result"] * 5
+    assert cache.misses == 1
+
+
+def test_failed_load_reaches_waiters_and_is_not_stored():
+    cache = QueryCache()
+
+    def failing():
+        raise RuntimeError("warehouse suspended")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_load("SELECT 1", (), failing)
+    assert len(cache) == 0
+    assert cache.get_or_load("SELECT 1", (), lambda: "ok") == "ok"
+
+
+def test_keys_ignore_whitespace_but_not_params():
+    cache = QueryCache()
+    cache.get_or_load("SELECT  *\nFROM t WHERE a = ?", ("x",), lambda: 1)
+
+    assert cache.get_or_load("SELECT * FROM t WHERE a = ?", ("x",), lambda: 2) == 1
+    assert cache.get_or_load("SELECT * FROM t WHERE a = ?", ("y",), lambda: 3) == 3
+
+
+def test_moved_watermark_invalidates_all_but_the_probe():
+    cache = QueryCache()
+    probe = ("SELECT watermark", ())
+    cache.get_or_load(*probe, lambda: "probe")
+    cache.get_or_load("SELECT page", (), lambda: "old")
+
+    assert cache.observe_watermark("t1", keep=probe) is False
+    assert cache.get_or_load("SELECT page", (), lambda: "new") == "old"
+
+    generation = cache.generation
+    assert cache.observe_watermark("t2", keep=probe) is True
+    assert cache.generation == generation + 1
+    assert cache.get_or_load(*probe, lambda: "reloaded") == "probe"
+    assert cache.get_or_load("SELECT page", (), lambda: "new") == "new"
+
+
+def test_load_across_invalidation_is_not_stored():
+    cache = QueryCache()
+
+    def loader():
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get_or_load("SELECT 1", (), loader) == "stale"
+    assert len(cache) == 0
+
+
+def test_entry_cap_evicts_least_recently_used():
+    cache = QueryCache(max_entries=2)
+    cache.get_or_load("SELECT a", (), lambda: "a")
+    cache.get_or_load("SELECT b", (), lambda: "b")
+    cache.get_or_load("SELECT a", (), lambda: "unused")
+    cache.get_or_load("SELECT c", (), lambda: "c")
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get_or_load("SELECT a", (), lambda: "reloaded") == "a"
+    assert cache.get_or_load("SELECT b", (), lambda: "reloaded") == "reloaded"
+
+
+def test_byte_cap_evicts_and_skips_oversized_results():
+    cache = QueryCache(max_bytes=10, sizeof=len)
+    cache.get_or_load("SELECT a", (), lambda: "aaaa")
+    cache.get_or_load("SELECT b", (), lambda: "bbbb")
+    cache.get_or_load("SELECT c", (), lambda: "cccc")
+
+    assert len(cache) == 2
+    assert cache.bytes == 8
+    assert cache.get_or_load("SELECT a", (), lambda: "reloaded") == "reloaded"
+
+    assert cache.get_or_load("SELECT big", (), lambda: "x" * 11) == "x" * 11
+    assert cache.get_or_load("SELECT big", (), lambda: "again") == "again"
+    assert cache.bytes <= 10
+
+
+def test_invalidate_resets_bytes():
+    cache = QueryCache(max_bytes=100, sizeof=len)
+    cache.get_or_load("SELECT a", (), lambda: "aaaa")
+    cache.invalidate()
+
+    assert cache.bytes == 0
+    assert len(cache) == 0